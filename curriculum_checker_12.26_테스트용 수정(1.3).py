@@ -14,10 +14,17 @@ import os
 import re
 import difflib
 import webbrowser
+import threading
+import queue
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 from tkinter.scrolledtext import ScrolledText
 from io import BytesIO
+from collections import Counter
+from functools import lru_cache
+from itertools import groupby
+from array import array
+from concurrent.futures import ThreadPoolExecutor
 
 
 from openpyxl import load_workbook
@@ -37,6 +44,12 @@ except ImportError:
 
 EPS = 1e-9
 
+# 최신 양식 확인 안내에서 세는 심각도 (ERROR + WARNING)
+MAJOR_SEVERITIES = frozenset(("ERROR", "WARNING"))
+
+# 열 번호 -> 열 문자 (COL_NAMES[col - 1]; A~Z)
+COL_NAMES = tuple(chr(64 + i) for i in range(1, 27))
+
 # 구글 스프레드시트 URL
 GOOGLE_SHEET_ID = "1BaTm1J34hep9QV8fswwPfcfCZX-geGtanLwX9BkhCyU"
 
@@ -100,6 +113,15 @@ def is_error_token(value) -> bool:
     return s in ("#N/A", "#VALUE!", "#REF!", "#DIV/0!", "#NAME?", "#NULL!", "#NUM!")
 
 
+@lru_cache(maxsize=4096)
+def _parse_number_text(s):
+    """문자열 숫자 변환 결과 캐시 (같은 문자열은 예외 처리 경로를 다시 타지 않도록)"""
+    try:
+        return float(s)
+    except Exception:
+        return None
+
+
 def to_number(value):
     """숫자 변환(정수/실수). 실패 시 None."""
     if value is None:
@@ -111,10 +133,7 @@ def to_number(value):
     s = str(value).strip()
     if s == "":
         return None
-    try:
-        return float(s)
-    except Exception:
-        return None
+    return _parse_number_text(s)
 
 
 def find_sheet_for_year(sheetnames, year: int):
@@ -190,6 +209,30 @@ def build_merged_lookup(ws):
     return lookup
 
 
+def get_merged_lookup(ws, merge_cache=None):
+    """
+    build_merged_lookup 결과를 시트 이름별로 재사용
+    - merge_cache가 없으면 매번 새로 만든다
+    """
+    if merge_cache is None:
+        return build_merged_lookup(ws)
+    lookup = merge_cache.get(ws.title)
+    if lookup is None:
+        lookup = merge_cache[ws.title] = build_merged_lookup(ws)
+    return lookup
+
+
+def get_merged_value(ws_values, merged_lookup, row, col):
+    """
+    get_value_with_merge에서 값만 필요할 때 쓰는 간단 버전
+    - 병합 영역이면 top-left 값, 수식 시트는 읽지 않음
+    """
+    anchor = merged_lookup.get((row, col))
+    if anchor is not None:
+        return ws_values.cell(anchor[0], anchor[1]).value
+    return ws_values.cell(row, col).value
+
+
 def get_value_with_merge(ws_values, ws_formula, merged_lookup, row, col):
     """
     data_only 값(ws_values) 기준으로:
@@ -210,10 +253,27 @@ def get_value_with_merge(ws_values, ws_formula, merged_lookup, row, col):
     return v, formula, (used_row, used_col)
 
 
-def find_hidden_header_row(ws_values, ws_formula, merged_lookup):
+def read_sheet_values(ws_values, merged_lookup, min_row, max_col, max_row=None):
+    """
+    min_row ~ max_row(없으면 마지막 행), A ~ max_col 열의 값을 iter_rows 한 번으로 읽어 행마다 내보냄
+    - 병합 셀은 top-left 값으로 보정
+    - 제너레이터이므로 호출하는 쪽에서 break하면 그 아래 행은 읽지 않음
+    - 내보내는 row[c - 1] = 해당 행 c열 값
+    """
+    for r, values in enumerate(
+        ws_values.iter_rows(min_row=min_row, max_row=max_row, max_col=max_col, values_only=True), start=min_row
+    ):
+        row = list(values)
+        for c in range(1, max_col + 1):
+            if (r, c) in merged_lookup:
+                row[c - 1] = get_merged_value(ws_values, merged_lookup, r, c)
+        yield row
+
+
+def find_hidden_header_row(ws_values, merged_lookup):
     """숨김 시트에서 '과목명' 헤더 행 찾기(기본 2행)."""
     for r in range(1, 21):
-        v, _, _ = get_value_with_merge(ws_values, ws_formula, merged_lookup, r, 2)  # B열
+        v = get_merged_value(ws_values, merged_lookup, r, 2)  # B열
         if v is not None and str(v).strip() == "과목명":
             return r
     return 2
@@ -229,13 +289,13 @@ def safe_strip(v):
 # 핵심 검사 로직
 # =========================
 
-def find_marker_row(ws_values, ws_formula, merged_lookup, marker_text, search_col=1):
+def find_marker_row(ws_values, merged_lookup, marker_text, search_col=1):
     """
     특정 텍스트를 포함하는 행 찾기 (A열 기본)
     marker_text: 찾을 텍스트 (예: '학교지정과목교과편성', '학생선택과목교과편성')
     """
     for r in range(1, ws_values.max_row + 1):
-        v, _, _ = get_value_with_merge(ws_values, ws_formula, merged_lookup, r, search_col)
+        v = get_merged_value(ws_values, merged_lookup, r, search_col)
         if v is not None:
             v_str = str(v).strip().replace(" ", "")
             marker_normalized = marker_text.replace(" ", "")
@@ -244,6 +304,160 @@ def find_marker_row(ws_values, ws_formula, merged_lookup, marker_text, search_co
     return None
 
 
+def sum_total_sections(ws_values, merged_lookup, sem_cols, exempt_rows, first_row, school_row, student_row=None, jeungbae_col=None, num_cache=None):
+    """
+    학교 지정(first_row ~ school_row-1) / 학생 선택(school_row+1 ~ student_row-1) 구간의
+    학기 열별 합계를 열마다 한 번의 행 순회로 계산
+    - 총계 행(exempt_rows)은 제외
+    - 병합 셀은 구간마다 병합 영역당 한 번만 합산
+    - 학생 선택 구간은 jeungbae_col에 '증배'가 포함된 행 제외
+    - num_cache: 이미 읽은 셀 숫자값 {(행, 열): to_number 결과}. 없는 셀만 시트에서 읽어 채운다
+    return: (학교 지정 합계, 학생 선택 합계 또는 student_row가 없으면 None)
+            각 합계는 sem_cols 순서와 같은 array('d')
+    """
+    if num_cache is None:
+        num_cache = {}
+
+    def cell_number(rr, col):
+        key = (rr, col)
+        if key in num_cache:
+            return num_cache[key]
+        val = get_merged_value(ws_values, merged_lookup, rr, col)
+        num = num_cache[key] = to_number(val)
+        return num
+
+    # (시작 행, 끝 행(미포함), 학생 선택 구간 여부, 제외 행 표시)
+    # 총계 행/증배 행 여부는 열과 무관하므로 구간마다 한 번만 판정해 bytearray에 표시해 둔다
+    segments = []
+    bounds = [(first_row, school_row, False)]
+    if student_row is not None:
+        bounds.append((school_row + 1, student_row, True))
+    for seg_start, seg_end, is_student in bounds:
+        skip = bytearray(max(seg_end - seg_start, 0))
+        for rr in range(seg_start, seg_end):
+            if rr in exempt_rows:
+                skip[rr - seg_start] = 1
+            elif is_student and jeungbae_col is not None:
+                a_val = get_merged_value(ws_values, merged_lookup, rr, jeungbae_col)
+                if a_val and "증배" in str(a_val):
+                    skip[rr - seg_start] = 1
+        kept_rows = [rr for rr in range(seg_start, seg_end) if not skip[rr - seg_start]]
+        segments.append((seg_start, seg_end, is_student, skip, kept_rows))
+
+    # 구간 안에 병합 셀이 하나도 없는 학기 열은 병합 처리 없이 바로 합산
+    sem_col_set = set(sem_cols)
+    last_row = student_row if student_row is not None else school_row
+    merged_cols = {c for (r, c) in merged_lookup if c in sem_col_set and first_row <= r < last_row}
+
+    school_expected = array("d", [0.0] * len(sem_cols))
+    student_expected = array("d", [0.0] * len(sem_cols)) if student_row is not None else None
+    for col_idx, col_letter in enumerate(sem_cols):
+        for seg_start, seg_end, is_student, skip, kept_rows in segments:
+            expected_sum = 0.0
+            if col_letter not in merged_cols:
+                for rr in kept_rows:
+                    num = cell_number(rr, col_letter)
+                    if num is not None:
+                        expected_sum += num
+            else:
+                rr = seg_start
+                while rr < seg_end:
+                    if skip[rr - seg_start]:
+                        rr += 1
+                        continue
+
+                    num = cell_number(rr, col_letter)
+                    if num is not None:
+                        expected_sum += num
+
+                    # 병합 셀이면 처음 합산한 행 이후의 병합 영역은 건너뛰기 (병합 영역당 한 번만 합산)
+                    merged = merged_lookup.get((rr, col_letter))
+                    rr = merged[2] + 1 if merged is not None else rr + 1
+
+            if is_student:
+                student_expected[col_idx] = expected_sum
+            else:
+                school_expected[col_idx] = expected_sum
+    return school_expected, student_expected
+
+
+def build_prefix_sums(row_values, first_row, last_row):
+    """
+    {행: 값} 사전을 first_row ~ last_row 구간의 누적합 리스트로 변환
+    prefix[i] = first_row ~ (first_row + i - 1) 행 값의 합
+    """
+    prefix = [0.0] * (last_row - first_row + 2)
+    acc = 0.0
+    for i, rr in enumerate(range(first_row, last_row + 1), start=1):
+        acc += row_values.get(rr, 0.0)
+        prefix[i] = acc
+    return prefix
+
+
+def range_sum(prefix, first_row, start_row, end_row):
+    """누적합 리스트로 start_row ~ end_row 구간 합계 계산 (누적합 범위 밖의 행은 0으로 취급)"""
+    lo = max(start_row, first_row) - first_row
+    hi = min(end_row - first_row + 1, len(prefix) - 1)
+    if hi <= lo:
+        return 0.0
+    return prefix[hi] - prefix[lo]
+
+
+def read_row_numbers(ws_values, merged_lookup, row, cols):
+    """row 행의 cols 열 값을 숫자로 읽기 (병합 셀은 top-left 값). return: cols 순서의 [숫자 또는 None]"""
+    numbers = []
+    for col in cols:
+        v = get_merged_value(ws_values, merged_lookup, row, col)
+        numbers.append(to_number(v))
+    return numbers
+
+
+def find_column_mismatches(actual, expected, cols, offset=0.0):
+    """
+    열별 셀값(actual)과 기대값(expected + offset) 비교 (actual/expected는 cols 순서)
+    - 셀값이 없는 열은 비교하지 않음
+    return: [(열 번호, 셀값, 기대값)] 불일치한 열만
+    """
+    mismatches = []
+    for col, actual_num, expected_num in zip(cols, actual, expected):
+        if actual_num is None:
+            continue
+        expected_sum = expected_num + offset
+        if abs(actual_num - expected_sum) > EPS:
+            mismatches.append((col, actual_num, expected_sum))
+    return mismatches
+
+
+# 총계 행 검증 메시지 템플릿: (severity, row, 코드, *인자) 레코드를 출력 시점에 dict로 변환
+TOTAL_ROW_MESSAGES = {
+    "missing_cell": "총계 부분의 {0} 셀이 존재하지 않습니다. 교육청의 양식을 확인하여 수정하고 다시 검사를 진행해주세요.",
+    "school_col": "학교 지정 과목 편성 학점 {0}열 합계 오류: 셀값={1:g}, 기대값={2:g}",
+    "school_total": "학교 지정 과목 편성 학점 {0}열 합계 오류: 셀값={1:g}, 기대값({2}합)={3:g}",
+    "student_col": "학생 선택 과목 편성 학점 {0}열 합계 오류: 셀값={1:g}, 기대값={2:g} (증배 제외)",
+    "student_total": "학생 선택 과목 편성 학점 {0}열 합계 오류: 셀값={1:g}, 기대값({2}합)={3:g}",
+    "subject_col": "총 교과 편성 학점 {0}열 합계 오류: 셀값={1:g}, 기대값(학교지정+학생선택)={2:g}",
+    "subject_total": "총 교과 편성 학점 {0}열 합계 오류: 셀값={1:g}, 기대값={2:g}",
+    "creative_empty": "창의적 체험활동 학점 {0}열에 값이 없습니다.",
+    "creative_range": "창의적 체험활동 학점 {0}열 오류: 셀값={1:g}, 허용 범위=1~5",
+    "creative_range_hint": "창의적 체험활동 학점 {0}열은 1~5 범위 내로 설정해야 합니다.",
+    "creative_total_empty": "창의적 체험활동 학점 총합 열({0})에 값이 없습니다.",
+    "creative_total": "창의적 체험활동 학점 {0}열 합계 오류: 셀값={1:g}, 기대값(각 학기 열 합)={2:g}",
+    "final_col": "편성 학점 수 {0}열 합계 오류: 셀값={1:g}, 기대값(총교과+창의적)={2:g}",
+    "final_total": "편성 학점 수 {0}열 합계 오류: 셀값={1:g}, 기대값(총교과+창의적)={2:g}",
+}
+
+
+def render_total_row_issue(sheet, raw):
+    """(severity, row, 코드, *인자) 레코드를 issues 형식의 dict로 변환"""
+    severity, row, code = raw[0], raw[1], raw[2]
+    return {
+        "severity": severity,
+        "sheet": sheet,
+        "row": row,
+        "message": TOTAL_ROW_MESSAGES[code].format(*raw[3:]),
+    }
+
+
 def get_column_name(col_num, year=None):
     """
     열 번호를 한글 이름으로 변환
@@ -335,7 +549,7 @@ def format_number(num):
     return str(num)
 
 
-def check_all_grades_sheet(wb_v, wb_f, targets, issues, hidden=None, vocational_courses=None, new_courses=None, hidden_list_norm=None):
+def check_all_grades_sheet(wb_v, wb_f, targets, issues, hidden=None, vocational_courses=None, new_courses=None, hidden_list_norm=None, merge_cache=None):
     """
     '2026 전학년' 시트 검증
     - 전학년 시트와 2026 입학생 시트: G, H열 비교 (1학년)
@@ -358,7 +572,7 @@ def check_all_grades_sheet(wb_v, wb_f, targets, issues, hidden=None, vocational_
     # '2026 전학년' 시트 로드
     ws_all_v = wb_v[all_grades_sheet]
     ws_all_f = wb_f[all_grades_sheet]
-    merge_all = build_merged_lookup(ws_all_f)
+    merge_all = get_merged_lookup(ws_all_f, merge_cache)
     
     # 각 입학생 시트 로드
     sheets_data = {}
@@ -368,16 +582,15 @@ def check_all_grades_sheet(wb_v, wb_f, targets, issues, hidden=None, vocational_
             continue
         ws_v = wb_v[sname]
         ws_f = wb_f[sname]
-        merge = build_merged_lookup(ws_f)
+        merge = get_merged_lookup(ws_f, merge_cache)
         sheets_data[year] = {
             "name": sname,
             "ws_v": ws_v,
-            "ws_f": ws_f,
             "merge": merge
         }
     
     # ===== 1. '학교 지정 과목 교과~' 위쪽 검증 =====
-    marker_row_all = find_marker_row(ws_all_v, ws_all_f, merge_all, "학교지정과목교과편성")
+    marker_row_all = find_marker_row(ws_all_v, merge_all, "학교지정과목교과편성")
     
     if marker_row_all:
         # '2026 전학년' 시트의 교과목 수집 (marker_row_all 위쪽)
@@ -386,11 +599,11 @@ def check_all_grades_sheet(wb_v, wb_f, targets, issues, hidden=None, vocational_
         
         for r in range(5, marker_row_all):
             # A열에 '증배'가 포함되어 있는지 확인 (교차 점검 제외)
-            a_col_value, _, _ = get_value_with_merge(ws_all_v, ws_all_f, merge_all, r, 1)
+            a_col_value = get_merged_value(ws_all_v, merge_all, r, 1)
             if a_col_value and '증배' in str(a_col_value):
                 continue
             
-            course_raw, _, _ = get_value_with_merge(ws_all_v, ws_all_f, merge_all, r, 4)  # D열
+            course_raw = get_merged_value(ws_all_v, merge_all, r, 4)  # D열
             if not course_raw or str(course_raw).strip() == "":
                 continue
             
@@ -401,9 +614,9 @@ def check_all_grades_sheet(wb_v, wb_f, targets, issues, hidden=None, vocational_
             # B~L열(2~12), O열(15) 값 수집
             row_data = {"row": r}
             for col in range(2, 13):  # B~L
-                v, _, _ = get_value_with_merge(ws_all_v, ws_all_f, merge_all, r, col)
+                v = get_merged_value(ws_all_v, merge_all, r, col)
                 row_data[col] = safe_strip(v) if col in [2, 3] else to_number(v)
-            v, _, _ = get_value_with_merge(ws_all_v, ws_all_f, merge_all, r, 15)  # O열
+            v = get_merged_value(ws_all_v, merge_all, r, 15)  # O열
             row_data[15] = safe_strip(v)
             
             # 같은 과목명이 여러 행에 있을 수 있음 (화살표 과목)
@@ -417,11 +630,11 @@ def check_all_grades_sheet(wb_v, wb_f, targets, issues, hidden=None, vocational_
                 continue
             
             data = sheets_data[year]
-            ws_v, ws_f, merge = data["ws_v"], data["ws_f"], data["merge"]
+            ws_v, merge = data["ws_v"], data["merge"]
             sname = data["name"]
             
             # 해당 시트의 '학교 지정 과목 교과~' 찾기
-            marker_row_src = find_marker_row(ws_v, ws_f, merge, "학교지정과목교과편성")
+            marker_row_src = find_marker_row(ws_v, merge, "학교지정과목교과편성")
             if not marker_row_src:
                 continue
             
@@ -450,18 +663,18 @@ def check_all_grades_sheet(wb_v, wb_f, targets, issues, hidden=None, vocational_
             
             for r in range(5, marker_row_src):
                 # A열(또는 B열)에 '증배'가 포함되어 있는지 확인 (교차 점검 제외)
-                a_col_value, _, _ = get_value_with_merge(ws_v, ws_f, merge, r, a_col)
+                a_col_value = get_merged_value(ws_v, merge, r, a_col)
                 if a_col_value and '증배' in str(a_col_value):
                     continue
                 
-                course_raw, _, _ = get_value_with_merge(ws_v, ws_f, merge, r, course_col)
+                course_raw = get_merged_value(ws_v, merge, r, course_col)
                 if not course_raw or str(course_raw).strip() == "":
                     continue
                 
                 # check_cols에 숫자가 있는지 확인
                 has_number = False
                 for col in check_cols:
-                    v, _, _ = get_value_with_merge(ws_v, ws_f, merge, r, col)
+                    v = get_merged_value(ws_v, merge, r, col)
                     if to_number(v) is not None:
                         has_number = True
                         break
@@ -500,7 +713,7 @@ def check_all_grades_sheet(wb_v, wb_f, targets, issues, hidden=None, vocational_
                 for i, src_col in enumerate(src_cols):
                     dst_col = dst_cols[i]
                     
-                    src_val, _, _ = get_value_with_merge(ws_v, ws_f, merge, r, src_col)
+                    src_val = get_merged_value(ws_v, merge, r, src_col)
                     dst_val = all_data.get(dst_col)
                     
                     # B열은 병합 고려
@@ -566,7 +779,7 @@ def check_all_grades_sheet(wb_v, wb_f, targets, issues, hidden=None, vocational_
             
             # 전학년 시트의 첫 번째 행에서 A열에 '증배'가 있는지 확인 (교차 점검 제외)
             first_data = data_list[0]
-            a_col_value, _, _ = get_value_with_merge(ws_all_v, ws_all_f, merge_all, first_data["row"], 1)
+            a_col_value = get_merged_value(ws_all_v, merge_all, first_data["row"], 1)
             if a_col_value and '증배' in str(a_col_value):
                 continue
             
@@ -577,10 +790,10 @@ def check_all_grades_sheet(wb_v, wb_f, targets, issues, hidden=None, vocational_
                     continue
                 
                 sheet_data = sheets_data[year]
-                ws_v, ws_f, merge = sheet_data["ws_v"], sheet_data["ws_f"], sheet_data["merge"]
+                ws_v, merge = sheet_data["ws_v"], sheet_data["merge"]
                 sname = sheet_data["name"]
                 
-                marker_row_src = find_marker_row(ws_v, ws_f, merge, "학교지정과목교과편성")
+                marker_row_src = find_marker_row(ws_v, merge, "학교지정과목교과편성")
                 if not marker_row_src:
                     continue
                 
@@ -601,18 +814,18 @@ def check_all_grades_sheet(wb_v, wb_f, targets, issues, hidden=None, vocational_
                 # 입학생 시트에서 해당 과목이 check_cols에 숫자가 있는지 확인
                 for r in range(5, marker_row_src):
                     # A열(또는 B열)에 '증배'가 포함되어 있는지 확인 (교차 점검 제외)
-                    a_col_value, _, _ = get_value_with_merge(ws_v, ws_f, merge, r, a_col)
+                    a_col_value = get_merged_value(ws_v, merge, r, a_col)
                     if a_col_value and '증배' in str(a_col_value):
                         continue
                     
-                    course_raw, _, _ = get_value_with_merge(ws_v, ws_f, merge, r, rev_course_col)
+                    course_raw = get_merged_value(ws_v, merge, r, rev_course_col)
                     if not course_raw:
                         continue
                     
                     if normalize_course_name(course_raw) == course_norm:
                         # check_cols에 숫자가 있는지 확인
                         for col in check_cols:
-                            v, _, _ = get_value_with_merge(ws_v, ws_f, merge, r, col)
+                            v = get_merged_value(ws_v, merge, r, col)
                             if to_number(v) is not None:
                                 found_in_any = True
                                 break
@@ -634,7 +847,7 @@ def check_all_grades_sheet(wb_v, wb_f, targets, issues, hidden=None, vocational_
                 })
     
     # ===== 2. '학생 선택 과목 교과~' 위쪽 검증 =====
-    marker_row_student = find_marker_row(ws_all_v, ws_all_f, merge_all, "학생선택과목교과편성")
+    marker_row_student = find_marker_row(ws_all_v, merge_all, "학생선택과목교과편성")
     
     if marker_row_student and marker_row_all:
         # '2026 전학년' 시트의 교과목 수집 (marker_row_all ~ marker_row_student 사이)
@@ -662,7 +875,7 @@ def check_all_grades_sheet(wb_v, wb_f, targets, issues, hidden=None, vocational_
             if key in merge_all:
                 min_row, _, max_row, _ = merge_all[key]
                 # A열 병합에 '증배'가 포함되어 있는지 확인
-                a_col_value, _, _ = get_value_with_merge(ws_all_v, ws_all_f, merge_all, r, 1)
+                a_col_value = get_merged_value(ws_all_v, merge_all, r, 1)
                 if a_col_value and '증배' in str(a_col_value):
                     # '증배'가 있으면 교차 점검 제외
                     continue
@@ -670,7 +883,7 @@ def check_all_grades_sheet(wb_v, wb_f, targets, issues, hidden=None, vocational_
                     merge_key = (min_row, max_row)
             else:
                 # A열에 '증배'가 포함되어 있는지 확인 (교차 점검 제외)
-                a_col_value, _, _ = get_value_with_merge(ws_all_v, ws_all_f, merge_all, r, 1)
+                a_col_value = get_merged_value(ws_all_v, merge_all, r, 1)
                 if a_col_value and '증배' in str(a_col_value):
                     continue
                 merge_key = (r, r)
@@ -690,32 +903,32 @@ def check_all_grades_sheet(wb_v, wb_f, targets, issues, hidden=None, vocational_
             
             for rr in range(merge_key[0], min(merge_key[1] + 1, marker_row_student)):
                 # 2026 (1학년): G열 (7) - 1학기
-                v_G, _, _ = get_value_with_merge(ws_all_v, ws_all_f, merge_all, rr, 7)
+                v_G = get_merged_value(ws_all_v, merge_all, rr, 7)
                 if to_number(v_G) is not None:
                     has_2026_G = True
                 
                 # 2026 (1학년): H열 (8) - 2학기
-                v_H, _, _ = get_value_with_merge(ws_all_v, ws_all_f, merge_all, rr, 8)
+                v_H = get_merged_value(ws_all_v, merge_all, rr, 8)
                 if to_number(v_H) is not None:
                     has_2026_H = True
                 
                 # 2025 (2학년): I열 (9) - 1학기
-                v_I, _, _ = get_value_with_merge(ws_all_v, ws_all_f, merge_all, rr, 9)
+                v_I = get_merged_value(ws_all_v, merge_all, rr, 9)
                 if to_number(v_I) is not None:
                     has_2025_I = True
                 
                 # 2025 (2학년): J열 (10) - 2학기
-                v_J, _, _ = get_value_with_merge(ws_all_v, ws_all_f, merge_all, rr, 10)
+                v_J = get_merged_value(ws_all_v, merge_all, rr, 10)
                 if to_number(v_J) is not None:
                     has_2025_J = True
                 
                 # 2024 (3학년): K열 (11) - 1학기
-                v_K, _, _ = get_value_with_merge(ws_all_v, ws_all_f, merge_all, rr, 11)
+                v_K = get_merged_value(ws_all_v, merge_all, rr, 11)
                 if to_number(v_K) is not None:
                     has_2024_K = True
                 
                 # 2024 (3학년): L열 (12) - 2학기
-                v_L, _, _ = get_value_with_merge(ws_all_v, ws_all_f, merge_all, rr, 12)
+                v_L = get_merged_value(ws_all_v, merge_all, rr, 12)
                 if to_number(v_L) is not None:
                     has_2024_L = True
             
@@ -725,7 +938,7 @@ def check_all_grades_sheet(wb_v, wb_f, targets, issues, hidden=None, vocational_
             
             # 해당 병합 구간 내에서 각 학년별로 숫자가 있는 행만 과목 수집
             for rr in range(merge_key[0], min(merge_key[1] + 1, marker_row_student)):
-                c_raw, _, _ = get_value_with_merge(ws_all_v, ws_all_f, merge_all, rr, 4)  # D열
+                c_raw = get_merged_value(ws_all_v, merge_all, rr, 4)  # D열
                 if not c_raw:
                     continue
                 
@@ -743,9 +956,9 @@ def check_all_grades_sheet(wb_v, wb_f, targets, issues, hidden=None, vocational_
                     # B~L열, O열 값 수집
                     row_data = {"row": rr}
                     for col in range(2, 13):  # B~L열 (2~12)
-                        v, _, _ = get_value_with_merge(ws_all_v, ws_all_f, merge_all, rr, col)
+                        v = get_merged_value(ws_all_v, merge_all, rr, col)
                         row_data[col] = safe_strip(v) if col in [2, 3] else to_number(v)
-                    v, _, _ = get_value_with_merge(ws_all_v, ws_all_f, merge_all, rr, 15)
+                    v = get_merged_value(ws_all_v, merge_all, rr, 15)
                     row_data[15] = safe_strip(v)
                     
                     # 병합 정보 저장
@@ -785,16 +998,16 @@ def check_all_grades_sheet(wb_v, wb_f, targets, issues, hidden=None, vocational_
                 continue
             
             data = sheets_data[year]
-            ws_v, ws_f, merge = data["ws_v"], data["ws_f"], data["merge"]
+            ws_v, merge = data["ws_v"], data["merge"]
             sname = data["name"]
             
             # 해당 시트의 마커 찾기
-            marker_row_src = find_marker_row(ws_v, ws_f, merge, "학교지정과목교과편성")
+            marker_row_src = find_marker_row(ws_v, merge, "학교지정과목교과편성")
             if not marker_row_src:
                 continue
             
             # '학생 선택 과목 편성' 마커 찾기 (이 위쪽으로만 비교)
-            marker_row_student_end = find_marker_row(ws_v, ws_f, merge, "학생선택과목교과편성")
+            marker_row_student_end = find_marker_row(ws_v, merge, "학생선택과목교과편성")
             if not marker_row_student_end:
                 # 마커를 못 찾으면 시트 끝까지
                 marker_row_student_end = ws_v.max_row + 1
@@ -836,7 +1049,7 @@ def check_all_grades_sheet(wb_v, wb_f, targets, issues, hidden=None, vocational_
                         if key in merge:
                             min_row, _, max_row, _ = merge[key]
                             # A열 병합에 '증배'가 포함되어 있는지 확인
-                            a_col_value, _, _ = get_value_with_merge(ws_v, ws_f, merge, r, a_col)
+                            a_col_value = get_merged_value(ws_v, merge, r, a_col)
                             if a_col_value and '증배' in str(a_col_value):
                                 # '증배'가 있으면 교차 점검 제외
                                 continue
@@ -844,17 +1057,17 @@ def check_all_grades_sheet(wb_v, wb_f, targets, issues, hidden=None, vocational_
                                 merge_key = (min_row, max_row)
                         else:
                             # A열(또는 B열)에 '증배'가 포함되어 있는지 확인 (교차 점검 제외)
-                            a_col_value, _, _ = get_value_with_merge(ws_v, ws_f, merge, r, a_col)
+                            a_col_value = get_merged_value(ws_v, merge, r, a_col)
                             if a_col_value and '증배' in str(a_col_value):
                                 continue
                             merge_key = (r, r)
                         
-                        course_raw, _, _ = get_value_with_merge(ws_v, ws_f, merge, r, student_course_col)
+                        course_raw = get_merged_value(ws_v, merge, r, student_course_col)
                         if not course_raw or str(course_raw).strip() == "":
                             continue
                         
                         # 해당 열에 숫자가 있는지 확인
-                        v, _, _ = get_value_with_merge(ws_v, ws_f, merge, r, check_col)
+                        v = get_merged_value(ws_v, merge, r, check_col)
                         if to_number(v) is None:
                             continue
                         
@@ -877,7 +1090,7 @@ def check_all_grades_sheet(wb_v, wb_f, targets, issues, hidden=None, vocational_
                         # 먼저 병합 구간에서 check_col에 숫자가 있는지 확인
                         has_number_in_merge = False
                         for rr in range(merge_key[0], min(merge_key[1] + 1, marker_row_student_end)):
-                            v, _, _ = get_value_with_merge(ws_v, ws_f, merge, rr, check_col)
+                            v = get_merged_value(ws_v, merge, rr, check_col)
                             if to_number(v) is not None:
                                 has_number_in_merge = True
                                 break
@@ -885,7 +1098,7 @@ def check_all_grades_sheet(wb_v, wb_f, targets, issues, hidden=None, vocational_
                         # 병합 구간 전체에서 숫자가 하나라도 있으면, 병합 구간의 모든 행에서 과목 수집
                         if has_number_in_merge:
                             for rr in range(merge_key[0], min(merge_key[1] + 1, marker_row_student_end)):
-                                c_raw, _, _ = get_value_with_merge(ws_v, ws_f, merge, rr, student_course_col)
+                                c_raw = get_merged_value(ws_v, merge, rr, student_course_col)
                                 if not c_raw:
                                     continue
                                 
@@ -938,7 +1151,7 @@ def check_all_grades_sheet(wb_v, wb_f, targets, issues, hidden=None, vocational_
                                 
                                 # A열에 '증배'가 포함되어 있는지 확인
                                 a_col_for_check = 1 if year in [2026, 2025] else 2
-                                a_col_value, _, _ = get_value_with_merge(ws_v, ws_f, merge, course_row, a_col_for_check)
+                                a_col_value = get_merged_value(ws_v, merge, course_row, a_col_for_check)
                                 has_jeungbae = a_col_value and '증배' in str(a_col_value)
                                 
                                 # 비교할 열 결정
@@ -960,7 +1173,7 @@ def check_all_grades_sheet(wb_v, wb_f, targets, issues, hidden=None, vocational_
                                 for i, src_col in enumerate(src_cols):
                                     dst_col = dst_cols[i]
                                     
-                                    src_val, _, _ = get_value_with_merge(ws_v, ws_f, merge, course_row, src_col)
+                                    src_val = get_merged_value(ws_v, merge, course_row, src_col)
                                     dst_val = all_data.get(dst_col)
                                     
                                     # 문자열 비교 (교과군, 과목유형)
@@ -1033,18 +1246,18 @@ def check_all_grades_sheet(wb_v, wb_f, targets, issues, hidden=None, vocational_
                 continue
             
             data = sheets_data[year]
-            ws_v, ws_f, merge = data["ws_v"], data["ws_f"], data["merge"]
+            ws_v, merge = data["ws_v"], data["merge"]
             sname = data["name"]
             
             # 학생 선택 과목 마커 찾기
-            marker_row_student_start = find_marker_row(ws_v, ws_f, merge, "학생선택과목교과편성")
+            marker_row_student_start = find_marker_row(ws_v, merge, "학생선택과목교과편성")
             if not marker_row_student_start:
                 continue
             
             # 학생 선택 영역의 끝 찾기
             marker_row_student_real_end = ws_v.max_row + 1
             for r in range(marker_row_student_start + 1, ws_v.max_row + 1):
-                course_v, _, _ = get_value_with_merge(ws_v, ws_f, merge, r, 4 if year in [2026, 2025] else 5)
+                course_v = get_merged_value(ws_v, merge, r, 4 if year in [2026, 2025] else 5)
                 if course_v:
                     course_str = str(course_v).strip().replace(" ", "")
                     if any(keyword in course_str for keyword in ["편성학점", "총교과", "창의적체험활동"]):
@@ -1088,7 +1301,7 @@ def check_all_grades_sheet(wb_v, wb_f, targets, issues, hidden=None, vocational_
                     key = (r, a_col)
                     if key in merge:
                         min_row, _, max_row, _ = merge[key]
-                        a_col_value, _, _ = get_value_with_merge(ws_v, ws_f, merge, r, a_col)
+                        a_col_value = get_merged_value(ws_v, merge, r, a_col)
                         if a_col_value and '증배' in str(a_col_value):
                             # '증배'가 있으면 교차 점검 제외
                             continue
@@ -1096,7 +1309,7 @@ def check_all_grades_sheet(wb_v, wb_f, targets, issues, hidden=None, vocational_
                             merge_key = (min_row, max_row)
                     else:
                         # A열(또는 B열)에 '증배'가 포함되어 있는지 확인 (교차 점검 제외)
-                        a_col_value, _, _ = get_value_with_merge(ws_v, ws_f, merge, r, a_col)
+                        a_col_value = get_merged_value(ws_v, merge, r, a_col)
                         if a_col_value and '증배' in str(a_col_value):
                             continue
                         merge_key = (r, r)
@@ -1109,7 +1322,7 @@ def check_all_grades_sheet(wb_v, wb_f, targets, issues, hidden=None, vocational_
                     # 해당 병합 구간에서 check_col에 숫자가 있는지 확인
                     has_number = False
                     for rr in range(merge_key[0], min(merge_key[1] + 1, marker_row_student_real_end)):
-                        v, _, _ = get_value_with_merge(ws_v, ws_f, merge, rr, check_col)
+                        v = get_merged_value(ws_v, merge, rr, check_col)
                         if to_number(v) is not None:
                             has_number = True
                             break
@@ -1119,7 +1332,7 @@ def check_all_grades_sheet(wb_v, wb_f, targets, issues, hidden=None, vocational_
                     # 병합 구간 전체에서 숫자가 하나라도 있으면, 병합 구간의 모든 행에서 과목 수집
                     if has_number:
                         for rr in range(merge_key[0], min(merge_key[1] + 1, marker_row_student_real_end)):
-                            c_raw, _, _ = get_value_with_merge(ws_v, ws_f, merge, rr, student_course_col)
+                            c_raw = get_merged_value(ws_v, merge, rr, student_course_col)
                             if not c_raw or str(c_raw).strip() == "":
                                 continue
                             
@@ -1167,7 +1380,7 @@ def check_all_grades_sheet(wb_v, wb_f, targets, issues, hidden=None, vocational_
                             
                             # A열에 '증배' 확인
                             a_col_for_check = 1 if year in [2026, 2025] else 2
-                            a_col_value, _, _ = get_value_with_merge(ws_v, ws_f, merge, course_row, a_col_for_check)
+                            a_col_value = get_merged_value(ws_v, merge, course_row, a_col_for_check)
                             has_jeungbae = a_col_value and '증배' in str(a_col_value)
                             
                             # 비교할 열 결정
@@ -1189,7 +1402,7 @@ def check_all_grades_sheet(wb_v, wb_f, targets, issues, hidden=None, vocational_
                             for i, src_col in enumerate(src_cols):
                                 dst_col = dst_cols[i]
                                 
-                                src_val, _, _ = get_value_with_merge(ws_v, ws_f, merge, course_row, src_col)
+                                src_val = get_merged_value(ws_v, merge, course_row, src_col)
                                 dst_val = all_data.get(dst_col)
                                 
                                 # 문자열 비교
@@ -1271,15 +1484,15 @@ def check_all_grades_sheet(wb_v, wb_f, targets, issues, hidden=None, vocational_
                         continue
                     
                     sheet_data = sheets_data[year]
-                    ws_v, ws_f, merge = sheet_data["ws_v"], sheet_data["ws_f"], sheet_data["merge"]
+                    ws_v, merge = sheet_data["ws_v"], sheet_data["merge"]
                     sname = sheet_data["name"]
                     
                     # 마커 찾기
-                    marker_row_src = find_marker_row(ws_v, ws_f, merge, "학교지정과목교과편성")
+                    marker_row_src = find_marker_row(ws_v, merge, "학교지정과목교과편성")
                     if not marker_row_src:
                         continue
                     
-                    marker_row_student_end = find_marker_row(ws_v, ws_f, merge, "학생선택과목교과편성")
+                    marker_row_student_end = find_marker_row(ws_v, merge, "학생선택과목교과편성")
                     if not marker_row_student_end:
                         marker_row_student_end = ws_v.max_row + 1
                     
@@ -1308,7 +1521,7 @@ def check_all_grades_sheet(wb_v, wb_f, targets, issues, hidden=None, vocational_
                         key = (r, a_col)
                         if key in merge:
                             min_row, _, max_row, _ = merge[key]
-                            a_col_value, _, _ = get_value_with_merge(ws_v, ws_f, merge, r, a_col)
+                            a_col_value = get_merged_value(ws_v, merge, r, a_col)
                             if a_col_value and '증배' in str(a_col_value):
                                 # '증배'가 있으면 교차 점검 제외
                                 continue
@@ -1316,7 +1529,7 @@ def check_all_grades_sheet(wb_v, wb_f, targets, issues, hidden=None, vocational_
                                 merge_key = (min_row, max_row)
                         else:
                             # A열(또는 B열)에 '증배'가 포함되어 있는지 확인 (교차 점검 제외)
-                            a_col_value, _, _ = get_value_with_merge(ws_v, ws_f, merge, r, a_col)
+                            a_col_value = get_merged_value(ws_v, merge, r, a_col)
                             if a_col_value and '증배' in str(a_col_value):
                                 continue
                             merge_key = (r, r)
@@ -1329,7 +1542,7 @@ def check_all_grades_sheet(wb_v, wb_f, targets, issues, hidden=None, vocational_
                         # 해당 병합 구간에서 check_col에 숫자가 있는지 확인
                         has_number = False
                         for rr in range(merge_key[0], min(merge_key[1] + 1, marker_row_student_end)):
-                            v, _, _ = get_value_with_merge(ws_v, ws_f, merge, rr, check_col)
+                            v = get_merged_value(ws_v, merge, rr, check_col)
                             if to_number(v) is not None:
                                 has_number = True
                                 break
@@ -1338,7 +1551,7 @@ def check_all_grades_sheet(wb_v, wb_f, targets, issues, hidden=None, vocational_
                         # 병합 구간 전체에서 숫자가 하나라도 있으면, 병합 구간의 모든 행에서 과목 수집
                         if has_number:
                             for rr in range(merge_key[0], min(merge_key[1] + 1, marker_row_student_end)):
-                                course_raw, _, _ = get_value_with_merge(ws_v, ws_f, merge, rr, student_course_col)
+                                course_raw = get_merged_value(ws_v, merge, rr, student_course_col)
                                 if not course_raw or str(course_raw).strip() == "":
                                     continue
                                 
@@ -1359,7 +1572,7 @@ def check_all_grades_sheet(wb_v, wb_f, targets, issues, hidden=None, vocational_
                         # 전학년 시트의 첫 번째 행에서 A열에 '증배'가 있는지 확인 (교차 점검 제외)
                         if row_data_list:
                             first_row_data = row_data_list[0]
-                            a_col_value, _, _ = get_value_with_merge(ws_all_v, ws_all_f, merge_all, first_row_data["row"], 1)
+                            a_col_value = get_merged_value(ws_all_v, merge_all, first_row_data["row"], 1)
                             if a_col_value and '증배' in str(a_col_value):
                                 continue
                         
@@ -1398,7 +1611,7 @@ def check_all_grades_sheet(wb_v, wb_f, targets, issues, hidden=None, vocational_
     # 마지막 데이터 행 찾기
     last_row = None
     for rr in range(ws_all_f.max_row, first_row - 1, -1):
-        v, _, _ = get_value_with_merge(ws_all_v, ws_all_f, merge_all, rr, course_col)
+        v = get_merged_value(ws_all_v, merge_all, rr, course_col)
         if v is not None and str(v).strip() != "":
             last_row = rr
             break
@@ -1423,7 +1636,7 @@ def check_all_grades_sheet(wb_v, wb_f, targets, issues, hidden=None, vocational_
                     # 병합된 영역의 하위 행은 건너뛰기 (최상단 행에서만 확인)
                     continue
             
-            course_v, _, _ = get_value_with_merge(ws_all_v, ws_all_f, merge_all, rr, course_col)
+            course_v = get_merged_value(ws_all_v, merge_all, rr, course_col)
             if course_v:
                 course_str = str(course_v).strip().replace(" ", "")
                 # 총계 관련 키워드가 있으면 제외
@@ -1450,7 +1663,7 @@ def check_all_grades_sheet(wb_v, wb_f, targets, issues, hidden=None, vocational_
         }
         
         for rr in range(first_row, ws_all_f.max_row + 1):
-            a_val, _, _ = get_value_with_merge(ws_all_v, ws_all_f, merge_all, rr, 1)  # A열
+            a_val = get_merged_value(ws_all_v, merge_all, rr, 1)  # A열
             if a_val:
                 a_str = str(a_val).strip().replace(" ", "")
                 
@@ -1471,15 +1684,13 @@ def check_all_grades_sheet(wb_v, wb_f, targets, issues, hidden=None, vocational_
                 elif "편성학점수" in a_str and "과목" not in a_str and "교과" not in a_str:
                     total_rows["편성학점수"] = rr
         
+        # 총계 행 검증 결과는 (severity, row, 코드, *인자) 레코드로 모았다가 마지막에 한 번에 변환
+        total_row_issues = []
+
         # 필수 셀 존재 여부 확인
         for key, cell_name in required_cells.items():
             if key not in total_rows:
-                issues.append({
-                    "severity": "ERROR",
-                    "sheet": all_grades_sheet,
-                    "row": "-",
-                    "message": f"총계 부분의 {cell_name} 셀이 존재하지 않습니다. 교육청의 양식을 확인하여 수정하고 다시 검사를 진행해주세요."
-                })
+                total_row_issues.append(("ERROR", "-", "missing_cell", cell_name))
         
         # G~L 열 (2026 전학년 시트의 학기별 열)
         sem_cols = list(range(7, 13))  # G~L
@@ -1491,14 +1702,14 @@ def check_all_grades_sheet(wb_v, wb_f, targets, issues, hidden=None, vocational_
             if rr in exempt_rows:
                 continue
             
-            course_v, _, _ = get_value_with_merge(ws_all_v, ws_all_f, merge_all, rr, course_col)
+            course_v = get_merged_value(ws_all_v, merge_all, rr, course_col)
             if course_v is None or str(course_v).strip() == "":
                 continue
             
             sem_sum = 0.0
             any_num = False
             for cc in sem_cols:
-                v, _, _ = get_value_with_merge(ws_all_v, ws_all_f, merge_all, rr, cc)
+                v = get_merged_value(ws_all_v, merge_all, rr, cc)
                 n = to_number(v)
                 if n is not None:
                     sem_sum += n
@@ -1507,254 +1718,56 @@ def check_all_grades_sheet(wb_v, wb_f, targets, issues, hidden=None, vocational_
             if any_num:
                 row_total[rr] = sem_sum
         
+        # 학교 지정(first_row ~ school_row-1) / 학생 선택(school_row+1 ~ student_row-1, 증배 제외) 열별 기댓값은
+        # 한 번만 계산하여 (1)~(4) 검증에서 공유
+        if "학교지정" in total_rows:
+            school_expected_all, student_expected_all = sum_total_sections(
+                ws_all_v, merge_all, sem_cols, exempt_rows,
+                first_row, total_rows["학교지정"], total_rows.get("학생선택"),
+                jeungbae_col=1
+            )
+        if "학교지정" in total_rows and "학생선택" in total_rows:
+            subject_expected_all = array("d", [
+                school_num + student_num for school_num, student_num in zip(school_expected_all, student_expected_all)
+            ])
+
         # (1) 학교 지정 과목 편성 학점 검증
         if "학교지정" in total_rows:
             school_row = total_rows["학교지정"]
+            school_actual = read_row_numbers(ws_all_v, merge_all, school_row, sem_cols)
             
-            # 학교 지정 과목: 위의 행들 합계 (first_row ~ school_row-1)
-            for col_idx, col_letter in enumerate(sem_cols):
-                expected_sum = 0.0
-                processed_merges = set()  # 이미 처리한 병합 셀 추적
-                
-                for rr in range(first_row, school_row):
-                    if rr in exempt_rows:
-                        continue
-                    
-                    # 병합 셀 확인
-                    key = (rr, col_letter)
-                    if key in merge_all:
-                        min_row, _, max_row, _ = merge_all[key]
-                        merge_key = (min_row, max_row, col_letter)
-                        
-                        # 이미 처리한 병합 영역이면 건너뛰기
-                        if merge_key in processed_merges:
-                            continue
-                        processed_merges.add(merge_key)
-                    
-                    val, _, _ = get_value_with_merge(ws_all_v, ws_all_f, merge_all, rr, col_letter)
-                    num = to_number(val)
-                    if num is not None:
-                        expected_sum += num
-                
-                actual_val, _, _ = get_value_with_merge(ws_all_v, ws_all_f, merge_all, school_row, col_letter)
-                actual_num = to_number(actual_val)
-                
-                if actual_num is not None and abs(actual_num - expected_sum) > EPS:
-                    col_name = chr(64 + col_letter)  # 열 번호를 문자로 변환
-                    issues.append({
-                        "severity": "ERROR",
-                        "sheet": all_grades_sheet,
-                        "row": school_row,
-                        "message": f"학교 지정 과목 편성 학점 {col_name}열 합계 오류: 셀값={actual_num:g}, 기대값={expected_sum:g}"
-                    })
+            for col_letter, actual_num, expected_sum in find_column_mismatches(school_actual, school_expected_all, sem_cols):
+                col_name = COL_NAMES[col_letter - 1]  # 열 번호를 문자로 변환
+                total_row_issues.append(("ERROR", school_row, "school_col", col_name, actual_num, expected_sum))
         
         # (2) 학생 선택 과목 편성 학점 검증
         if "학생선택" in total_rows and "학교지정" in total_rows:
             student_row = total_rows["학생선택"]
-            school_row = total_rows["학교지정"]
+            student_actual = read_row_numbers(ws_all_v, merge_all, student_row, sem_cols)
             
-            # 학생 선택 과목: school_row+1 ~ student_row-1 합계 (증배 제외)
-            for col_idx, col_letter in enumerate(sem_cols):
-                expected_sum = 0.0
-                processed_merges = set()  # 이미 처리한 병합 셀 추적
-                
-                for rr in range(school_row + 1, student_row):
-                    if rr in exempt_rows:
-                        continue
-                    
-                    # 증배 확인 (A열)
-                    a_val, _, _ = get_value_with_merge(ws_all_v, ws_all_f, merge_all, rr, 1)
-                    if a_val and "증배" in str(a_val):
-                        continue
-                    
-                    # 병합 셀 확인
-                    key = (rr, col_letter)
-                    if key in merge_all:
-                        min_row, _, max_row, _ = merge_all[key]
-                        merge_key = (min_row, max_row, col_letter)
-                        
-                        # 이미 처리한 병합 영역이면 건너뛰기
-                        if merge_key in processed_merges:
-                            continue
-                        processed_merges.add(merge_key)
-                    
-                    val, _, _ = get_value_with_merge(ws_all_v, ws_all_f, merge_all, rr, col_letter)
-                    num = to_number(val)
-                    if num is not None:
-                        expected_sum += num
-                
-                actual_val, _, _ = get_value_with_merge(ws_all_v, ws_all_f, merge_all, student_row, col_letter)
-                actual_num = to_number(actual_val)
-                
-                if actual_num is not None and abs(actual_num - expected_sum) > EPS:
-                    col_name = chr(64 + col_letter)
-                    issues.append({
-                        "severity": "ERROR",
-                        "sheet": all_grades_sheet,
-                        "row": student_row,
-                        "message": f"학생 선택 과목 편성 학점 {col_name}열 합계 오류: 셀값={actual_num:g}, 기대값={expected_sum:g} (증배 제외)"
-                    })
+            for col_letter, actual_num, expected_sum in find_column_mismatches(student_actual, student_expected_all, sem_cols):
+                col_name = COL_NAMES[col_letter - 1]
+                total_row_issues.append(("ERROR", student_row, "student_col", col_name, actual_num, expected_sum))
         
-        # (3) 총 교과 편성 학점 검증
+        # (3) 총 교과 편성 학점 검증: 총 교과 = 학교 지정 기댓값 + 학생 선택 기댓값
         if "총교과" in total_rows and "학교지정" in total_rows and "학생선택" in total_rows:
             total_course_row = total_rows["총교과"]
-            school_row = total_rows["학교지정"]
-            student_row = total_rows["학생선택"]
-            
-            # 각 열별로 학교 지정과 학생 선택의 기댓값을 저장
-            school_expected_all = {}
-            student_expected_all = {}
-            
-            # 학교 지정 과목 기댓값 계산
-            for col_letter in sem_cols:
-                expected_sum = 0.0
-                processed_merges = set()
-                
-                for rr in range(first_row, school_row):
-                    if rr in exempt_rows:
-                        continue
-                    
-                    # 병합 셀 확인
-                    key = (rr, col_letter)
-                    if key in merge_all:
-                        min_row, _, max_row, _ = merge_all[key]
-                        merge_key = (min_row, max_row, col_letter)
-                        if merge_key in processed_merges:
-                            continue
-                        processed_merges.add(merge_key)
-                    
-                    val, _, _ = get_value_with_merge(ws_all_v, ws_all_f, merge_all, rr, col_letter)
-                    num = to_number(val)
-                    if num is not None:
-                        expected_sum += num
-                school_expected_all[col_letter] = expected_sum
+            total_course_actual = read_row_numbers(ws_all_v, merge_all, total_course_row, sem_cols)
             
-            # 학생 선택 과목 기댓값 계산 (증배 제외)
-            for col_letter in sem_cols:
-                expected_sum = 0.0
-                processed_merges = set()
-                
-                for rr in range(school_row + 1, student_row):
-                    if rr in exempt_rows:
-                        continue
-                    
-                    # 증배 확인 (A열)
-                    a_val, _, _ = get_value_with_merge(ws_all_v, ws_all_f, merge_all, rr, 1)
-                    if a_val and "증배" in str(a_val):
-                        continue
-                    
-                    # 병합 셀 확인
-                    key = (rr, col_letter)
-                    if key in merge_all:
-                        min_row, _, max_row, _ = merge_all[key]
-                        merge_key = (min_row, max_row, col_letter)
-                        if merge_key in processed_merges:
-                            continue
-                        processed_merges.add(merge_key)
-                    
-                    val, _, _ = get_value_with_merge(ws_all_v, ws_all_f, merge_all, rr, col_letter)
-                    num = to_number(val)
-                    if num is not None:
-                        expected_sum += num
-                student_expected_all[col_letter] = expected_sum
-            
-            # 총 교과 = 학교 지정 기댓값 + 학생 선택 기댓값
-            for col_letter in sem_cols:
-                expected_sum = school_expected_all.get(col_letter, 0.0) + student_expected_all.get(col_letter, 0.0)
-                
-                actual_val, _, _ = get_value_with_merge(ws_all_v, ws_all_f, merge_all, total_course_row, col_letter)
-                actual_num = to_number(actual_val)
-                
-                if actual_num is not None and abs(actual_num - expected_sum) > EPS:
-                    col_name = chr(64 + col_letter)
-                    issues.append({
-                        "severity": "ERROR",
-                        "sheet": all_grades_sheet,
-                        "row": total_course_row,
-                        "message": f"총 교과 편성 학점 {col_name}열 합계 오류: 셀값={actual_num:g}, 기대값(학교지정+학생선택)={expected_sum:g}"
-                    })
+            for col_letter, actual_num, expected_sum in find_column_mismatches(total_course_actual, subject_expected_all, sem_cols):
+                col_name = COL_NAMES[col_letter - 1]
+                total_row_issues.append(("ERROR", total_course_row, "subject_col", col_name, actual_num, expected_sum))
         
-        # (4) 편성 학점 수 검증
+        # (4) 편성 학점 수 검증: 편성 학점 수 = 총 교과 기댓값 + 창의적(3)
         if "편성학점수" in total_rows and "학교지정" in total_rows and "학생선택" in total_rows:
             final_row = total_rows["편성학점수"]
-            school_row = total_rows["학교지정"]
-            student_row = total_rows["학생선택"]
+            final_actual = read_row_numbers(ws_all_v, merge_all, final_row, sem_cols)
             
-            # 학교 지정과 학생 선택의 기댓값이 이미 위에서 계산되었는지 확인
-            # 만약 총교과 검증을 거치지 않았다면 여기서 계산
-            if 'school_expected_all' not in locals() or 'student_expected_all' not in locals():
-                school_expected_all = {}
-                student_expected_all = {}
-                
-                # 학교 지정 과목 기댓값 계산
-                for col_letter in sem_cols:
-                    expected_sum = 0.0
-                    processed_merges = set()
-                    
-                    for rr in range(first_row, school_row):
-                        if rr in exempt_rows:
-                            continue
-                        
-                        # 병합 셀 확인
-                        key = (rr, col_letter)
-                        if key in merge_all:
-                            min_row, _, max_row, _ = merge_all[key]
-                            merge_key = (min_row, max_row, col_letter)
-                            if merge_key in processed_merges:
-                                continue
-                            processed_merges.add(merge_key)
-                        
-                        val, _, _ = get_value_with_merge(ws_all_v, ws_all_f, merge_all, rr, col_letter)
-                        num = to_number(val)
-                        if num is not None:
-                            expected_sum += num
-                    school_expected_all[col_letter] = expected_sum
-                
-                # 학생 선택 과목 기댓값 계산 (증배 제외)
-                for col_letter in sem_cols:
-                    expected_sum = 0.0
-                    processed_merges = set()
-                    
-                    for rr in range(school_row + 1, student_row):
-                        if rr in exempt_rows:
-                            continue
-                        
-                        # 증배 확인 (A열)
-                        a_val, _, _ = get_value_with_merge(ws_all_v, ws_all_f, merge_all, rr, 1)
-                        if a_val and "증배" in str(a_val):
-                            continue
-                        
-                        # 병합 셀 확인
-                        key = (rr, col_letter)
-                        if key in merge_all:
-                            min_row, _, max_row, _ = merge_all[key]
-                            merge_key = (min_row, max_row, col_letter)
-                            if merge_key in processed_merges:
-                                continue
-                            processed_merges.add(merge_key)
-                        
-                        val, _, _ = get_value_with_merge(ws_all_v, ws_all_f, merge_all, rr, col_letter)
-                        num = to_number(val)
-                        if num is not None:
-                            expected_sum += num
-                    student_expected_all[col_letter] = expected_sum
-            
-            # 편성 학점 수 = 총 교과 기댓값 + 창의적(3)
-            for col_letter in sem_cols:
-                total_expected = school_expected_all.get(col_letter, 0.0) + student_expected_all.get(col_letter, 0.0)
-                expected_sum = total_expected + 3.0
-                
-                actual_val, _, _ = get_value_with_merge(ws_all_v, ws_all_f, merge_all, final_row, col_letter)
-                actual_num = to_number(actual_val)
-                
-                if actual_num is not None and abs(actual_num - expected_sum) > EPS:
-                    col_name = chr(64 + col_letter)
-                    issues.append({
-                        "severity": "ERROR",
-                        "sheet": all_grades_sheet,
-                        "row": final_row,
-                        "message": f"편성 학점 수 {col_name}열 합계 오류: 셀값={actual_num:g}, 기대값(총교과+창의적)={expected_sum:g}"
-                    })
+            for col_letter, actual_num, expected_sum in find_column_mismatches(final_actual, subject_expected_all, sem_cols, offset=3.0):
+                col_name = COL_NAMES[col_letter - 1]
+                total_row_issues.append(("ERROR", final_row, "final_col", col_name, actual_num, expected_sum))
+
+        issues.extend(render_total_row_issue(all_grades_sheet, raw) for raw in total_row_issues)
 
     # =========================
     # 4. '2026 전학년' 시트 증배 과목 검증
@@ -1770,7 +1783,7 @@ def check_all_grades_sheet(wb_v, wb_f, targets, issues, hidden=None, vocational_
     # 마지막 행 찾기 (이미 위에서 찾았지만, 다시 확인)
     if last_row is None:
         for rr in range(ws_all_f.max_row, first_row - 1, -1):
-            v, _, _ = get_value_with_merge(ws_all_v, ws_all_f, merge_all, rr, course_col)
+            v = get_merged_value(ws_all_v, merge_all, rr, course_col)
             if v is not None and str(v).strip() != "":
                 last_row = rr
                 break
@@ -1800,14 +1813,14 @@ def check_all_grades_sheet(wb_v, wb_f, targets, issues, hidden=None, vocational_
             processed_a_merges.add(merge_key)
             
             # 병합된 영역의 최상단 행에서 '증배' 확인
-            a_col_value, _, _ = get_value_with_merge(ws_all_v, ws_all_f, merge_all, min_row, 1)
+            a_col_value = get_merged_value(ws_all_v, merge_all, min_row, 1)
             
             if a_col_value and '증배' in str(a_col_value):
                 # 병합된 모든 행을 검증 대상에 추가
                 rows_to_check = list(range(min_row, max_row + 1))
         else:
             # 병합되지 않은 경우: 해당 행만 확인
-            a_col_value, _, _ = get_value_with_merge(ws_all_v, ws_all_f, merge_all, rr, 1)
+            a_col_value = get_merged_value(ws_all_v, merge_all, rr, 1)
             if a_col_value and '증배' in str(a_col_value):
                 rows_to_check = [rr]
         
@@ -1817,8 +1830,8 @@ def check_all_grades_sheet(wb_v, wb_f, targets, issues, hidden=None, vocational_
                 continue
             
             # K열(11) 또는 L열(12)에 숫자가 있는지 확인
-            k_val, _, _ = get_value_with_merge(ws_all_v, ws_all_f, merge_all, check_row, 11)  # K열
-            l_val, _, _ = get_value_with_merge(ws_all_v, ws_all_f, merge_all, check_row, 12)  # L열
+            k_val = get_merged_value(ws_all_v, merge_all, check_row, 11)  # K열
+            l_val = get_merged_value(ws_all_v, merge_all, check_row, 12)  # L열
             
             if to_number(k_val) is not None or to_number(l_val) is not None:
                 continue  # K 또는 L열에 숫자가 있으면 검증 제외
@@ -1829,7 +1842,7 @@ def check_all_grades_sheet(wb_v, wb_f, targets, issues, hidden=None, vocational_
     # 각 증배 행에 대해 검증 수행
     for rr in jeungbae_rows:
         # 과목명 읽기
-        course_raw, _, _ = get_value_with_merge(ws_all_v, ws_all_f, merge_all, rr, course_col)
+        course_raw = get_merged_value(ws_all_v, merge_all, rr, course_col)
         if course_raw is None or str(course_raw).strip() == "":
             continue
         
@@ -1908,7 +1921,7 @@ def check_all_grades_sheet(wb_v, wb_f, targets, issues, hidden=None, vocational_
         if hidden_rec is not None:
             # 유형 검증 (C열)
             type_col = 3
-            typ_v, _, _ = get_value_with_merge(ws_all_v, ws_all_f, merge_all, rr, type_col)
+            typ_v = get_merged_value(ws_all_v, merge_all, rr, type_col)
             typ_s = safe_strip(typ_v)
             if typ_s == "":
                 issues.append({"severity": "ERROR", "sheet": all_grades_sheet, "row": rr, "message": f"유형(C{rr})이 비어 있습니다. (지침: {hidden_rec['type']})"})
@@ -1930,7 +1943,7 @@ def check_all_grades_sheet(wb_v, wb_f, targets, issues, hidden=None, vocational_
             
             # 성적처리 확인 문구 (O열)
             grading_col = 15
-            grade_v, _, _ = get_value_with_merge(ws_all_v, ws_all_f, merge_all, rr, grading_col)
+            grade_v = get_merged_value(ws_all_v, merge_all, rr, grading_col)
             grade_s = safe_strip(grade_v)
             if hidden_rec["grading"]:
                 issues.append({
@@ -1950,7 +1963,7 @@ def check_all_grades_sheet(wb_v, wb_f, targets, issues, hidden=None, vocational_
         sem_sum = 0.0
         any_num = False
         for cc in sem_cols:
-            v, _, _ = get_value_with_merge(ws_all_v, ws_all_f, merge_all, rr, cc)
+            v = get_merged_value(ws_all_v, merge_all, rr, cc)
             n = to_number(v)
             if n is not None:
                 sem_sum += n
@@ -1977,7 +1990,7 @@ def check_all_grades_sheet(wb_v, wb_f, targets, issues, hidden=None, vocational_
                 for search_row in range(rr - 1, first_row - 1, -1):
                     row_has_number = False
                     for cc in sem_cols:
-                        v, _, _ = get_value_with_merge(ws_all_v, ws_all_f, merge_all, search_row, cc)
+                        v = get_merged_value(ws_all_v, merge_all, search_row, cc)
                         n = to_number(v)
                         if n is not None and abs(n) > EPS:
                             row_has_number = True
@@ -1989,7 +2002,7 @@ def check_all_grades_sheet(wb_v, wb_f, targets, issues, hidden=None, vocational_
                 
                 if nearest_row is not None:
                     for cc in sem_cols:
-                        v, _, _ = get_value_with_merge(ws_all_v, ws_all_f, merge_all, nearest_row, cc)
+                        v = get_merged_value(ws_all_v, merge_all, nearest_row, cc)
                         n = to_number(v)
                         if n is not None:
                             nearest_sum += n
@@ -2013,12 +2026,12 @@ def check_all_grades_sheet(wb_v, wb_f, targets, issues, hidden=None, vocational_
         # 합계 열 검증 (M열 또는 N열)
         total_cols = [13, 14]  # M, N열
         for total_col in total_cols:
-            total_v, _, _ = get_value_with_merge(ws_all_v, ws_all_f, merge_all, rr, total_col)
+            total_v = get_merged_value(ws_all_v, merge_all, rr, total_col)
             total_n = to_number(total_v)
             
             if total_n is not None and op_n is not None:
                 if abs(total_n - op_n) > EPS:
-                    col_name = chr(64 + total_col)  # M 또는 N
+                    col_name = COL_NAMES[total_col - 1]  # M 또는 N
                     issues.append({
                         "severity": "ERROR",
                         "sheet": all_grades_sheet,
@@ -2027,7 +2040,7 @@ def check_all_grades_sheet(wb_v, wb_f, targets, issues, hidden=None, vocational_
                     })
 
 
-def check_school_name_consistency(wb_v, wb_f, targets, issues):
+def check_school_name_consistency(wb_v, wb_f, targets, issues, merge_cache=None):
     """
     모든 시트의 2행에서 학교명이 올바르게 입력되었는지 확인
     - 'OO고등학교'로 되어 있으면 오류
@@ -2053,12 +2066,12 @@ def check_school_name_consistency(wb_v, wb_f, targets, issues):
     for sname in sheets_to_check:
         ws_v = wb_v[sname]
         ws_f = wb_f[sname]
-        merge_lookup = build_merged_lookup(ws_f)
+        merge_lookup = get_merged_lookup(ws_f, merge_cache)
         
         # 2행의 학교명 찾기 (보통 병합된 셀에 있음)
         school_name = None
         for col in range(1, ws_f.max_column + 1):
-            val, _, _ = get_value_with_merge(ws_v, ws_f, merge_lookup, 2, col)
+            val = get_merged_value(ws_v, merge_lookup, 2, col)
             if val and isinstance(val, str):
                 val_str = str(val).strip()
                 # 학교명으로 추정되는 패턴: "고등학교" 포함
@@ -2157,8 +2170,19 @@ def run_checks(xlsx_path: str):
 
     try:
         wb_v = load_workbook(xlsx_path, data_only=True)
+    except Exception as e:
+        return ([{"severity": "ERROR", "sheet": "-", "row": "-", "message": f"엑셀 파일을 열 수 없습니다: {e}"}], {})
+
+    # 구글 스프레드시트 다운로드(네트워크 대기)는 엑셀 파일이 열리는 것을 확인한 뒤
+    # 수식 워크북 로드와 겹치도록 백그라운드로 시작
+    executor = ThreadPoolExecutor(max_workers=1)
+    google_future = executor.submit(load_reference_sheets_from_google)
+    executor.shutdown(wait=False)
+
+    try:
         wb_f = load_workbook(xlsx_path, data_only=False)
     except Exception as e:
+        google_future.cancel()  # 아직 시작 전이면 취소, 이미 받는 중이면 결과를 쓰지 않음
         return ([{"severity": "ERROR", "sheet": "-", "row": "-", "message": f"엑셀 파일을 열 수 없습니다: {e}"}], {})
 
     sheetnames = wb_v.sheetnames
@@ -2177,7 +2201,7 @@ def run_checks(xlsx_path: str):
     # ========================================
     
     # 1단계: 구글 스프레드시트에서 가져오기 시도
-    ref_wb_v, ref_wb_f, google_success, google_error = load_reference_sheets_from_google()
+    ref_wb_v, ref_wb_f, google_success, google_error = google_future.result()
     
     if google_success:
         # 구글에서 성공적으로 가져옴
@@ -2216,26 +2240,27 @@ def run_checks(xlsx_path: str):
     ws_hidden_v = ref_wb_v[hidden_name]
     ws_hidden_f = ref_wb_f[hidden_name]
     hidden_merge = build_merged_lookup(ws_hidden_f)
-    header_row = find_hidden_header_row(ws_hidden_v, ws_hidden_f, hidden_merge)
+    header_row = find_hidden_header_row(ws_hidden_v, hidden_merge)
     data_start = header_row + 1
 
-    # 숨김 과목 사전 구축
+    # 숨김 과목 사전 구축 (A~I열을 한 번에 읽어 행 단위로 처리)
     hidden = {}
     hidden_list_norm = []
-    r = data_start
-    while True:
-        course_raw, _, _ = get_value_with_merge(ws_hidden_v, ws_hidden_f, hidden_merge, r, 2)  # B
+    # B열(과목명)이 처음 비는 행에서 멈추므로 그 아래 행은 읽지 않는다
+    hidden_rows = read_sheet_values(ws_hidden_v, hidden_merge, data_start, 9)
+    for r, row in enumerate(hidden_rows, start=data_start):
+        course_raw = row[1]  # B
         if course_raw is None or str(course_raw).strip() == "":
             break
         course_norm = normalize_course_name(course_raw)
 
-        subject_group, _, _ = get_value_with_merge(ws_hidden_v, ws_hidden_f, hidden_merge, r, 1)  # A: 교과(군)
-        typ, _, _ = get_value_with_merge(ws_hidden_v, ws_hidden_f, hidden_merge, r, 3)  # C
-        basic, _, _ = get_value_with_merge(ws_hidden_v, ws_hidden_f, hidden_merge, r, 4)  # D
-        grade, _, _ = get_value_with_merge(ws_hidden_v, ws_hidden_f, hidden_merge, r, 5)  # E
-        minc, _, _ = get_value_with_merge(ws_hidden_v, ws_hidden_f, hidden_merge, r, 6)  # F
-        maxc, _, _ = get_value_with_merge(ws_hidden_v, ws_hidden_f, hidden_merge, r, 7)  # G
-        special_note, _, _ = get_value_with_merge(ws_hidden_v, ws_hidden_f, hidden_merge, r, 9)  # I
+        subject_group = row[0]  # A: 교과(군)
+        typ = row[2]  # C
+        basic = row[3]  # D
+        grade = row[4]  # E
+        minc = row[5]  # F
+        maxc = row[6]  # G
+        special_note = row[8]  # I
 
         rec = {
             "course_raw": safe_strip(course_raw),
@@ -2260,8 +2285,6 @@ def run_checks(xlsx_path: str):
             hidden[course_norm] = rec
             hidden_list_norm.append(course_norm)
 
-        r += 1
-
     summary["targets"] = targets
     summary["hidden_sheet"] = hidden_name
     summary["hidden_course_count"] = len(hidden)
@@ -2280,8 +2303,8 @@ def run_checks(xlsx_path: str):
             voc_merge = build_merged_lookup(ws_voc_f)
             
             # C열에서 과목명 읽기 (헤더 행은 1~3 사이로 가정, 데이터는 그 이후부터)
-            for rr in range(2, ws_voc_f.max_row + 1):
-                course_v, _, _ = get_value_with_merge(ws_voc_v, ws_voc_f, voc_merge, rr, 3)  # C열
+            for row in read_sheet_values(ws_voc_v, voc_merge, 2, 3, max_row=ws_voc_f.max_row):
+                course_v = row[2]  # C열
                 if course_v and str(course_v).strip():
                     course_normalized = normalize_course_name(course_v)
                     if course_normalized:
@@ -2308,8 +2331,8 @@ def run_checks(xlsx_path: str):
             new_merge = build_merged_lookup(ws_new_f)
             
             # B열에서 과목명 읽기 (헤더 행은 1~3 사이로 가정, 데이터는 그 이후부터)
-            for rr in range(2, ws_new_f.max_row + 1):
-                course_v, _, _ = get_value_with_merge(ws_new_v, ws_new_f, new_merge, rr, 2)  # B열
+            for row in read_sheet_values(ws_new_v, new_merge, 2, 2, max_row=ws_new_f.max_row):
+                course_v = row[1]  # B열
                 if course_v and str(course_v).strip():
                     course_normalized = normalize_course_name(course_v)
                     if course_normalized:
@@ -2327,10 +2350,12 @@ def run_checks(xlsx_path: str):
     # =========================
     # (2) 각 시트 검사
     # =========================
+    # 시트별 병합 정보는 (9) 전학년 / (10) 학교명 검증에서도 다시 쓰므로 한 번만 만든다
+    merge_cache = {}
     for year, sname in targets.items():
         ws_v = wb_v[sname]
         ws_f = wb_f[sname]
-        merge_lookup = build_merged_lookup(ws_f)
+        merge_lookup = get_merged_lookup(ws_f, merge_cache)
 
         first_row = 5
         subject_group_col = 2  # B: 교과(군)
@@ -2361,7 +2386,7 @@ def run_checks(xlsx_path: str):
         # last row 찾기: '편성 학점 수' 또는 '편성학점수'가 포함된 행
         last_row = None
         for rr in range(first_row, ws_f.max_row + 1):
-            v, _, _ = get_value_with_merge(ws_v, ws_f, merge_lookup, rr, course_col)
+            v = get_merged_value(ws_v, merge_lookup, rr, course_col)
             if v is not None:
                 v_str = str(v).strip().replace(" ", "")
                 if "편성학점수" in v_str or "편성학점합계" in v_str:
@@ -2394,7 +2419,7 @@ def run_checks(xlsx_path: str):
         a_col = 1 if year in [2026, 2025] else 2  # A열 또는 B열
         found_jeungbae = False
         for rr in range(first_row, check_until_row + 1):
-            a_val, _, _ = get_value_with_merge(ws_v, ws_f, merge_lookup, rr, a_col)
+            a_val = get_merged_value(ws_v, merge_lookup, rr, a_col)
             if a_val and "증배" in str(a_val):
                 found_jeungbae = True
                 break
@@ -2413,7 +2438,7 @@ def run_checks(xlsx_path: str):
         # 총계/합계 행은 모든 검사 제외 (D열 내용 기준)
         exempt_rows = set()
         for rr in range(first_row, check_until_row + 1):
-            course_v, _, _ = get_value_with_merge(ws_v, ws_f, merge_lookup, rr, course_col)
+            course_v = get_merged_value(ws_v, merge_lookup, rr, course_col)
             if course_v:
                 course_str = str(course_v).strip().replace(" ", "")
                 # 총계 관련 키워드가 있으면 제외
@@ -2423,12 +2448,20 @@ def run_checks(xlsx_path: str):
                     exempt_rows.add(rr)
 
         # row_total(각 행의 G~L 합) 계산 (총계 행만 제외, 색깔행은 포함)
+        # 학기 열 셀 숫자값은 sem_numbers에 남겨 총계 행 검증(8)에서 다시 읽지 않도록 한다
         row_total = {}
+        sem_numbers = {}
+        # 학기 열 구간은 iter_rows로 한 번에 읽고, 병합 셀만 get_value_with_merge로 top-left 값을 가져온다
+        sem_row_values = dict(enumerate(
+            ws_v.iter_rows(min_row=first_row, max_row=check_until_row,
+                           min_col=sem_cols[0], max_col=sem_cols[-1], values_only=True),
+            start=first_row
+        ))
         for rr in range(first_row, check_until_row + 1):
             if rr in exempt_rows:
                 continue  # 총계 행만 제외
 
-            course_v, _, _ = get_value_with_merge(ws_v, ws_f, merge_lookup, rr, course_col)
+            course_v = get_merged_value(ws_v, merge_lookup, rr, course_col)
             if course_v is None or str(course_v).strip() == "":
                 continue
 
@@ -2438,15 +2471,22 @@ def run_checks(xlsx_path: str):
 
             sem_sum = 0.0
             any_num = False
-            for cc in sem_cols:
-                v, _, _ = get_value_with_merge(ws_v, ws_f, merge_lookup, rr, cc)
-                n = to_number(v)
+            row_values = sem_row_values[rr]
+            for i, cc in enumerate(sem_cols):
+                if (rr, cc) in merge_lookup:
+                    v = get_merged_value(ws_v, merge_lookup, rr, cc)
+                else:
+                    v = row_values[i]
+                n = sem_numbers[(rr, cc)] = to_number(v)
                 if n is not None:
                     sem_sum += n
                     any_num = True
 
             row_total[rr] = sem_sum if any_num else 0.0
 
+        # row_total 누적합 (구간 합계 기대값을 행 반복 없이 계산)
+        row_total_prefix = build_prefix_sums(row_total, first_row, check_until_row)
+
         # ========== 과목 단위 검사 ==========
         for rr in range(first_row, check_until_row + 1):
             # 모든 연도에서 색깔행도 기본학점/운영학점 검증에 포함
@@ -2454,7 +2494,7 @@ def run_checks(xlsx_path: str):
             if rr in exempt_rows:
                 continue  # 총계 행은 제외
 
-            course_raw, _, _ = get_value_with_merge(ws_v, ws_f, merge_lookup, rr, course_col)
+            course_raw = get_merged_value(ws_v, merge_lookup, rr, course_col)
             if course_raw is None or str(course_raw).strip() == "":
                 continue
             if is_error_token(course_raw):
@@ -2536,7 +2576,7 @@ def run_checks(xlsx_path: str):
                                 
                                 # 교과(군) 비교 (2025/2026만, '증배' 제외)
                                 if hidden_rec and year in (2025, 2026):
-                                    sheet_subject_group, _, _ = get_value_with_merge(ws_v, ws_f, merge_lookup, rr, subject_group_col)
+                                    sheet_subject_group = get_merged_value(ws_v, merge_lookup, rr, subject_group_col)
                                     sheet_subject_group_str = safe_strip(sheet_subject_group)
                                     hidden_subject_group_str = hidden_rec.get("subject_group", "")
                                     
@@ -2597,7 +2637,7 @@ def run_checks(xlsx_path: str):
                         
                         # 교과(군) 비교 (2025/2026만, '증배' 제외)
                         if hidden_rec and year in (2025, 2026):
-                            sheet_subject_group, _, _ = get_value_with_merge(ws_v, ws_f, merge_lookup, rr, subject_group_col)
+                            sheet_subject_group = get_merged_value(ws_v, merge_lookup, rr, subject_group_col)
                             sheet_subject_group_str = safe_strip(sheet_subject_group)
                             hidden_subject_group_str = hidden_rec.get("subject_group", "")
                             
@@ -2628,7 +2668,7 @@ def run_checks(xlsx_path: str):
 
             # (3) 유형/기본학점/성적처리 (숨김 매칭이 있을 때만)
             if hidden_rec is not None:
-                typ_v, _, _ = get_value_with_merge(ws_v, ws_f, merge_lookup, rr, type_col)
+                typ_v = get_merged_value(ws_v, merge_lookup, rr, type_col)
                 typ_s = safe_strip(typ_v)
                 if typ_s == "":
                     issues.append({"severity": "ERROR", "sheet": sname, "row": rr, "message": f"유형(C{rr})이 비어 있습니다. (지침: {hidden_rec['type']})"})
@@ -2646,7 +2686,7 @@ def run_checks(xlsx_path: str):
                     if hidden_rec["basic"] is not None and abs(basic_n - hidden_rec["basic"]) > EPS:
                         issues.append({"severity": "ERROR", "sheet": sname, "row": rr, "message": f"기본학점 불일치: 시트={basic_n:g} / 지침={hidden_rec['basic']:g}"})
 
-                grade_v, _, _ = get_value_with_merge(ws_v, ws_f, merge_lookup, rr, grading_col)
+                grade_v = get_merged_value(ws_v, merge_lookup, rr, grading_col)
                 grade_s = safe_strip(grade_v)
                 if grade_s == "":
                     issues.append({"severity": "ERROR", "sheet": sname, "row": rr, "message": f"성적처리 유형(O{rr})이 비어 있습니다. (지침: {hidden_rec['grading']})"})
@@ -2683,7 +2723,7 @@ def run_checks(xlsx_path: str):
                     for search_row in range(rr - 1, first_row - 1, -1):
                         row_has_number = False
                         for cc in sem_cols:
-                            v, _, _ = get_value_with_merge(ws_v, ws_f, merge_lookup, search_row, cc)
+                            v = get_merged_value(ws_v, merge_lookup, search_row, cc)
                             n = to_number(v)
                             if n is not None and abs(n) > EPS:
                                 row_has_number = True
@@ -2696,7 +2736,7 @@ def run_checks(xlsx_path: str):
                     # 가장 가까운 행이 발견되면, 그 행의 모든 학기 열 값을 합산
                     if nearest_row is not None:
                         for cc in sem_cols:
-                            v, _, _ = get_value_with_merge(ws_v, ws_f, merge_lookup, nearest_row, cc)
+                            v = get_merged_value(ws_v, merge_lookup, nearest_row, cc)
                             n = to_number(v)
                             if n is not None:
                                 nearest_sum += n
@@ -2722,70 +2762,63 @@ def run_checks(xlsx_path: str):
                             issues.append({"severity": "ERROR", "sheet": sname, "row": rr, "message": f"학기 편성 학점의 합({sem_sum:g})과 운영학점({op_n:g})이 다릅니다."})
 
         # (6) 합계 열 병합 구간 합계 체크 (색깔 행은 기대값에서도 제외)
-        checked_spans = set()
+        # 구간 합계에 반영할 행을 미리 계산: 학기 열에서 처음 만나는 병합 셀의 첫 행이거나 병합이 없는 행만 합산
+        contributing_total = {}
+        for rr, rt in row_total.items():
+            anchor_row = rr
+            for sem_col in sem_cols:
+                span = merge_lookup.get((rr, sem_col))
+                if span is not None:
+                    anchor_row = span[0]
+                    break
+            if anchor_row == rr:
+                contributing_total[rr] = rt
+
+        # 병합 범위는 한 번만 순회하여 (6)/(7)에서 쓰는 열 조합별로 나눠 둔다 (원래 순서 유지)
+        total_col_merges = []    # 합계 열 단일 열 병합
+        total_pair_merges = []   # 합계 두 열(M~N / N~O)이 함께 병합
+        compare_col_merges = []  # 비교 열(A/B)을 포함하는 병합
         for rng in ws_f.merged_cells.ranges:
             if rng.min_col in total_cols and rng.max_col == rng.min_col:
-                col = rng.min_col
-                if rng.max_row < first_row:
-                    continue
-                start = max(rng.min_row, first_row)
-                end = min(rng.max_row, check_until_row)
-                if start > end:
-                    continue
+                total_col_merges.append(rng)
+            if rng.min_col == total_cols[0] and rng.max_col == total_cols[1]:
+                total_pair_merges.append(rng)
+            if rng.min_col <= compare_col <= rng.max_col:
+                compare_col_merges.append(rng)
 
-                key = (col, rng.min_row, rng.max_row)
-                if key in checked_spans:
-                    continue
-                checked_spans.add(key)
+        checked_spans = set()
+        for rng in total_col_merges:
+            col = rng.min_col
+            if rng.max_row < first_row:
+                continue
+            start = max(rng.min_row, first_row)
+            end = min(rng.max_row, check_until_row)
+            if start > end:
+                continue
 
-                total_v, total_formula, _ = get_value_with_merge(ws_v, ws_f, merge_lookup, rng.min_row, col)
-                total_n = to_number(total_v)
+            key = (col, rng.min_row, rng.max_row)
+            if key in checked_spans:
+                continue
+            checked_spans.add(key)
 
-                expected = 0.0
-                processed_merges = set()  # 이미 처리한 병합 영역 추적
-                for rr in range(start, end + 1):
-                    if rr in exempt_rows:
-                        continue
-                    cv, _, _ = get_value_with_merge(ws_v, ws_f, merge_lookup, rr, course_col)
-                    if cv is None or str(cv).strip() == "" or is_error_token(cv):
-                        continue
-                    
-                    # 병합 셀 확인: sem_cols(학기별 열)에 병합이 있는지 확인
-                    # 병합된 셀의 경우 첫 번째 행만 합산
-                    should_skip = False
-                    for sem_col in sem_cols:
-                        key = (rr, sem_col)
-                        if key in merge_lookup:
-                            min_row, _, max_row, _ = merge_lookup[key]
-                            merge_key = (min_row, max_row, sem_col)
-                            # 이미 처리한 병합 영역이면 건너뛰기
-                            if merge_key in processed_merges:
-                                should_skip = True
-                                break
-                            # 병합 영역의 첫 번째 행이 아니면 건너뛰기
-                            if rr != min_row:
-                                should_skip = True
-                                break
-                            # 첫 번째 행이면 병합 영역을 추적에 추가
-                            processed_merges.add(merge_key)
-                            break
-                    
-                    if should_skip:
-                        continue
-                    
-                    expected += row_total.get(rr, 0.0)
+            total_v, total_formula, _ = get_value_with_merge(ws_v, ws_f, merge_lookup, rng.min_row, col)
+            total_n = to_number(total_v)
 
-                # 열 이름 결정
-                col_name = total_cols_name.split('/')[0] if col == total_cols[0] else total_cols_name.split('/')[1]
-                
-                if total_n is None:
-                    if total_formula:
-                        issues.append({"severity": "WARNING", "sheet": sname, "row": rng.min_row, "message": f"{col_name}열 합계 셀에 수식은 있으나 결과값이 없습니다(엑셀 재계산/저장 필요). (수식: {total_formula})"})
-                    else:
-                        issues.append({"severity": "WARNING", "sheet": sname, "row": rng.min_row, "message": f"{col_name}열 합계 셀이 비어 있습니다. (해당 구간 {sem_cols_name} 합 기대값={expected:g})"})
+            expected = 0.0
+            for rr in range(start, end + 1):
+                expected += contributing_total.get(rr, 0.0)
+
+            # 열 이름 결정
+            col_name = total_cols_name.split('/')[0] if col == total_cols[0] else total_cols_name.split('/')[1]
+            
+            if total_n is None:
+                if total_formula:
+                    issues.append({"severity": "WARNING", "sheet": sname, "row": rng.min_row, "message": f"{col_name}열 합계 셀에 수식은 있으나 결과값이 없습니다(엑셀 재계산/저장 필요). (수식: {total_formula})"})
                 else:
-                    if abs(total_n - expected) > EPS:
-                        issues.append({"severity": "ERROR", "sheet": sname, "row": rng.min_row, "message": f"{col_name}열 합계 불일치: 셀값={total_n:g}, 기대값({sem_cols_name}합)={expected:g} (구간 {start}~{end}행)"})
+                    issues.append({"severity": "WARNING", "sheet": sname, "row": rng.min_row, "message": f"{col_name}열 합계 셀이 비어 있습니다. (해당 구간 {sem_cols_name} 합 기대값={expected:g})"})
+            else:
+                if abs(total_n - expected) > EPS:
+                    issues.append({"severity": "ERROR", "sheet": sname, "row": rng.min_row, "message": f"{col_name}열 합계 불일치: 셀값={total_n:g}, 기대값({sem_cols_name}합)={expected:g} (구간 {start}~{end}행)"})
 
         # 병합이 아닌 단일 셀 합계 보조 체크(색깔행 제외)
         for col in total_cols:
@@ -2798,12 +2831,12 @@ def run_checks(xlsx_path: str):
                         continue
                     continue
 
-                tv, _, _ = get_value_with_merge(ws_v, ws_f, merge_lookup, rr, col)
+                tv = get_merged_value(ws_v, merge_lookup, rr, col)
                 tn = to_number(tv)
                 if tn is None:
                     continue
 
-                cv, _, _ = get_value_with_merge(ws_v, ws_f, merge_lookup, rr, course_col)
+                cv = get_merged_value(ws_v, merge_lookup, rr, course_col)
                 if cv is None or str(cv).strip() == "" or is_error_token(cv):
                     continue
 
@@ -2821,7 +2854,7 @@ def run_checks(xlsx_path: str):
         # A열에서 '학생 지정 과목 교과 편성 학점' 또는 '학교 지정 과목 교과 편성 학점' 찾기 (첫 행부터)
         # 더 넓은 검색 조건: "지정", "과목", "교과", "편성", "학점"이 모두 포함되면 찾음
         for rr in range(1, ws_f.max_row + 1):
-            v, _, _ = get_value_with_merge(ws_v, ws_f, merge_lookup, rr, 1)  # A열
+            v = get_merged_value(ws_v, merge_lookup, rr, 1)  # A열
             if v is not None:
                 v_str = str(v).strip().replace(" ", "")
                 # "지정"과 "편성학점"이 포함되어 있으면 해당 행으로 간주
@@ -2832,7 +2865,7 @@ def run_checks(xlsx_path: str):
         # '학교 선택 과목 교과' 찾기 (학생 지정 이후부터)
         if total_section_start is not None:
             for rr in range(total_section_start + 1, ws_f.max_row + 1):
-                v, _, _ = get_value_with_merge(ws_v, ws_f, merge_lookup, rr, 1)  # A열
+                v = get_merged_value(ws_v, merge_lookup, rr, 1)  # A열
                 if v is not None:
                     v_str = str(v).strip().replace(" ", "")
                     if "학교선택과목교과" in v_str:
@@ -2848,99 +2881,92 @@ def run_checks(xlsx_path: str):
             # 2024: B열, 2025/2026: A열
             # 해당 열만 병합된 경우와 여러 열이 함께 병합된 경우 모두 수집
             a_col_merge_map = {}  # {row: (min_row, max_row)}
-            for rng in ws_f.merged_cells.ranges:
-                # compare_col을 포함하는 병합
-                if rng.min_col <= compare_col and rng.max_col >= compare_col:
-                    # 총계 구간과 겹치는 병합만 수집
-                    if not (rng.max_row < total_section_start or rng.min_row > total_section_end):
-                        for r in range(rng.min_row, rng.max_row + 1):
-                            a_col_merge_map[r] = (rng.min_row, rng.max_row)
+            for rng in compare_col_merges:
+                # 총계 구간과 겹치는 병합만 수집
+                if not (rng.max_row < total_section_start or rng.min_row > total_section_end):
+                    for r in range(rng.min_row, rng.max_row + 1):
+                        a_col_merge_map[r] = (rng.min_row, rng.max_row)
             
             
             # 총계 열 병합 정보 수집 및 비교 열과 비교
             # 2024: N~O 병합과 B열 비교, 2025/2026: M~N 병합과 A열 비교
-            for rng in ws_f.merged_cells.ranges:
-                # M열과 N열이 함께 병합된 경우 (min_col=M, max_col=N)
-                if rng.min_col == total_cols[0] and rng.max_col == total_cols[1]:
-                    # 총계 구간과 겹치는 병합만 검사
-                    if not (rng.max_row < total_section_start or rng.min_row > total_section_end):
-                        merge_start = rng.min_row
-                        merge_end = rng.max_row
-                        
-                        # 비교 열(2024:B열, 2025/2026:A열)과 D열 값 확인 - 특정 키워드 포함 시 검사 제외
-                        compare_col_val, _, _ = get_value_with_merge(ws_v, ws_f, merge_lookup, merge_start, compare_col)
-                        d_col_val, _, _ = get_value_with_merge(ws_v, ws_f, merge_lookup, merge_start, 4)  # D열
-                        skip_check = False
-                        
-                        # 비교 열 체크
-                        if compare_col_val is not None:
-                            compare_col_str = str(compare_col_val).strip()
-                            compare_col_str_no_space = compare_col_str.replace(" ", "")
-                            # '학교/학생 지정 과목 편성' 또는 '증배' 포함 시 제외
-                            if "학교지정과목편성" in compare_col_str_no_space or "학생지정과목편성" in compare_col_str_no_space or "증배" in compare_col_str:
-                                skip_check = True
-                        
-                        # D열 체크 - 총계 행 제외
-                        if d_col_val is not None and not skip_check:
-                            d_col_str = str(d_col_val).strip().replace(" ", "")
-                            # 총계 관련 키워드가 있으면 제외
-                            if "편성학점" in d_col_str or "총교과" in d_col_str or "창의적체험활동" in d_col_str or "편성학점수" in d_col_str:
-                                skip_check = True
-                        
-                        if skip_check:
-                            continue  # 이 병합 구간은 검사하지 않음 (병합 불일치도, 합계도 검사 안함)
-                        
-                        # 총계 열 병합 범위 내의 모든 행이 같은 비교 열 병합에 속하는지 확인
-                        compare_merge_range = None
-                        mismatch = False
-                        
-                        for r in range(merge_start, merge_end + 1):
-                            if r in a_col_merge_map:
-                                current_range = a_col_merge_map[r]
-                                if compare_merge_range is None:
-                                    compare_merge_range = current_range
-                                elif compare_merge_range != current_range:
-                                    # 다른 비교 열 병합 범위에 걸쳐있음
-                                    mismatch = True
-                                    break
-                            else:
-                                # 비교 열이 병합되지 않은 행
+            # M열과 N열이 함께 병합된 경우 (min_col=M, max_col=N)
+            for rng in total_pair_merges:
+                # 총계 구간과 겹치는 병합만 검사
+                if not (rng.max_row < total_section_start or rng.min_row > total_section_end):
+                    merge_start = rng.min_row
+                    merge_end = rng.max_row
+                    
+                    # 비교 열(2024:B열, 2025/2026:A열)과 D열 값 확인 - 특정 키워드 포함 시 검사 제외
+                    compare_col_val = get_merged_value(ws_v, merge_lookup, merge_start, compare_col)
+                    d_col_val = get_merged_value(ws_v, merge_lookup, merge_start, 4)  # D열
+                    skip_check = False
+                    
+                    # 비교 열 체크
+                    if compare_col_val is not None:
+                        compare_col_str = str(compare_col_val).strip()
+                        compare_col_str_no_space = compare_col_str.replace(" ", "")
+                        # '학교/학생 지정 과목 편성' 또는 '증배' 포함 시 제외
+                        if "학교지정과목편성" in compare_col_str_no_space or "학생지정과목편성" in compare_col_str_no_space or "증배" in compare_col_str:
+                            skip_check = True
+                    
+                    # D열 체크 - 총계 행 제외
+                    if d_col_val is not None and not skip_check:
+                        d_col_str = str(d_col_val).strip().replace(" ", "")
+                        # 총계 관련 키워드가 있으면 제외
+                        if "편성학점" in d_col_str or "총교과" in d_col_str or "창의적체험활동" in d_col_str or "편성학점수" in d_col_str:
+                            skip_check = True
+                    
+                    if skip_check:
+                        continue  # 이 병합 구간은 검사하지 않음 (병합 불일치도, 합계도 검사 안함)
+                    
+                    # 총계 열 병합 범위 내의 모든 행이 같은 비교 열 병합에 속하는지 확인
+                    compare_merge_range = None
+                    mismatch = False
+                    
+                    for r in range(merge_start, merge_end + 1):
+                        if r in a_col_merge_map:
+                            current_range = a_col_merge_map[r]
+                            if compare_merge_range is None:
+                                compare_merge_range = current_range
+                            elif compare_merge_range != current_range:
+                                # 다른 비교 열 병합 범위에 걸쳐있음
                                 mismatch = True
                                 break
+                        else:
+                            # 비교 열이 병합되지 않은 행
+                            mismatch = True
+                            break
+                    
+                    # 비교 열 병합 범위와 총계 열 병합 범위가 정확히 일치하는지 확인
+                    if mismatch or compare_merge_range is None or compare_merge_range != (merge_start, merge_end):
+                        compare_range_str = f"{compare_merge_range[0]}~{compare_merge_range[1]}" if compare_merge_range else "없음"
+                        compare_col_name = "B" if year == 2024 else "A"
+                        issues.append({
+                            "severity": "ERROR",
+                            "sheet": sname,
+                            "row": merge_start,
+                            "message": f"병합 불일치: {compare_col_name}열 병합({compare_range_str})과 {total_cols_name}열 병합({merge_start}~{merge_end}행)이 일치하지 않습니다."
+                        })
+                    
+                    # 합계 검증 (첫 번째 총계 열 기준: 2024=N열, 2025/2026=M열)
+                    # '증배'나 '학교 지정 과목 편성'은 이미 위에서 skip_check으로 제외됨
+                    total_v, total_formula, _ = get_value_with_merge(ws_v, ws_f, merge_lookup, merge_start, total_cols[0])
+                    total_n = to_number(total_v)
+                    
+                    if total_n is not None:
+                        # 해당 구간의 기대값 계산 (총계 행은 row_total에 없으므로 자동 제외)
+                        expected = range_sum(row_total_prefix, first_row, merge_start, merge_end)
                         
-                        # 비교 열 병합 범위와 총계 열 병합 범위가 정확히 일치하는지 확인
-                        if mismatch or compare_merge_range is None or compare_merge_range != (merge_start, merge_end):
-                            compare_range_str = f"{compare_merge_range[0]}~{compare_merge_range[1]}" if compare_merge_range else "없음"
-                            compare_col_name = "B" if year == 2024 else "A"
+                        if abs(total_n - expected) > EPS:
+                            first_col_name = "N" if year == 2024 else "M"
                             issues.append({
                                 "severity": "ERROR",
                                 "sheet": sname,
                                 "row": merge_start,
-                                "message": f"병합 불일치: {compare_col_name}열 병합({compare_range_str})과 {total_cols_name}열 병합({merge_start}~{merge_end}행)이 일치하지 않습니다."
+                                "message": f"{first_col_name}열 합계 불일치: 셀값={total_n:g}, {sem_cols_name}합={expected:g} (구간 {merge_start}~{merge_end}행)(편성학점 칸이 병합되어 있는지 확인하세요.)"
                             })
-                        
-                        # 합계 검증 (첫 번째 총계 열 기준: 2024=N열, 2025/2026=M열)
-                        # '증배'나 '학교 지정 과목 편성'은 이미 위에서 skip_check으로 제외됨
-                        total_v, total_formula, _ = get_value_with_merge(ws_v, ws_f, merge_lookup, merge_start, total_cols[0])
-                        total_n = to_number(total_v)
-                        
-                        if total_n is not None:
-                            # 해당 구간의 기대값 계산
-                            expected = 0.0
-                            for rr in range(merge_start, merge_end + 1):
-                                if rr in exempt_rows:
-                                    continue
-                                expected += row_total.get(rr, 0.0)
-                            
-                            if abs(total_n - expected) > EPS:
-                                first_col_name = "N" if year == 2024 else "M"
-                                issues.append({
-                                    "severity": "ERROR",
-                                    "sheet": sname,
-                                    "row": merge_start,
-                                    "message": f"{first_col_name}열 합계 불일치: 셀값={total_n:g}, {sem_cols_name}합={expected:g} (구간 {merge_start}~{merge_end}행)(편성학점 칸이 병합되어 있는지 확인하세요.)"
-                                })
-            
+        
         # =========================
         # (8) 총계 행 합계 검증
         # =========================
@@ -2960,7 +2986,7 @@ def run_checks(xlsx_path: str):
         check_col = 1 if year in [2025, 2026] else 2
         
         for rr in range(first_row, ws_f.max_row + 1):
-            col_val, _, _ = get_value_with_merge(ws_v, ws_f, merge_lookup, rr, check_col)
+            col_val = get_merged_value(ws_v, merge_lookup, rr, check_col)
             if col_val:
                 col_str = str(col_val).strip().replace(" ", "")
                 
@@ -2981,141 +3007,78 @@ def run_checks(xlsx_path: str):
                 elif "편성학점수" in col_str and "과목" not in col_str and "교과" not in col_str:
                     total_rows["편성학점수"] = rr
         
+        # 총계 행 검증 결과는 (severity, row, 코드, *인자) 레코드로 모았다가 마지막에 한 번에 변환
+        total_row_issues = []
+
         # 필수 셀 존재 여부 확인
         for key, cell_name in required_cells.items():
             if key not in total_rows:
-                issues.append({
-                    "severity": "ERROR",
-                    "sheet": sname,
-                    "row": "-",
-                    "message": f"총계 부분의 {cell_name} 셀이 존재하지 않습니다. 교육청의 양식을 확인하여 수정하고 다시 검사를 진행해주세요."
-                })
+                total_row_issues.append(("ERROR", "-", "missing_cell", cell_name))
         
+        # 학교 지정 / 학생 선택 구간의 학기 열별 기댓값은 한 번만 계산하여 아래 검증에서 공유
+        # 학교 지정 과목: first_row ~ school_row-1, 학생 선택 과목: school_row+1 ~ student_row-1 (증배 제외)
+        if "학교지정" in total_rows:
+            school_expected, student_expected = sum_total_sections(
+                ws_v, merge_lookup, sem_cols, exempt_rows,
+                first_row, total_rows["학교지정"], total_rows.get("학생선택"),
+                jeungbae_col=compare_col, num_cache=sem_numbers
+            )
+
+        # 총교과 열별 기댓값(학교지정 + 학생선택)과 그 합계는 총교과/편성학점수 검증에서 공유
+        if "학교지정" in total_rows and "학생선택" in total_rows:
+            subject_expected = array("d", [0.0] * len(sem_cols))
+            subject_expected_total = 0.0
+            for col_idx in range(len(sem_cols)):
+                sub = school_expected[col_idx] + student_expected[col_idx]
+                subject_expected[col_idx] = sub
+                subject_expected_total += sub
+
         # 총계 행 검증
         if "학교지정" in total_rows:
             school_row = total_rows["학교지정"]
+            school_actual = read_row_numbers(ws_v, merge_lookup, school_row, sem_cols)
             
-            # 학교 지정 과목: 위의 행들 합계 (first_row ~ school_row-1)
-            for col_idx, col_letter in enumerate(sem_cols):
-                expected_sum = 0.0
-                processed_merges = set()
-                
-                for rr in range(first_row, school_row):
-                    if rr in exempt_rows:
-                        continue
-                    
-                    # 병합 셀 확인
-                    key = (rr, col_letter)
-                    if key in merge_lookup:
-                        min_row, _, max_row, _ = merge_lookup[key]
-                        merge_key = (min_row, max_row, col_letter)
-                        if merge_key in processed_merges:
-                            continue
-                        processed_merges.add(merge_key)
-                    
-                    val, _, _ = get_value_with_merge(ws_v, ws_f, merge_lookup, rr, col_letter)
-                    num = to_number(val)
-                    if num is not None:
-                        expected_sum += num
-                
-                actual_val, _, _ = get_value_with_merge(ws_v, ws_f, merge_lookup, school_row, col_letter)
-                actual_num = to_number(actual_val)
-                
-                if actual_num is not None and abs(actual_num - expected_sum) > EPS:
-                    col_name = chr(64 + col_letter)  # 열 번호를 문자로 변환
-                    issues.append({
-                        "severity": "ERROR",
-                        "sheet": sname,
-                        "row": school_row,
-                        "message": f"학교 지정 과목 편성 학점 {col_name}열 합계 오류: 셀값={actual_num:g}, 기대값={expected_sum:g}"
-                    })
+            for col_letter, actual_num, expected_sum in find_column_mismatches(school_actual, school_expected, sem_cols):
+                col_name = COL_NAMES[col_letter - 1]  # 열 번호를 문자로 변환
+                total_row_issues.append(("ERROR", school_row, "school_col", col_name, actual_num, expected_sum))
             
             # M/N열 (또는 N/O열) 합계 = G~L (또는 H~M) 합
             total_col = total_cols[0]  # M열 또는 N열
             sem_sum = 0.0
-            for col_letter in sem_cols:
-                val, _, _ = get_value_with_merge(ws_v, ws_f, merge_lookup, school_row, col_letter)
-                num = to_number(val)
+            for num in school_actual:
                 if num is not None:
                     sem_sum += num
             
-            actual_total, _, _ = get_value_with_merge(ws_v, ws_f, merge_lookup, school_row, total_col)
+            actual_total = get_merged_value(ws_v, merge_lookup, school_row, total_col)
             actual_total_num = to_number(actual_total)
             
             if actual_total_num is not None and abs(actual_total_num - sem_sum) > EPS:
-                total_col_name = chr(64 + total_col)
-                issues.append({
-                    "severity": "ERROR",
-                    "sheet": sname,
-                    "row": school_row,
-                    "message": f"학교 지정 과목 편성 학점 {total_col_name}열 합계 오류: 셀값={actual_total_num:g}, 기대값({sem_cols_name}합)={sem_sum:g}"
-                })
+                total_col_name = COL_NAMES[total_col - 1]
+                total_row_issues.append(("ERROR", school_row, "school_total", total_col_name, actual_total_num, sem_cols_name, sem_sum))
         
         # 학생 선택 과목 검증
         if "학생선택" in total_rows and "학교지정" in total_rows:
             student_row = total_rows["학생선택"]
             school_row = total_rows["학교지정"]
+            student_actual = read_row_numbers(ws_v, merge_lookup, student_row, sem_cols)
             
-            # 학생 선택 과목: school_row+1 ~ student_row-1 합계 (증배 제외)
-            for col_idx, col_letter in enumerate(sem_cols):
-                expected_sum = 0.0
-                processed_merges = set()
-                
-                for rr in range(school_row + 1, student_row):
-                    if rr in exempt_rows:
-                        continue
-                    
-                    # 증배 확인
-                    a_val, _, _ = get_value_with_merge(ws_v, ws_f, merge_lookup, rr, compare_col)
-                    if a_val and "증배" in str(a_val):
-                        continue
-                    
-                    # 병합 셀 확인
-                    key = (rr, col_letter)
-                    if key in merge_lookup:
-                        min_row, _, max_row, _ = merge_lookup[key]
-                        merge_key = (min_row, max_row, col_letter)
-                        if merge_key in processed_merges:
-                            continue
-                        processed_merges.add(merge_key)
-                    
-                    val, _, _ = get_value_with_merge(ws_v, ws_f, merge_lookup, rr, col_letter)
-                    num = to_number(val)
-                    if num is not None:
-                        expected_sum += num
-                
-                actual_val, _, _ = get_value_with_merge(ws_v, ws_f, merge_lookup, student_row, col_letter)
-                actual_num = to_number(actual_val)
-                
-                if actual_num is not None and abs(actual_num - expected_sum) > EPS:
-                    col_name = chr(64 + col_letter)
-                    issues.append({
-                        "severity": "ERROR",
-                        "sheet": sname,
-                        "row": student_row,
-                        "message": f"학생 선택 과목 편성 학점 {col_name}열 합계 오류: 셀값={actual_num:g}, 기대값={expected_sum:g} (증배 제외)"
-                    })
+            for col_letter, actual_num, expected_sum in find_column_mismatches(student_actual, student_expected, sem_cols):
+                col_name = COL_NAMES[col_letter - 1]
+                total_row_issues.append(("ERROR", student_row, "student_col", col_name, actual_num, expected_sum))
             
             # M/N열 합계
             sem_sum = 0.0
-            for col_letter in sem_cols:
-                val, _, _ = get_value_with_merge(ws_v, ws_f, merge_lookup, student_row, col_letter)
-                num = to_number(val)
+            for num in student_actual:
                 if num is not None:
                     sem_sum += num
             
             total_col = total_cols[0]
-            actual_total, _, _ = get_value_with_merge(ws_v, ws_f, merge_lookup, student_row, total_col)
+            actual_total = get_merged_value(ws_v, merge_lookup, student_row, total_col)
             actual_total_num = to_number(actual_total)
             
             if actual_total_num is not None and abs(actual_total_num - sem_sum) > EPS:
-                total_col_name = chr(64 + total_col)
-                issues.append({
-                    "severity": "ERROR",
-                    "sheet": sname,
-                    "row": student_row,
-                    "message": f"학생 선택 과목 편성 학점 {total_col_name}열 합계 오류: 셀값={actual_total_num:g}, 기대값({sem_cols_name}합)={sem_sum:g}"
-                })
+                total_col_name = COL_NAMES[total_col - 1]
+                total_row_issues.append(("ERROR", student_row, "student_total", total_col_name, actual_total_num, sem_cols_name, sem_sum))
         
         # 총 교과 편성 학점 검증
         if "총교과" in total_rows and "학교지정" in total_rows and "학생선택" in total_rows:
@@ -3123,94 +3086,22 @@ def run_checks(xlsx_path: str):
             school_row = total_rows["학교지정"]
             student_row = total_rows["학생선택"]
             
-            # 각 열별로 학교 지정과 학생 선택의 기댓값을 저장
-            school_expected = {}
-            student_expected = {}
-            
-            # 학교 지정 과목 기댓값 계산
-            for col_letter in sem_cols:
-                expected_sum = 0.0
-                processed_merges = set()
-                
-                for rr in range(first_row, school_row):
-                    if rr in exempt_rows:
-                        continue
-                    
-                    # 병합 셀 확인
-                    key = (rr, col_letter)
-                    if key in merge_lookup:
-                        min_row, _, max_row, _ = merge_lookup[key]
-                        merge_key = (min_row, max_row, col_letter)
-                        if merge_key in processed_merges:
-                            continue
-                        processed_merges.add(merge_key)
-                    
-                    val, _, _ = get_value_with_merge(ws_v, ws_f, merge_lookup, rr, col_letter)
-                    num = to_number(val)
-                    if num is not None:
-                        expected_sum += num
-                school_expected[col_letter] = expected_sum
-            
-            # 학생 선택 과목 기댓값 계산
-            for col_letter in sem_cols:
-                expected_sum = 0.0
-                processed_merges = set()
-                
-                for rr in range(school_row + 1, student_row):
-                    if rr in exempt_rows:
-                        continue
-                    
-                    # 증배 확인
-                    a_val, _, _ = get_value_with_merge(ws_v, ws_f, merge_lookup, rr, compare_col)
-                    if a_val and "증배" in str(a_val):
-                        continue
-                    
-                    # 병합 셀 확인
-                    key = (rr, col_letter)
-                    if key in merge_lookup:
-                        min_row, _, max_row, _ = merge_lookup[key]
-                        merge_key = (min_row, max_row, col_letter)
-                        if merge_key in processed_merges:
-                            continue
-                        processed_merges.add(merge_key)
-                    
-                    val, _, _ = get_value_with_merge(ws_v, ws_f, merge_lookup, rr, col_letter)
-                    num = to_number(val)
-                    if num is not None:
-                        expected_sum += num
-                student_expected[col_letter] = expected_sum
-            
             # 총 교과 = 학교 지정 기댓값 + 학생 선택 기댓값
-            for col_letter in sem_cols:
-                expected_sum = school_expected.get(col_letter, 0.0) + student_expected.get(col_letter, 0.0)
-                
-                actual_val, _, _ = get_value_with_merge(ws_v, ws_f, merge_lookup, total_subject_row, col_letter)
-                actual_num = to_number(actual_val)
-                
-                if actual_num is not None and abs(actual_num - expected_sum) > EPS:
-                    col_name = chr(64 + col_letter)
-                    issues.append({
-                        "severity": "ERROR",
-                        "sheet": sname,
-                        "row": total_subject_row,
-                        "message": f"총 교과 편성 학점 {col_name}열 합계 오류: 셀값={actual_num:g}, 기대값(학교지정+학생선택)={expected_sum:g}"
-                    })
+            subject_actual = read_row_numbers(ws_v, merge_lookup, total_subject_row, sem_cols)
+            for col_letter, actual_num, expected_sum in find_column_mismatches(subject_actual, subject_expected, sem_cols):
+                col_name = COL_NAMES[col_letter - 1]
+                total_row_issues.append(("ERROR", total_subject_row, "subject_col", col_name, actual_num, expected_sum))
             
             # M/N열 합계 = 각 열의 총 교과 기댓값 합
-            expected_total = sum(school_expected.get(col, 0.0) + student_expected.get(col, 0.0) for col in sem_cols)
+            expected_total = subject_expected_total
             
             total_col = total_cols[0]
-            actual_total, _, _ = get_value_with_merge(ws_v, ws_f, merge_lookup, total_subject_row, total_col)
+            actual_total = get_merged_value(ws_v, merge_lookup, total_subject_row, total_col)
             actual_total_num = to_number(actual_total)
             
             if actual_total_num is not None and abs(actual_total_num - expected_total) > EPS:
-                total_col_name = chr(64 + total_col)
-                issues.append({
-                    "severity": "ERROR",
-                    "sheet": sname,
-                    "row": total_subject_row,
-                    "message": f"총 교과 편성 학점 {total_col_name}열 합계 오류: 셀값={actual_total_num:g}, 기대값={expected_total:g}"
-                })
+                total_col_name = COL_NAMES[total_col - 1]
+                total_row_issues.append(("ERROR", total_subject_row, "subject_total", total_col_name, actual_total_num, expected_total))
         
         # 창의적 체험활동 검증
         if "창의적" in total_rows:
@@ -3219,32 +3110,17 @@ def run_checks(xlsx_path: str):
             # G~L (또는 H~M) 각 학기 열 검증: 값 존재 여부 및 1~5 범위 확인
             semester_values = []
             for col_letter in sem_cols:
-                val, _, _ = get_value_with_merge(ws_v, ws_f, merge_lookup, creative_row, col_letter)
+                val = get_merged_value(ws_v, merge_lookup, creative_row, col_letter)
                 num = to_number(val)
-                col_name = chr(64 + col_letter)
                 
                 # 값이 없으면 오류
                 if num is None:
-                    issues.append({
-                        "severity": "ERROR",
-                        "sheet": sname,
-                        "row": creative_row,
-                        "message": f"창의적 체험활동 학점 {col_name}열에 값이 없습니다."
-                    })
+                    total_row_issues.append(("ERROR", creative_row, "creative_empty", COL_NAMES[col_letter - 1]))
                 # 값이 있지만 1~5 범위가 아니면 오류 + 경고
                 elif num < 1.0 - EPS or num > 5.0 + EPS:
-                    issues.append({
-                        "severity": "ERROR",
-                        "sheet": sname,
-                        "row": creative_row,
-                        "message": f"창의적 체험활동 학점 {col_name}열 오류: 셀값={num:g}, 허용 범위=1~5"
-                    })
-                    issues.append({
-                        "severity": "WARNING",
-                        "sheet": sname,
-                        "row": creative_row,
-                        "message": f"창의적 체험활동 학점 {col_name}열은 1~5 범위 내로 설정해야 합니다."
-                    })
+                    col_name = COL_NAMES[col_letter - 1]
+                    total_row_issues.append(("ERROR", creative_row, "creative_range", col_name, num))
+                    total_row_issues.append(("WARNING", creative_row, "creative_range_hint", col_name))
                 else:
                     # 값이 있고 1~5 범위 내면 정상 (합계 계산을 위해 저장)
                     semester_values.append(num)
@@ -3256,12 +3132,12 @@ def run_checks(xlsx_path: str):
             total_col_name = None
             
             for col in total_cols:
-                val, _, _ = get_value_with_merge(ws_v, ws_f, merge_lookup, creative_row, col)
+                val = get_merged_value(ws_v, merge_lookup, creative_row, col)
                 num = to_number(val)
                 if num is not None:
                     actual_total_num = num
                     total_col = col
-                    total_col_name = chr(64 + col)
+                    total_col_name = COL_NAMES[col - 1]
                     break
             
             # 각 학기 열의 합 계산
@@ -3269,20 +3145,10 @@ def run_checks(xlsx_path: str):
             
             if actual_total_num is None:
                 # 모든 total_cols 열에 값이 없는 경우
-                col_names = "/".join([chr(64 + col) for col in total_cols])
-                issues.append({
-                    "severity": "ERROR",
-                    "sheet": sname,
-                    "row": creative_row,
-                    "message": f"창의적 체험활동 학점 총합 열({col_names})에 값이 없습니다."
-                })
+                col_names = "/".join([COL_NAMES[col - 1] for col in total_cols])
+                total_row_issues.append(("ERROR", creative_row, "creative_total_empty", col_names))
             elif abs(actual_total_num - expected_total) > EPS:
-                issues.append({
-                    "severity": "ERROR",
-                    "sheet": sname,
-                    "row": creative_row,
-                    "message": f"창의적 체험활동 학점 {total_col_name}열 합계 오류: 셀값={actual_total_num:g}, 기대값(각 학기 열 합)={expected_total:g}"
-                })
+                total_row_issues.append(("ERROR", creative_row, "creative_total", total_col_name, actual_total_num, expected_total))
         
         # 편성 학점 수 검증
         if "편성학점수" in total_rows and "학교지정" in total_rows and "학생선택" in total_rows:
@@ -3290,131 +3156,52 @@ def run_checks(xlsx_path: str):
             school_row = total_rows["학교지정"]
             student_row = total_rows["학생선택"]
             
-            # 학교 지정과 학생 선택의 기댓값이 이미 위에서 계산되었는지 확인
-            # 만약 총교과 검증을 거치지 않았다면 여기서 계산
-            if 'school_expected' not in locals() or 'student_expected' not in locals():
-                school_expected = {}
-                student_expected = {}
-                
-                # 학교 지정 과목 기댓값 계산
-                for col_letter in sem_cols:
-                    expected_sum = 0.0
-                    processed_merges = set()
-                    
-                    for rr in range(first_row, school_row):
-                        if rr in exempt_rows:
-                            continue
-                        
-                        # 병합 셀 확인
-                        key = (rr, col_letter)
-                        if key in merge_lookup:
-                            min_row, _, max_row, _ = merge_lookup[key]
-                            merge_key = (min_row, max_row, col_letter)
-                            if merge_key in processed_merges:
-                                continue
-                            processed_merges.add(merge_key)
-                        
-                        val, _, _ = get_value_with_merge(ws_v, ws_f, merge_lookup, rr, col_letter)
-                        num = to_number(val)
-                        if num is not None:
-                            expected_sum += num
-                    school_expected[col_letter] = expected_sum
-                
-                # 학생 선택 과목 기댓값 계산
-                for col_letter in sem_cols:
-                    expected_sum = 0.0
-                    processed_merges = set()
-                    
-                    for rr in range(school_row + 1, student_row):
-                        if rr in exempt_rows:
-                            continue
-                        
-                        # 증배 확인
-                        a_val, _, _ = get_value_with_merge(ws_v, ws_f, merge_lookup, rr, compare_col)
-                        if a_val and "증배" in str(a_val):
-                            continue
-                        
-                        # 병합 셀 확인
-                        key = (rr, col_letter)
-                        if key in merge_lookup:
-                            min_row, _, max_row, _ = merge_lookup[key]
-                            merge_key = (min_row, max_row, col_letter)
-                            if merge_key in processed_merges:
-                                continue
-                            processed_merges.add(merge_key)
-                        
-                        val, _, _ = get_value_with_merge(ws_v, ws_f, merge_lookup, rr, col_letter)
-                        num = to_number(val)
-                        if num is not None:
-                            expected_sum += num
-                    student_expected[col_letter] = expected_sum
-            
-            for col_idx, col_letter in enumerate(sem_cols):
-                # 총교과 기댓값 + 창의적(3)
-                total_expected = school_expected.get(col_letter, 0.0) + student_expected.get(col_letter, 0.0)
-                expected_sum = total_expected + 3.0
-                
-                actual_val, _, _ = get_value_with_merge(ws_v, ws_f, merge_lookup, final_row, col_letter)
-                actual_num = to_number(actual_val)
-                
-                if actual_num is not None and abs(actual_num - expected_sum) > EPS:
-                    col_name = chr(64 + col_letter)
-                    issues.append({
-                        "severity": "ERROR",
-                        "sheet": sname,
-                        "row": final_row,
-                        "message": f"편성 학점 수 {col_name}열 합계 오류: 셀값={actual_num:g}, 기대값(총교과+창의적)={expected_sum:g}"
-                    })
+            # 각 열 = 총교과 기댓값 + 창의적(3)
+            final_actual = read_row_numbers(ws_v, merge_lookup, final_row, sem_cols)
+            for col_letter, actual_num, expected_sum in find_column_mismatches(final_actual, subject_expected, sem_cols, offset=3.0):
+                col_name = COL_NAMES[col_letter - 1]
+                total_row_issues.append(("ERROR", final_row, "final_col", col_name, actual_num, expected_sum))
             
             # M/N열 합계 체크 = 총 교과 기댓값 합 + 창의적(18)
             total_col = total_cols[0]
-            actual_final, _, _ = get_value_with_merge(ws_v, ws_f, merge_lookup, final_row, total_col)
+            actual_final = get_merged_value(ws_v, merge_lookup, final_row, total_col)
             actual_final_num = to_number(actual_final)
             
             # 기댓값 = 각 열의 (학교지정 + 학생선택) 합 + 18
-            expected_final_total = sum(school_expected.get(col, 0.0) + student_expected.get(col, 0.0) for col in sem_cols) + 18.0
+            expected_final_total = subject_expected_total + 18.0
             
             if actual_final_num is not None:
                 # 합계 체크
                 if abs(actual_final_num - expected_final_total) > EPS:
-                    total_col_name = chr(64 + total_col)
-                    issues.append({
-                        "severity": "ERROR",
-                        "sheet": sname,
-                        "row": final_row,
-                        "message": f"편성 학점 수 {total_col_name}열 합계 오류: 셀값={actual_final_num:g}, 기대값(총교과+창의적)={expected_final_total:g}"
-                    })
+                    total_col_name = COL_NAMES[total_col - 1]
+                    total_row_issues.append(("ERROR", final_row, "final_total", total_col_name, actual_final_num, expected_final_total))
+
+        issues.extend(render_total_row_issue(sname, raw) for raw in total_row_issues)
 
     # =========================
     # (9) 2026 전학년 시트 검증
     # =========================
-    check_all_grades_sheet(wb_v, wb_f, targets, issues, hidden, vocational_courses, new_courses, hidden_list_norm)
+    check_all_grades_sheet(wb_v, wb_f, targets, issues, hidden, vocational_courses, new_courses, hidden_list_norm, merge_cache)
 
     # =========================
     # (10) 학교명 일관성 검증
     # =========================
-    check_school_name_consistency(wb_v, wb_f, targets, issues)
+    check_school_name_consistency(wb_v, wb_f, targets, issues, merge_cache)
 
     # =========================
     # (11) 2025, 2026 입학생 시트 최신버전 확인
     # =========================
     show_version_warning = False
     if data_source == "엑셀 파일 내부":
-        for year in [2025, 2026]:
-            if year not in targets:
-                continue
-            sname = targets[year]
-            
-            # 해당 시트의 error + warning 개수 세기
-            error_warning_count = sum(
-                1 for issue in issues 
-                if issue.get("sheet") == sname 
-                and issue.get("severity") in ["ERROR", "WARNING"]
-            )
-            
-            if error_warning_count >= 50:
-                show_version_warning = True
-                break
+        version_sheets = {targets[year] for year in (2025, 2026) if year in targets}
+        
+        # 해당 시트들의 error + warning 개수를 issues 한 번 순회로 세기
+        error_warning_counts = Counter(
+            issue.get("sheet") for issue in issues
+            if issue.get("severity") in MAJOR_SEVERITIES
+            and issue.get("sheet") in version_sheets
+        )
+        show_version_warning = any(count >= 50 for count in error_warning_counts.values())
     
     summary["show_version_warning"] = show_version_warning
 
@@ -3425,6 +3212,39 @@ def run_checks(xlsx_path: str):
 # GUI
 # =========================
 
+# 메시지에서 작은따옴표로 감싼 텍스트(과목명 후보)
+QUOTED_TEXT_RE = re.compile(r"'([^']+)'")
+# '기타' 섹션: '2026 전학년' 시트에 없는 과목 메시지 분류
+MISSING_COURSE_RE = re.compile(r"'([^']+)'\s*시트.*?'([^']+)'\s*과목이\s*'2026\s*전학년'\s*시트에\s*없습니다")
+MISSING_WITH_ROW_RE = re.compile(r"'([^']+)'\s*시트\s*(\d+)행의\s*'([^']+)'\s*과목이\s*'2026\s*전학년'\s*시트에\s*없습니다")
+# 학생 선택 과목 패턴: '{시트명}' 시트의 '{과목명}' 과목({행번호}행[,...])이 '2026 전학년' 시트의 {열명}에 없습니다.
+STUDENT_MISSING_RE = re.compile(r"'([^']+)'\s*시트의\s*'([^']+)'\s*과목\((\d+)행[^)]*\)이\s*'2026\s*전학년'\s*시트의\s*[^에]+에\s*없습니다")
+
+
+# 심각도 -> 출력 태그 (그 외 심각도는 INFO 태그로 표시)
+SEVERITY_TAGS = {"ERROR": "ERROR", "WARNING": "WARNING", "CHECK": "CHECK"}
+
+
+def count_severities(items):
+    """문제 목록의 심각도별 개수를 한 번에 센다. (Counter: severity -> 건수)"""
+    return Counter(it.get("severity") for it in items)
+
+
+def course_label(value):
+    """과목명 셀 값 -> 행 제목용 과목명 (비어 있으면 None)."""
+    if value and str(value).strip():
+        return normalize_course_name(value) or None
+    return None
+
+
+def short_label(value, limit=30):
+    """A/B열 셀 값 -> 행 제목용 텍스트 (너무 길면 잘라냄, 비어 있으면 None)."""
+    if value and str(value).strip():
+        text = str(value).strip()
+        return text[:limit - 3] + "..." if len(text) > limit else text
+    return None
+
+
 class App:
     def __init__(self, root: tk.Tk):
         self.root = root
@@ -3457,9 +3277,14 @@ class App:
         self.style.configure("TLabel", background=self.colors["bg"], foreground=self.colors["text"], font=base_font)
         self.style.configure("Title.TLabel", font=title_font, foreground=self.colors["text"])
         self.style.configure("Muted.TLabel", foreground=self.colors["muted"], font=("Malgun Gothic", 10))
+        self.style.configure("Emphasis.TLabel", foreground=self.colors["danger"], font=("Malgun Gothic", 10, "bold"))
 
         self._build_ui()
         self.xlsx_path = None
+        self._wb = None  # 결과 출력용 워크북(read_only)
+        self._sheetset = frozenset()  # 결과 출력용 워크북의 시트 이름
+        self._all_grades_sheet = None  # 탭 구성 때 찾은 2026 전학년 시트 이름
+        self._wb_cache = {}  # (경로, 수정 시각) -> 결과 출력용 워크북
 
     def _build_ui(self):
         header = ttk.Frame(self.root, padding=(18, 18, 18, 10))
@@ -3470,37 +3295,15 @@ class App:
         text_frame = ttk.Frame(header)
         text_frame.pack(fill="x", pady=(6, 0))
         
-        # 강조 부분 1: "교육청에서 제공한 엑셀 파일"
-        tk.Label(
-            text_frame,
-            text="교육청에서 제공한 엑셀 파일",
-            bg=self.colors["bg"],
-            fg="#EF4444",
-            font=("Malgun Gothic", 10, "bold")
-        ).pack(side="left")
-        
-        # 일반 텍스트 부분
-        ttk.Label(
-            text_frame,
-            text="에 작성된 편성표를 점검합니다. 파일을 ",
-            style="Muted.TLabel"
-        ).pack(side="left")
-        
-        # 강조 부분 2: "저장하고 닫은 후에"
-        tk.Label(
-            text_frame,
-            text="저장하고 닫은 후에",
-            bg=self.colors["bg"],
-            fg="#EF4444",
-            font=("Malgun Gothic", 10, "bold")
-        ).pack(side="left")
-        
-        # 일반 텍스트 부분
-        ttk.Label(
-            text_frame,
-            text=" 업로드하세요.",
-            style="Muted.TLabel"
-        ).pack(side="left")
+        # 첫 번째 줄 텍스트: (문구, 스타일) 순서대로 이어 붙임 (강조 부분은 빨간 굵은 글씨)
+        intro_parts = [
+            ("교육청에서 제공한 엑셀 파일", "Emphasis.TLabel"),
+            ("에 작성된 편성표를 점검합니다. 파일을 ", "Muted.TLabel"),
+            ("저장하고 닫은 후에", "Emphasis.TLabel"),
+            (" 업로드하세요.", "Muted.TLabel"),
+        ]
+        for text, style in intro_parts:
+            ttk.Label(text_frame, text=text, style=style).pack(side="left")
         
         # 두 번째 줄 텍스트
         text_frame2 = ttk.Frame(header)
@@ -3595,7 +3398,8 @@ class App:
         self.nb = ttk.Notebook(out_card)
         self.nb.pack(fill="both", expand=True, pady=(8, 0))
 
-        self.text_widgets = {}  # tab_name -> ScrolledText
+        self.text_widgets = {}  # tab_name -> ScrolledText (탭을 처음 볼 때까지 None)
+        self.nb.bind("<<NotebookTabChanged>>", self._on_tab_changed)
 
         # 기본 탭: 전체/기타 (실행 시 대상 시트 탭은 동적으로 재구성)
         self._reset_tabs(["전체", "기타"])
@@ -3605,32 +3409,60 @@ class App:
         for tab_id in self.nb.tabs():
             self.nb.forget(tab_id)
         self.text_widgets.clear()
+        self._tab_frames = {}  # tab_name -> Frame
+        self._tab_names = {}  # str(Frame) -> tab_name (Notebook.select() 결과로 탭 찾기)
+        # tab_name -> 아직 넣지 않은 [(텍스트, 태그), ...] (없는 탭 이름은 '기타' 목록으로)
+        self._pending = {name: [] for name in tab_names}
+        self._pending_default = self._pending.get("기타")
 
+        # 탭 프레임만 먼저 만들고 ScrolledText는 탭을 처음 볼 때 만든다 ("전체"는 바로 보이므로 즉시 생성)
         for name in tab_names:
             frame = ttk.Frame(self.nb, padding=(8, 8))
             self.nb.add(frame, text=name)
-
-            txt = ScrolledText(
-                frame,
-                wrap="word",
-                height=18,
-                font=("Malgun Gothic", 10),
-                bg="#FBFBFE",
-                fg=self.colors["text"],
-                relief="solid",
-                bd=1,
-                padx=10,
-                pady=10
-            )
-            txt.pack(fill="both", expand=True)
-            txt.tag_configure("ERROR", foreground=self.colors["danger"], font=("Malgun Gothic", 10))
-            txt.tag_configure("WARNING", foreground=self.colors["warn"], font=("Malgun Gothic", 10))
-            txt.tag_configure("CHECK", foreground=self.colors["check"], font=("Malgun Gothic", 10))
-            txt.tag_configure("INFO", foreground=self.colors["muted"], font=("Malgun Gothic", 9))
-            txt.tag_configure("HEADER", font=("Malgun Gothic", 11, "bold"), foreground="#5B21B6")
-            txt.tag_configure("COURSE", font=("Malgun Gothic", 10, "bold"), foreground="#7C3AED")
-            txt.tag_configure("RIGHT_ALIGN", justify="right", font=("Malgun Gothic", 9), foreground=self.colors["muted"])
-            self.text_widgets[name] = txt
+            self._tab_frames[name] = frame
+            self._tab_names[str(frame)] = name
+            self.text_widgets[name] = None
+        if "전체" in self.text_widgets:
+            self._ensure_text_widget("전체")
+
+    def _ensure_text_widget(self, name):
+        txt = self.text_widgets.get(name)
+        if txt is not None:
+            return txt
+
+        txt = ScrolledText(
+            self._tab_frames[name],
+            wrap="word",
+            height=18,
+            font=("Malgun Gothic", 10),
+            bg="#FBFBFE",
+            fg=self.colors["text"],
+            relief="solid",
+            bd=1,
+            padx=10,
+            pady=10
+        )
+        txt.pack(fill="both", expand=True)
+        txt.tag_configure("ERROR", foreground=self.colors["danger"], font=("Malgun Gothic", 10))
+        txt.tag_configure("WARNING", foreground=self.colors["warn"], font=("Malgun Gothic", 10))
+        txt.tag_configure("CHECK", foreground=self.colors["check"], font=("Malgun Gothic", 10))
+        txt.tag_configure("INFO", foreground=self.colors["muted"], font=("Malgun Gothic", 9))
+        txt.tag_configure("HEADER", font=("Malgun Gothic", 11, "bold"), foreground="#5B21B6")
+        txt.tag_configure("COURSE", font=("Malgun Gothic", 10, "bold"), foreground="#7C3AED")
+        txt.tag_configure("RIGHT_ALIGN", justify="right", font=("Malgun Gothic", 9), foreground=self.colors["muted"])
+        self.text_widgets[name] = txt
+        return txt
+
+    def _on_tab_changed(self, event=None):
+        # 처음 선택된 탭이면 위젯을 만들고 쌓여 있던 출력을 넣는다
+        try:
+            name = self._tab_names.get(str(self.nb.select()))
+        except Exception:
+            return
+        if name is None:
+            return
+        self._ensure_text_widget(name)
+        self._flush_tab(name)
 
     def pick_file(self):
         path = filedialog.askopenfilename(
@@ -3651,19 +3483,69 @@ class App:
         # 초기화(탭은 summary 읽고 나서 구성)
         self.status_var.set("검사 중...")
         self.progress.start(12)
-        self.root.update_idletasks()
+        self._set_buttons_busy(True)
+
+        # 검사는 작업 스레드에서 실행하고, 결과는 큐를 통해 UI 스레드로 전달
+        self._result_queue = queue.Queue()
+        threading.Thread(target=self._run_worker, args=(self.xlsx_path,), daemon=True).start()
+        self.root.after(50, self._poll_queue)
 
+    def _set_buttons_busy(self, busy):
+        if busy:
+            self.btn_pick.configure(state="disabled")
+            self.btn_run.configure(state="disabled", bg="#C7C9D9", activebackground="#C7C9D9")
+        else:
+            self.btn_pick.configure(state="normal")
+            self.btn_run.configure(state="normal", bg=self.colors["accent"], activebackground=self.colors["accent"])
+
+    def _run_worker(self, path):
+        # 작업 스레드: Tk 위젯에 접근하지 않고 결과만 큐에 넣는다
         try:
-            issues, summary = run_checks(self.xlsx_path)
+            issues, summary = run_checks(path)
         except Exception as e:
             import traceback
-            self.progress.stop()
-            self.status_var.set("오류 발생")
-            messagebox.showerror("오류", f"검사 중 예외가 발생했습니다:\n{e}\n\n{traceback.format_exc()}")
+            self._result_queue.put(("err", e, traceback.format_exc(), None))
+            return
+
+        # 탭 구성/행 정보 표시용 워크북은 read_only로 한 번만 연다.
+        # 파일이 바뀌지 않았으면(수정 시각 동일) 이전 실행에서 연 워크북을 그대로 쓴다.
+        try:
+            key = (path, os.path.getmtime(path))
+            wb = self._wb_cache.get(key)
+            if wb is None:
+                # 메모리로 읽어서 열어 두므로 엑셀에서 파일을 저장하는 것을 막지 않는다
+                with open(path, "rb") as fp:
+                    wb = load_workbook(BytesIO(fp.read()), read_only=True, data_only=True)
+                for old_wb in self._wb_cache.values():
+                    old_wb.close()
+                self._wb_cache = {key: wb}
+        except Exception:
+            wb = None
+        self._result_queue.put(("ok", issues, summary, wb))
+
+    def _poll_queue(self):
+        try:
+            kind, a, b, wb = self._result_queue.get_nowait()
+        except queue.Empty:
+            self.root.after(50, self._poll_queue)
             return
 
         self.progress.stop()
+        self._set_buttons_busy(False)
+
+        if kind == "err":
+            self.status_var.set("오류 발생")
+            messagebox.showerror("오류", f"검사 중 예외가 발생했습니다:\n{a}\n\n{b}")
+            return
+
+        self._wb = wb
+        self._sheetset = frozenset(wb.sheetnames) if wb is not None else frozenset()
+        try:
+            self._show_results(a, b)
+        finally:
+            self._wb = None
 
+    def _show_results(self, issues, summary):
         # 결과 타입 검증
         if not isinstance(issues, list):
             messagebox.showerror("오류", f"검사 결과 타입 오류: issues가 list가 아닙니다. (타입: {type(issues)})")
@@ -3671,6 +3553,11 @@ class App:
         if not isinstance(summary, dict):
             messagebox.showerror("오류", f"검사 결과 타입 오류: summary가 dict가 아닙니다. (타입: {type(summary)})")
             return
+        # 딕셔너리가 아닌 항목은 여기서 한 번만 걸러내고, 출력 루프에서는 다시 검사하지 않는다
+        issues = [it for it in issues if isinstance(it, dict)]
+
+        # 심각도별 개수는 한 번만 세어 요약/상태 표시에서 함께 사용
+        self._counts = count_severities(issues)
 
         try:
             # 탭 구성: 전체 + (대상 시트) + 2026 전학년 + 기타
@@ -3683,30 +3570,36 @@ class App:
                     tab_names.append(s)
             
             # 2026 전학년 시트 추가
-            try:
-                wb_temp = load_workbook(self.xlsx_path, data_only=True)
-                all_grades_sheet = find_all_grades_sheet(wb_temp.sheetnames)
-                if all_grades_sheet and all_grades_sheet not in tab_names:
-                    tab_names.append(all_grades_sheet)
-            except Exception:
-                pass
+            # 시트 이름은 작업 스레드가 이미 연 워크북에서 가져온다
+            if self._wb is not None:
+                self._all_grades_sheet = find_all_grades_sheet(self._wb.sheetnames)
+            else:
+                self._all_grades_sheet = None
+            if self._all_grades_sheet and self._all_grades_sheet not in tab_names:
+                tab_names.append(self._all_grades_sheet)
             
             tab_names.append("기타")
-            self._reset_tabs(tab_names)
 
-            # 출력
-            self._print_summary(summary, issues)
-            self._print_issues_per_sheet(issues, summary)
+            # 탭 재구성과 출력이 끝날 때까지 Notebook을 화면에서 내려 두어
+            # 줄바꿈/스크롤바 레이아웃을 다시 붙일 때 한 번만 계산하게 한다
+            self.nb.pack_forget()
+            try:
+                self._reset_tabs(tab_names)
+
+                # 출력
+                self._print_summary(summary, issues)
+                self._flush()
+                self._print_issues_per_sheet(issues, summary)
+                self._flush()
+            finally:
+                self.nb.pack(fill="both", expand=True, pady=(8, 0))
         except Exception as e:
             import traceback
-            self.progress.stop()
             self.status_var.set("오류 발생")
             messagebox.showerror("오류", f"결과 출력 중 예외가 발생했습니다:\n{e}\n\n상세:\n{traceback.format_exc()}")
             return
 
-        err_cnt = sum(1 for x in issues if x.get("severity") == "ERROR")
-        warn_cnt = sum(1 for x in issues if x.get("severity") == "WARNING")
-        check_cnt = sum(1 for x in issues if x.get("severity") == "CHECK")
+        err_cnt, warn_cnt, check_cnt = self._counts["ERROR"], self._counts["WARNING"], self._counts["CHECK"]
         if err_cnt == 0:
             self.status_var.set(f"검사 완료: 오류 없음 (경고 {warn_cnt}건, 확인 {check_cnt}건)")
         else:
@@ -3719,43 +3612,68 @@ class App:
             pass
 
     def _w(self, tab, text, tag="INFO"):
-        txt = self.text_widgets.get(tab)
-        if not txt:
-            txt = self.text_widgets.get("기타")
-        txt.insert("end", text, tag)
+        # 바로 insert하지 않고 모아 두었다가 _flush에서 탭마다 한 번에 넣는다
+        self._pending.get(tab, self._pending_default).append((text, tag))
+
+    def _w_parts(self, tab, parts):
+        # parts: [(텍스트, 태그), ...]를 한 번에 버퍼에 추가
+        self._pending.get(tab, self._pending_default).extend(parts)
+
+    def _flush(self):
+        # 아직 위젯이 없는(한 번도 보지 않은) 탭의 출력은 탭을 열 때까지 보관
+        for name, parts in self._pending.items():
+            if parts and self.text_widgets.get(name) is not None:
+                self._flush_tab(name)
+
+    def _flush_tab(self, name):
+        parts = self._pending.get(name)
+        if not parts:
+            return
+        # 같은 태그가 이어지는 조각은 합치고, insert 한 번에 (텍스트, 태그) 쌍을 모두 전달
+        args = []
+        for text, tag in parts:
+            if args and args[-1] == tag:
+                args[-2] += text
+            else:
+                args.extend((text, tag))
+        parts.clear()
+        self.text_widgets[name].insert("end", *args)
 
     def _print_summary(self, summary, issues):
         tab = "전체"
         txt = self.text_widgets[tab]
         txt.delete("1.0", "end")
 
-        self._w(tab, "[검사 개요]\n", "HEADER")
-        self._w(tab, f"- 파일: {self.xlsx_path}\n", "INFO")
+        # 요약은 (텍스트, 태그) 목록으로 모아 한 번에 출력
+        parts = [
+            ("[검사 개요]\n", "HEADER"),
+            (f"- 파일: {self.xlsx_path}\n", "INFO"),
+        ]
 
         # 안내 메시지 (최신버전 확인)
         if summary.get("show_version_warning", False):
-            self._w(tab, "\n[안내]\n", "HEADER")
-            self._w(tab, "참조되는 시트가 최신버전이 아닙니다. 교육청 제공 양식에 다시 작성해주세요.\n\n", "WARNING")
+            parts.append(("\n[안내]\n", "HEADER"))
+            parts.append(("참조되는 시트가 최신버전이 아닙니다. 교육청 제공 양식에 다시 작성해주세요.\n\n", "WARNING"))
         
         # 구글 스프레드시트 참조 실패 안내
         google_error = summary.get("google_error")
         if google_error:
-            self._w(tab, "\n[온라인 데이터 참조 안내]\n", "HEADER")
+            parts.append(("\n[온라인 데이터 참조 안내]\n", "HEADER"))
             # requests 라이브러리 관련 메시지는 간단하게 표시
             if "온라인 데이터 참조 기능을 사용할 수 없습니다" in google_error:
-                self._w(tab, "온라인 데이터를 참조할 수 없어 엑셀 파일 내부의 '숨김' 및 '전문교과목록' 시트를 사용합니다.\n\n", "INFO")
+                parts.append(("온라인 데이터를 참조할 수 없어 엑셀 파일 내부의 '숨김' 및 '전문교과목록' 시트를 사용합니다.\n\n", "INFO"))
             else:
-                self._w(tab, f"구글 스프레드시트를 참조하지 못했습니다: {google_error}\n", "WARNING")
-                self._w(tab, "엑셀 파일 내부의 '숨김' 및 '전문교과목록' 시트를 사용합니다.\n\n", "INFO")
+                parts.append((f"구글 스프레드시트를 참조하지 못했습니다: {google_error}\n", "WARNING"))
+                parts.append(("엑셀 파일 내부의 '숨김' 및 '전문교과목록' 시트를 사용합니다.\n\n", "INFO"))
 
         targets = summary.get("targets") or {}
-        self._w(tab, "- 시트 확인:\n", "INFO")
+        parts.append(("- 시트 확인:\n", "INFO"))
         for y in (2026, 2025, 2024):
             s = targets.get(y)
             if s:
-                self._w(tab, f"  · {y}: {s}\n", "INFO")
+                parts.append((f"  · {y}: {s}\n", "INFO"))
             else:
-                self._w(tab, f"  · {y}: (없음)\n", "WARNING")
+                parts.append((f"  · {y}: (없음)\n", "WARNING"))
 
         hidden = summary.get("hidden_sheet")
         cnt = summary.get("hidden_course_count", 0)
@@ -3763,25 +3681,25 @@ class App:
         vocational_cnt = summary.get("vocational_course_count", 0)
         
         if hidden:
-            self._w(tab, f"- 지침 시트: {hidden} (과목 {cnt}개)\n", "INFO")
-            self._w(tab, f"- 전문교과목록: {vocational_cnt}개 과목\n", "INFO")
-            self._w(tab, f"- 데이터 출처: {data_source}\n", "INFO")
+            parts.append((f"- 지침 시트: {hidden} (과목 {cnt}개)\n", "INFO"))
+            parts.append((f"- 전문교과목록: {vocational_cnt}개 과목\n", "INFO"))
+            parts.append((f"- 데이터 출처: {data_source}\n", "INFO"))
         else:
-            self._w(tab, "- 지침 시트: (없음)\n", "ERROR")
+            parts.append(("- 지침 시트: (없음)\n", "ERROR"))
+
+        err_cnt, warn_cnt, check_cnt = self._counts["ERROR"], self._counts["WARNING"], self._counts["CHECK"]
+        parts.append((f"- 총계: 오류 {err_cnt}건 / 경고 {warn_cnt}건 / 확인 {check_cnt}건\n\n", "INFO"))
 
-        err_cnt = sum(1 for x in issues if x.get("severity") == "ERROR")
-        warn_cnt = sum(1 for x in issues if x.get("severity") == "WARNING")
-        check_cnt = sum(1 for x in issues if x.get("severity") == "CHECK")
-        self._w(tab, f"- 총계: 오류 {err_cnt}건 / 경고 {warn_cnt}건 / 확인 {check_cnt}건\n\n", "INFO")
+        parts.append(("[시트별 안내]\n", "HEADER"))
+        parts.append(("- 각 탭에서 해당 시트의 문제상황만 확인할 수 있습니다.\n", "INFO"))
+        parts.append(("- '기타' 탭에는 파일/시트 누락 등 특정 시트에 귀속되지 않는 오류가 표시됩니다.\n\n", "INFO"))
 
-        self._w(tab, "[시트별 안내]\n", "HEADER")
-        self._w(tab, "- 각 탭에서 해당 시트의 문제상황만 확인할 수 있습니다.\n", "INFO")
-        self._w(tab, "- '기타' 탭에는 파일/시트 누락 등 특정 시트에 귀속되지 않는 오류가 표시됩니다.\n\n", "INFO")
+        self._w_parts(tab, parts)
 
     def _print_issues_per_sheet(self, issues, summary):
         # 다른 탭들은 내용만 초기화(전체는 summary가 있으므로 유지)
         for name, txt in self.text_widgets.items():
-            if name == "전체":
+            if name == "전체" or txt is None:
                 continue
             txt.delete("1.0", "end")
 
@@ -3789,37 +3707,33 @@ class App:
             self._w("전체", "문제 없음.\n", "INFO")
             return
 
-        # summary가 딕셔너리가 아닌 경우 처리
-        if not isinstance(summary, dict):
-            summary = {}
-
-        # 그룹핑
-        groups = {}
+        # 그룹핑: (시트 첫 등장 순서, 심각도, 행 번호) 키를 이슈마다 한 번만 만들어
+        # 전체를 한 번 정렬한 뒤 시트별로 묶는다
+        sev_rank = {"ERROR": 0, "WARNING": 1, "CHECK": 2, "INFO": 3}
+        sheet_order = {}
+        keyed = []
         for it in issues:
-            # it이 딕셔너리가 아닌 경우 처리
-            if not isinstance(it, dict):
-                continue
             sheet = it.get("sheet", "-") or "-"
-            groups.setdefault(sheet, []).append(it)
-
-        sev_rank = {"ERROR": 0, "WARNING": 1, "CHECK": 2, "INFO": 3}
-
-        def sort_key(x):
-            row = x.get("row", "-")
+            row = it.get("row", "-")
             try:
                 row_n = int(row)
             except Exception:
                 row_n = 10**9
-            return (sev_rank.get(x.get("severity", "INFO"), 9), row_n)
+            keyed.append((sheet_order.setdefault(sheet, len(sheet_order)),
+                          sev_rank.get(it.get("severity", "INFO"), 9), row_n, sheet, it))
+        keyed.sort(key=lambda k: k[:3])
+
+        groups = {}
+        for sheet, grp in groupby(keyed, key=lambda k: k[3]):
+            groups[sheet] = [k[4] for k in grp]
 
         # 2024, 2025, 2026 시트 및 2026 전학년 시트 확인
         targets = summary.get("targets") or {}
         sheet_2024 = targets.get(2024)
         sheet_2025 = targets.get(2025)
         sheet_2026 = targets.get(2026)
-        # 모든 시트 이름 목록 생성 (groups에 있는 시트 + text_widgets에 있는 시트)
-        all_sheet_names = set(groups.keys()) | set(self.text_widgets.keys())
-        all_grades_sheet = find_all_grades_sheet(list(all_sheet_names))
+        # 2026 전학년 시트는 탭 구성 시 이미 찾아 두었다
+        all_grades_sheet = self._all_grades_sheet
         
         # 먼저 모든 시트에 안내 메시지 출력 (오류가 없어도 출력)
         for tab_name in self.text_widgets.keys():
@@ -3848,11 +3762,13 @@ class App:
                 self._w(tab_name, "개설 여부는 프로그램 상 확인 절차가 따로 없습니다. 선택군은 학년별로 다르게 정리하여 병합해해주세요.\n\n", "INFO")
 
         # 각 시트 탭에 출력
+        sheet_counts = {}
         for sheet, items in groups.items():
             tab = sheet if sheet in self.text_widgets else "기타"
             
             # 해당 시트의 오류 개수 확인
-            error_count = sum(1 for it in items if it.get("severity") == "ERROR")
+            sev_counts = sheet_counts[sheet] = count_severities(items)
+            error_count = sev_counts["ERROR"]
             
             # 오류가 50개 이상이면 경고 메시지 출력
             if error_count >= 50:
@@ -3862,73 +3778,60 @@ class App:
             # 행 번호별로 그룹핑
             row_groups = {}
             
-            for it in sorted(items, key=sort_key):
+            for it in items:
                 row = it.get("row", "-")
                 row_groups.setdefault(row, []).append(it)
             
+            # 행 정렬 키는 행마다 한 번만 만든다: ('-' 여부, 숫자 행 번호, 원래 값, 숫자 행 번호 또는 None, 항목)
+            row_order = []
+            for row_num, row_items in row_groups.items():
+                row_int = int(row_num) if str(row_num).isdigit() else None
+                row_order.append((row_num == "-", 10**9 if row_int is None else row_int, row_num, row_int, row_items))
+            row_order.sort(key=lambda k: k[:3])
+            
             self._w(tab, "[문제 목록]\n", "HEADER")
             
-            # 엑셀 파일에서 행 정보를 읽어오기 위한 준비
-            try:
-                from openpyxl import load_workbook
-                wb_temp = load_workbook(self.xlsx_path, data_only=True)
-            except Exception:
-                wb_temp = None
+            # 엑셀 파일에서 행 정보를 읽어오기 위한 준비(검사 실행 시 한 번 연 워크북 사용)
+            wb_temp = self._wb
+            
+            # 필요한 행의 A~E열 값만 iter_rows 한 번으로 읽어 둔다
+            row_cache = {}
+            needed_rows = {k[3] for k in row_order if k[3] is not None}
+            if needed_rows and sheet in self._sheetset:
+                try:
+                    first_row = min(needed_rows)
+                    rows_iter = wb_temp[sheet].iter_rows(
+                        min_row=first_row, max_row=max(needed_rows), max_col=5, values_only=True
+                    )
+                    for r, values in enumerate(rows_iter, start=first_row):
+                        if r in needed_rows:
+                            row_cache[r] = tuple(values) + (None,) * (5 - len(values))
+                except Exception:
+                    row_cache = {}
+            
+            # 과목명 열: 2024 시트는 E열(5), 나머지는 D열(4)
+            course_col = 5 if sheet == sheet_2024 else 4
             
             # 행 번호별로 출력
-            for row_num, row_items in sorted(row_groups.items(), key=lambda x: (x[0] == "-", int(x[0]) if str(x[0]).isdigit() else 10**9, x[0])):
+            for _, _, row_num, row_int, row_items in row_order:
                 # 행 정보 추출
                 row_label = None
                 
-                if row_num != "-" and str(row_num).isdigit() and wb_temp and sheet in wb_temp.sheetnames:
-                    try:
-                        ws = wb_temp[sheet]
-                        row_int = int(row_num)
-                        
-                        # 과목명 열 결정: 2024 시트는 E열(5), 나머지는 D열(4)
-                        course_col = 5 if sheet == sheet_2024 else 4
-                        
-                        # 과목명
-                        course_cell = ws.cell(row_int, course_col).value
-                        if course_cell and str(course_cell).strip():
-                            course_name = normalize_course_name(course_cell)
-                            if course_name:
-                                row_label = course_name
-                        
-                        # 2024 시트에서 E열에 과목명이 없으면 D열도 확인
-                        if not row_label and sheet == sheet_2024:
-                            d_cell = ws.cell(row_int, 4).value
-                            if d_cell and str(d_cell).strip():
-                                d_name = normalize_course_name(d_cell)
-                                if d_name:
-                                    row_label = d_name
-                        
-                        # 과목명이 없으면 A열(1) 또는 B열(2) 확인
-                        if not row_label:
-                            a_cell = ws.cell(row_int, 1).value
-                            if a_cell and str(a_cell).strip():
-                                a_text = str(a_cell).strip()
-                                # 너무 긴 텍스트는 잘라냄
-                                if len(a_text) > 30:
-                                    a_text = a_text[:27] + "..."
-                                row_label = a_text
-                            else:
-                                # B열도 확인
-                                b_cell = ws.cell(row_int, 2).value
-                                if b_cell and str(b_cell).strip():
-                                    b_text = str(b_cell).strip()
-                                    if len(b_text) > 30:
-                                        b_text = b_text[:27] + "..."
-                                    row_label = b_text
-                    except Exception:
-                        pass
+                row_values = row_cache.get(row_int)
+                if row_values:
+                    # 과목명 -> (2024 시트는 D열 과목명) -> A열 -> B열 순으로 첫 값 사용
+                    row_label = (
+                        course_label(row_values[course_col - 1])
+                        or (course_label(row_values[3]) if sheet == sheet_2024 else None)
+                        or short_label(row_values[0])
+                        or short_label(row_values[1])
+                    )
                 
                 # 메시지에서 과목명 추출 (파일을 읽을 수 없는 경우 대비)
                 if not row_label:
-                    import re
                     for it in row_items:
                         msg = it.get("message", "")
-                        matches = re.findall(r"'([^']+)'", msg)
+                        matches = QUOTED_TEXT_RE.findall(msg)
                         if matches:
                             # 첫 번째 작은따옴표 안의 텍스트가 과목명일 가능성이 높음
                             potential_name = matches[0]
@@ -3939,11 +3842,6 @@ class App:
                 # 행 헤더
                 if row_num == "-":
                     # '기타' 섹션은 특별 처리: '2026 전학년' 시트 관련 오류를 시트별로 그룹핑
-                    import re
-                    missing_course_pattern = r"'([^']+)'\s*시트.*?'([^']+)'\s*과목이\s*'2026\s*전학년'\s*시트에\s*없습니다"
-                    missing_with_row_pattern = r"'([^']+)'\s*시트\s*(\d+)행의\s*'([^']+)'\s*과목이\s*'2026\s*전학년'\s*시트에\s*없습니다"
-                    # 학생 선택 과목 패턴: '{시트명}' 시트의 '{과목명}' 과목({행번호}행[,...])이 '2026 전학년' 시트의 {열명}에 없습니다.
-                    student_missing_pattern = r"'([^']+)'\s*시트의\s*'([^']+)'\s*과목\((\d+)행[^)]*\)이\s*'2026\s*전학년'\s*시트의\s*[^에]+에\s*없습니다"
                     
                     # 시트별로 그룹핑 (학교 지정/학생 선택 구분)
                     sheet_groups = {}
@@ -3953,7 +3851,7 @@ class App:
                         msg = it.get("message", "")
                         
                         # 학생 선택 과목 패턴 (학교 지정과 학생 선택 사이 영역 또는 학생 선택 영역)
-                        match = re.search(student_missing_pattern, msg)
+                        match = STUDENT_MISSING_RE.search(msg)
                         if match:
                             source_sheet = match.group(1)
                             course = match.group(2)
@@ -3967,7 +3865,7 @@ class App:
                             continue
                         
                         # 행 번호 있는 패턴 (학교 지정 과목)
-                        match = re.search(missing_with_row_pattern, msg)
+                        match = MISSING_WITH_ROW_RE.search(msg)
                         if match:
                             source_sheet = match.group(1)
                             row_no = match.group(2)
@@ -3981,7 +3879,7 @@ class App:
                             continue
                         
                         # 행 번호 없는 패턴 (학교 지정 과목)
-                        match = re.search(missing_course_pattern, msg)
+                        match = MISSING_COURSE_RE.search(msg)
                         if match:
                             source_sheet = match.group(1)
                             course = match.group(2)
@@ -4013,28 +3911,28 @@ class App:
                             # 행 번호 있는 것들
                             for course, row_no, it in data["school"]["with_row"]:
                                 sev = it.get("severity", "INFO")
-                                self._w(tab, f"  [{sev}] {course} ({row_no}행)\n", 
-                                       sev if sev in ("ERROR", "WARNING", "CHECK") else "INFO")
+                                tag = SEVERITY_TAGS.get(sev, "INFO")
+                                self._w(tab, f"  [{sev}] {course} ({row_no}행)\n", tag)
                             
                             # 행 번호 없는 것들
                             for course, it in data["school"]["without_row"]:
                                 sev = it.get("severity", "INFO")
-                                self._w(tab, f"  [{sev}] {course}\n", 
-                                       sev if sev in ("ERROR", "WARNING", "CHECK") else "INFO")
+                                tag = SEVERITY_TAGS.get(sev, "INFO")
+                                self._w(tab, f"  [{sev}] {course}\n", tag)
                         
                         # 학생 선택 과목 출력
                         if has_student:
                             # 행 번호 있는 것들
                             for course, row_no, it in data["student"]["with_row"]:
                                 sev = it.get("severity", "INFO")
-                                self._w(tab, f"  [{sev}] {course} ({row_no}행)\n", 
-                                       sev if sev in ("ERROR", "WARNING", "CHECK") else "INFO")
+                                tag = SEVERITY_TAGS.get(sev, "INFO")
+                                self._w(tab, f"  [{sev}] {course} ({row_no}행)\n", tag)
                             
                             # 행 번호 없는 것들
                             for course, it in data["student"]["without_row"]:
                                 sev = it.get("severity", "INFO")
-                                self._w(tab, f"  [{sev}] {course}\n", 
-                                       sev if sev in ("ERROR", "WARNING", "CHECK") else "INFO")
+                                tag = SEVERITY_TAGS.get(sev, "INFO")
+                                self._w(tab, f"  [{sev}] {course}\n", tag)
                             
                             # 학생 선택 과목 목록 마지막에 안내 문구 한 번만 추가
                             self._w(tab, "      선택 미달 등으로 개설되지 않은 경우도 2026 전학년 시트에 추가하고 개설여부에 X해주세요.\n", "INFO")
@@ -4045,20 +3943,18 @@ class App:
                         self._w(tab, "─" * 80 + "\n", "INFO")
                         for it in other_items:
                             sev = it.get("severity", "INFO")
+                            tag = SEVERITY_TAGS.get(sev, "INFO")
                             msg = it.get("message", "")
                             
                             # 메시지에 줄바꿈이 있으면 첫 줄만 severity 표시, 나머지는 들여쓰기
                             lines = msg.split('\n')
                             if len(lines) > 1:
-                                self._w(tab, f"  [{sev}] {lines[0]}\n", 
-                                       sev if sev in ("ERROR", "WARNING", "CHECK") else "INFO")
+                                self._w(tab, f"  [{sev}] {lines[0]}\n", tag)
                                 for line in lines[1:]:
                                     if line.strip():  # 빈 줄이 아닌 경우만 출력
-                                        self._w(tab, f"      {line}\n", 
-                                               sev if sev in ("ERROR", "WARNING", "CHECK") else "INFO")
+                                        self._w(tab, f"      {line}\n", tag)
                             else:
-                                self._w(tab, f"  [{sev}] {msg}\n", 
-                                       sev if sev in ("ERROR", "WARNING", "CHECK") else "INFO")
+                                self._w(tab, f"  [{sev}] {msg}\n", tag)
                 else:
                     if row_label:
                         self._w(tab, f"\n▶ {row_num}행 - {row_label}\n", "COURSE")
@@ -4068,24 +3964,20 @@ class App:
                     
                     for it in row_items:
                         sev = it.get("severity", "INFO")
+                        tag = SEVERITY_TAGS.get(sev, "INFO")
                         msg = it.get("message", "")
                         
                         # 메시지에 줄바꿈이 있으면 첫 줄만 severity 표시, 나머지는 들여쓰기
                         lines = msg.split('\n')
                         if len(lines) > 1:
-                            self._w(tab, f"  [{sev}] {lines[0]}\n", 
-                                   sev if sev in ("ERROR", "WARNING", "CHECK") else "INFO")
+                            self._w(tab, f"  [{sev}] {lines[0]}\n", tag)
                             for line in lines[1:]:
                                 if line.strip():  # 빈 줄이 아닌 경우만 출력
-                                    self._w(tab, f"      {line}\n", 
-                                           sev if sev in ("ERROR", "WARNING", "CHECK") else "INFO")
+                                    self._w(tab, f"      {line}\n", tag)
                         else:
-                            self._w(tab, f"  [{sev}] {msg}\n", 
-                                   sev if sev in ("ERROR", "WARNING", "CHECK") else "INFO")
+                            self._w(tab, f"  [{sev}] {msg}\n", tag)
 
-            err_cnt = sum(1 for x in items if x.get("severity") == "ERROR")
-            warn_cnt = sum(1 for x in items if x.get("severity") == "WARNING")
-            check_cnt = sum(1 for x in items if x.get("severity") == "CHECK")
+            err_cnt, warn_cnt, check_cnt = sev_counts["ERROR"], sev_counts["WARNING"], sev_counts["CHECK"]
             self._w(tab, "\n" + "=" * 80 + "\n", "INFO")
             self._w(tab, f"[전체 요약] 오류 {err_cnt}건, 경고 {warn_cnt}건, 확인 {check_cnt}건\n", "HEADER")
 
@@ -4099,10 +3991,9 @@ class App:
         
         # 전체 탭에도 전체 지침 간단 요약(원하면 제거 가능)
         self._w("전체", "[전체 문제 요약(시트별)]\n", "HEADER")
-        for sheet, items in sorted(groups.items(), key=lambda kv: kv[0]):
-            err_cnt = sum(1 for x in items if x.get("severity") == "ERROR")
-            warn_cnt = sum(1 for x in items if x.get("severity") == "WARNING")
-            check_cnt = sum(1 for x in items if x.get("severity") == "CHECK")
+        for sheet in sorted(groups):
+            sev_counts = sheet_counts[sheet]
+            err_cnt, warn_cnt, check_cnt = sev_counts["ERROR"], sev_counts["WARNING"], sev_counts["CHECK"]
             label = sheet if sheet != "-" else "기타"
             self._w("전체", f"- {label}: 오류 {err_cnt} / 경고 {warn_cnt} / 확인 {check_cnt}\n", "INFO")
         
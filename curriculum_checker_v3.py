@@ -22,8 +22,10 @@
 """
 
 import os
-import re
 import difflib
+import threading
+import queue
+from functools import lru_cache
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 from tkinter.scrolledtext import ScrolledText
@@ -37,45 +39,83 @@ from openpyxl import load_workbook
 
 EPS = 1e-9
 
+# 엑셀 오류값(대문자 기준)
+ERROR_TOKENS = frozenset({"#N/A", "#VALUE!", "#REF!", "#DIV/0!", "#NAME?", "#NULL!", "#NUM!"})
+
+# 한 번 검사에서 새로 계산할 유사 과목명 힌트 최대 개수(이후에는 힌트 없이 오류만 보고)
+HINT_LIMIT = 50
+
 
 def normalize_course_name(name: str) -> str:
     """괄호( ) 안 내용을 제거하고, 양끝 공백만 제거(내부 공백은 유지)."""
     if name is None:
         return ""
-    s = str(name)
-    s = re.sub(r"\([^)]*\)", "", s)  # ( ... ) 제거
-    return s.strip()
+    return _normalize_course_text(str(name))
+
+
+@lru_cache(maxsize=4096)
+def _normalize_course_text(s: str) -> str:
+    """normalize_course_name의 문자열 처리 부분(같은 과목명은 숨김/연도 시트에서 반복되므로 캐시)."""
+    return strip_parens(s).strip()  # ( ... ) 제거
+
 
+def strip_parens(s: str) -> str:
+    """
+    "(" 부터 다음 ")" 까지를 제거(중첩은 고려하지 않음, 짝 없는 "("는 그대로 둠).
+    - 과목명은 짧고 괄호가 0~1쌍이라 정규식 대신 str.find로 처리
+    """
+    if "(" not in s:
+        return s
+    out = []
+    i = 0
+    while True:
+        j = s.find("(", i)
+        if j < 0:
+            break
+        k = s.find(")", j + 1)
+        if k < 0:
+            break
+        out.append(s[i:j])
+        i = k + 1
+    out.append(s[i:])
+    return "".join(out)
 
+
+@lru_cache(maxsize=4096)
 def split_bidirectional(name: str):
-    """'음악↔미술' 같은 문자열을 ['음악','미술']로 분해(양쪽 공백 제거)."""
+    """'음악↔미술' 같은 문자열을 ('음악','미술')로 분해(양쪽 공백 제거). 결과는 캐시되므로 튜플로 반환."""
     if name is None:
-        return []
+        return ()
     s = str(name)
     if "↔" not in s:
-        return []
+        return ()
     parts = [p.strip() for p in s.split("↔")]
-    parts = [p for p in parts if p != ""]
-    return parts
+    return tuple(p for p in parts if p != "")
 
 
 def is_error_token(value) -> bool:
     if value is None:
         return False
-    s = str(value).strip().upper()
-    return s in ("#N/A", "#VALUE!", "#REF!", "#DIV/0!", "#NAME?", "#NULL!", "#NUM!")
+    s = value if type(value) is str else str(value)
+    return s.strip().upper() in ERROR_TOKENS
 
 
 def to_number(value):
     """숫자 변환(정수/실수). 실패 시 None."""
+    # 셀 값은 대부분 float/int/str/None이므로 정확한 타입 비교로 먼저 처리
+    t = type(value)
+    if t is float:
+        return value if value == value else None  # NaN 체크
+    if t is int:
+        return float(value)
     if value is None:
         return None
     if isinstance(value, (int, float)):
-        # NaN 체크
+        # bool 등 하위 타입
         if isinstance(value, float) and (value != value):
             return None
         return float(value)
-    s = str(value).strip()
+    s = (value if t is str else str(value)).strip()
     if s == "":
         return None
     try:
@@ -84,6 +124,25 @@ def to_number(value):
         return None
 
 
+def find_close_courses(name, candidates, n, cache=None):
+    """
+    difflib 유사 과목명 후보(cutoff 0.6).
+    - cache(dict)를 주면 같은 (과목명, 개수) 요청은 한 번만 계산한다
+    - cache에 HINT_LIMIT개가 쌓이면 새 이름은 계산하지 않고 빈 목록을 반환
+      (오타가 아주 많은 파일에서 힌트 계산 때문에 검사가 느려지지 않도록)
+    """
+    key = (name, n)
+    if cache is not None:
+        if key in cache:
+            return cache[key]
+        if len(cache) >= HINT_LIMIT:
+            return []
+    close = difflib.get_close_matches(name, candidates, n=n, cutoff=0.6)
+    if cache is not None:
+        cache[key] = close
+    return close
+
+
 def find_sheet_for_year(sheetnames, year: int):
     """
     '2026 입학생...' 또는 '2026학년도 입학생...' 등:
@@ -113,43 +172,101 @@ def find_hidden_sheet_name(sheetnames):
 
 def build_merged_lookup(ws):
     """
-    셀 좌표(행,열) -> (min_row, min_col, max_row, max_col) 매핑을 만든다.
+    병합 영역을 한 번만 훑어서 두 가지 색인을 만든다(셀 단위로 펼치지 않음).
+    - spans: (min_row, min_col, max_row, max_col) 목록(시트에 기록된 순서)
+    - ranges_by_col: 열 번호 -> 한 열짜리(세로) 병합 영역 목록
+    return: (spans, ranges_by_col)
     """
-    lookup = {}
+    spans = []
+    ranges_by_col = {}
     for rng in ws.merged_cells.ranges:
-        min_row, min_col, max_row, max_col = rng.min_row, rng.min_col, rng.max_row, rng.max_col
-        for r in range(min_row, max_row + 1):
-            for c in range(min_col, max_col + 1):
-                lookup[(r, c)] = (min_row, min_col, max_row, max_col)
-    return lookup
+        spans.append((rng.min_row, rng.min_col, rng.max_row, rng.max_col))
+        if rng.min_col == rng.max_col:
+            ranges_by_col.setdefault(rng.min_col, []).append(rng)
+    return spans, ranges_by_col
+
+
+def merged_top_left(spans, row, col):
+    """
+    (row, col)이 병합 영역에 속하면 그 영역의 top-left 좌표, 아니면 (row, col).
+    - 수식 안내처럼 드물게 쓰이는 경로용이라 목록을 그대로 훑는다(겹치면 나중 영역 우선)
+    """
+    for min_row, min_col, max_row, max_col in reversed(spans):
+        if min_row <= row <= max_row and min_col <= col <= max_col:
+            return min_row, min_col
+    return row, col
+
 
+def merged_rows_in_col(spans, col):
+    """col 열이 병합 영역에 들어 있는 행 번호 집합."""
+    rows = set()
+    for min_row, min_col, max_row, max_col in spans:
+        if min_col <= col <= max_col:
+            rows.update(range(min_row, max_row + 1))
+    return rows
 
-def get_value_with_merge(ws_values, ws_formula, merged_lookup, row, col):
+
+def load_formula_matrix(xlsx_path, sheetname):
     """
-    data_only 값(ws_values) 기준으로:
-    - 해당 셀이 병합 영역이면 top-left 값으로 보정
-    - 동시에 수식(ws_formula)의 존재도 반환
-    return: (value, formula_str_or_none, (used_row, used_col))
+    수식 문자열이 필요한 시트만 read_only로 따로 열어 2차원 리스트로 반환.
+    - 결과값이 없는 셀의 수식을 안내할 때만 쓰므로, 처음 필요할 때 시트당 한 번만 부른다
     """
-    used_row, used_col = row, col
-    key = (row, col)
+    try:
+        wb_f = load_workbook(xlsx_path, data_only=False, read_only=True, keep_links=False, keep_vba=False)
+    except Exception:
+        return []
+    try:
+        return [list(row) for row in wb_f[sheetname].iter_rows(values_only=True)]
+    finally:
+        wb_f.close()
 
-    if key in merged_lookup:
-        min_row, min_col, _, _ = merged_lookup[key]
-        used_row, used_col = min_row, min_col
 
-    v = ws_values.cell(used_row, used_col).value
-    f = ws_formula.cell(used_row, used_col).value
-    formula = f if isinstance(f, str) and f.startswith("=") else None
-    return v, formula, (used_row, used_col)
+def get_formula_with_merge(xlsx_path, formula_cache, sheetname, merged_spans, row, col):
+    """
+    셀의 수식 문자열(없으면 None)을 반환.
+    - 해당 셀이 병합 영역이면 top-left 기준
+    - formula_cache(dict): 시트명 -> 수식 행렬 (없으면 이때 로드)
+    """
+    row, col = merged_top_left(merged_spans, row, col)
 
+    if sheetname not in formula_cache:
+        formula_cache[sheetname] = load_formula_matrix(xlsx_path, sheetname)
+    formulas = formula_cache[sheetname]
 
-def find_hidden_header_row(ws_values, ws_formula, merged_lookup):
+    if row > len(formulas) or col > len(formulas[row - 1]):
+        return None
+    f = formulas[row - 1][col - 1]
+    return f if isinstance(f, str) and f.startswith("=") else None
+
+
+def load_sheet_matrix(ws, max_col=15, merged_spans=None):
+    """
+    시트 값을 iter_rows 한 번으로 읽어 2차원 리스트로 반환(셀마다 ws.cell을 부르지 않도록).
+    values[r - 1][c - 1] = r행 c열 값 (열은 A ~ max(max_col, 시트 마지막 열))
+    - merged_spans(build_merged_lookup)를 주면 병합 영역의 모든 칸에 top-left 값을 미리 채워 둔다
+      (이후에는 병합 여부를 확인하지 않고 values[r - 1][c - 1]로 바로 읽으면 됨)
+    """
+    width = max(max_col, ws.max_column)
+    values = [list(row) for row in ws.iter_rows(min_row=1, max_row=ws.max_row, min_col=1, max_col=width, values_only=True)]
+    if merged_spans:
+        n_rows = len(values)
+        spans = [sp for sp in merged_spans if sp[0] <= n_rows and sp[1] <= width]
+        # top-left 값은 채우기 전에 먼저 읽어 둔다(영역이 겹쳐 있어도 원래 값 기준, 나중 영역 우선)
+        tops = [values[min_row - 1][min_col - 1] for min_row, min_col, _, _ in spans]
+        for (min_row, min_col, max_row, max_col), v in zip(spans, tops):
+            right = min(max_col, width)
+            for r in range(min_row, min(max_row, n_rows) + 1):
+                values[r - 1][min_col - 1:right] = [v] * (right - min_col + 1)
+    return values
+
+
+def find_hidden_header_row(values):
     """
     숨김 시트에서 '과목명' 헤더가 있는 행을 찾음(기본 2행).
+    values: 병합 보정된 숨김 시트 값 행렬(load_sheet_matrix)
     """
-    for r in range(1, 21):
-        v, _, _ = get_value_with_merge(ws_values, ws_formula, merged_lookup, r, 2)  # B열
+    for r, row in enumerate(values[:20], start=1):
+        v = row[1]  # B열
         if v is not None and str(v).strip() == "과목명":
             return r
     return 2
@@ -175,17 +292,25 @@ def is_colored_fill(cell) -> bool:
     if fill is None:
         return False
 
-    # 기본(무채움)은 patternType None/None 또는 'none'일 가능성이 높음
+    # 판단에 필요한 값만 꺼내서 캐시된 분류 함수에 넘긴다(대부분의 행이 같은 채우기를 공유)
     pt = getattr(fill, "patternType", None)
-    if pt is None or str(pt).lower() in ("none", "null"):
-        return False
-
     fg = getattr(fill, "fgColor", None)
     if fg is None:
-        return True  # 패턴이 있는데 색 정보가 없으면 일단 색 있는 것으로 처리
-
+        return _classify_fill(pt, False, None, None)
     ctype = getattr(fg, "type", None)
     val = getattr(fg, "value", None) or getattr(fg, "rgb", None)
+    return _classify_fill(pt, True, ctype, val)
+
+
+@lru_cache(maxsize=256)
+def _classify_fill(pt, has_fg, ctype, val) -> bool:
+    """is_colored_fill의 판단 부분(채우기 속성 값 -> 색 있음 여부)."""
+    # 기본(무채움)은 patternType None/None 또는 'none'일 가능성이 높음
+    if pt is None or str(pt).lower() in ("none", "null"):
+        return False
+
+    if not has_fg:
+        return True  # 패턴이 있는데 색 정보가 없으면 일단 색 있는 것으로 처리
 
     # theme/indexed는 정확 RGB가 없을 수 있으므로 색으로 간주(제외)
     if ctype in ("theme", "indexed"):
@@ -228,9 +353,10 @@ def run_checks(xlsx_path: str):
     issues = []
     summary = {}
 
+    # 이 프로그램은 파일을 읽기만 하고 다시 저장하지 않으므로
+    # 외부 링크/VBA 정보는 읽지 않는다(keep_links=False, keep_vba=False)
     try:
-        wb_v = load_workbook(xlsx_path, data_only=True)
-        wb_f = load_workbook(xlsx_path, data_only=False)
+        wb_v = load_workbook(xlsx_path, data_only=True, keep_links=False, keep_vba=False)
     except Exception as e:
         return ([{"severity": "ERROR", "sheet": "-", "row": "-", "message": f"엑셀 파일을 열 수 없습니다: {e}"}], {})
 
@@ -251,28 +377,21 @@ def run_checks(xlsx_path: str):
         return issues, {"targets": targets, "hidden_sheet": None}
 
     ws_hidden_v = wb_v[hidden_name]
-    ws_hidden_f = wb_f[hidden_name]
-    hidden_merge = build_merged_lookup(ws_hidden_f)
-    header_row = find_hidden_header_row(ws_hidden_v, ws_hidden_f, hidden_merge)
+    hidden_merge, _ = build_merged_lookup(ws_hidden_v)
+    hidden_values = load_sheet_matrix(ws_hidden_v, 7, merged_spans=hidden_merge)
+    header_row = find_hidden_header_row(hidden_values)
     data_start = header_row + 1
 
     # 숨김 과목 사전 구축
     # B:과목명, C:유형, D:기본학점, E:성적처리, F:최소, G:최대
     hidden = {}
     hidden_list_norm = []
-    r = data_start
-    while True:
-        course_raw, _, _ = get_value_with_merge(ws_hidden_v, ws_hidden_f, hidden_merge, r, 2)  # B
+    for r, row in enumerate(hidden_values[data_start - 1:], start=data_start):
+        course_raw, typ, basic, grade, minc, maxc = row[1:7]  # B ~ G
         if course_raw is None or str(course_raw).strip() == "":
             break
         course_norm = normalize_course_name(course_raw)
 
-        typ, _, _ = get_value_with_merge(ws_hidden_v, ws_hidden_f, hidden_merge, r, 3)  # C
-        basic, _, _ = get_value_with_merge(ws_hidden_v, ws_hidden_f, hidden_merge, r, 4)  # D
-        grade, _, _ = get_value_with_merge(ws_hidden_v, ws_hidden_f, hidden_merge, r, 5)  # E
-        minc, _, _ = get_value_with_merge(ws_hidden_v, ws_hidden_f, hidden_merge, r, 6)  # F
-        maxc, _, _ = get_value_with_merge(ws_hidden_v, ws_hidden_f, hidden_merge, r, 7)  # G
-
         rec = {
             "course_raw": safe_strip(course_raw),
             "type": safe_strip(typ),
@@ -294,7 +413,10 @@ def run_checks(xlsx_path: str):
             hidden[course_norm] = rec
             hidden_list_norm.append(course_norm)
 
-        r += 1
+    # 유사 과목명 힌트 캐시(같은 오타가 여러 행/시트에 반복되는 경우가 많음)
+    close_cache = {}
+    # 수식 문자열은 결과값이 없는 셀을 안내할 때만 필요하므로 시트별로 처음 필요할 때 로드
+    formula_cache = {}
 
     summary["targets"] = targets
     summary["hidden_sheet"] = hidden_name
@@ -309,8 +431,8 @@ def run_checks(xlsx_path: str):
     # =========================
     for year, sname in targets.items():
         ws_v = wb_v[sname]
-        ws_f = wb_f[sname]
-        merge_lookup = build_merged_lookup(ws_f)
+        merge_spans, merged_by_col = build_merged_lookup(ws_v)
+        values = load_sheet_matrix(ws_v, merged_spans=merge_spans)
 
         first_row = 5
         course_col = 4  # D
@@ -318,13 +440,14 @@ def run_checks(xlsx_path: str):
         basic_col = 5   # E
         op_col = 6      # F
         sem_cols = list(range(7, 13))  # G~L
+        sem_slice = slice(sem_cols[0] - 1, sem_cols[-1])  # 행 리스트에서 G~L 구간
         total_cols = [13, 14]          # M, N
         grading_col = 15               # O
 
         # last row (D 기준)
         last_row = None
-        for rr in range(ws_f.max_row, first_row - 1, -1):
-            v, _, _ = get_value_with_merge(ws_v, ws_f, merge_lookup, rr, course_col)
+        for rr in range(len(values), first_row - 1, -1):
+            v = values[rr - 1][course_col - 1]
             if v is None or str(v).strip() == "":
                 continue
             last_row = rr
@@ -337,47 +460,30 @@ def run_checks(xlsx_path: str):
         exempt_rows = set()
         if year in (2025, 2026):
             for rr in range(first_row, last_row + 1):
-                cell = ws_f.cell(rr, course_col)
+                cell = ws_v.cell(rr, course_col)
                 if is_colored_fill(cell):
                     exempt_rows.add(rr)
 
-        # row_total(각 행의 G~L 합) 계산 (색깔 행은 계산에서도 제외)
-        row_total = {}
-        for rr in range(first_row, last_row + 1):
-            if rr in exempt_rows:
-                continue
-
-            course_v, _, _ = get_value_with_merge(ws_v, ws_f, merge_lookup, rr, course_col)
-            if course_v is None or str(course_v).strip() == "":
-                continue
-
-            if is_error_token(course_v):
-                issues.append({"severity": "ERROR", "sheet": sname, "row": rr, "message": f"과목명(D{rr})에 오류값이 있습니다: {course_v}"})
-                continue
-
-            sem_sum = 0.0
-            any_num = False
-            for cc in sem_cols:
-                v, _, _ = get_value_with_merge(ws_v, ws_f, merge_lookup, rr, cc)
-                n = to_number(v)
-                if n is not None:
-                    sem_sum += n
-                    any_num = True
-
-            row_total[rr] = sem_sum if any_num else 0.0
-
         # ========== 과목 단위 검사 ==========
+        # row_total(각 행의 G~L 합)도 같은 순회에서 계산 (색깔 행은 계산에서도 제외)
+        row_total = {}
         for rr in range(first_row, last_row + 1):
             if rr in exempt_rows:
                 # 색깔 행은 모든 검사 제외
                 continue
 
-            course_raw, _, _ = get_value_with_merge(ws_v, ws_f, merge_lookup, rr, course_col)
+            row_vals = values[rr - 1]  # 이 행의 값(병합 보정됨)
+            course_raw = row_vals[course_col - 1]
             if course_raw is None or str(course_raw).strip() == "":
                 continue
             if is_error_token(course_raw):
+                issues.append({"severity": "ERROR", "sheet": sname, "row": rr, "message": f"과목명(D{rr})에 오류값이 있습니다: {course_raw}"})
                 continue
 
+            # 숫자로 바뀌는 칸만 합산(숫자가 하나도 없으면 0)
+            nums = [n for n in map(to_number, row_vals[sem_slice]) if n is not None]
+            row_total[rr] = sum(nums, 0.0)
+
             course_norm = normalize_course_name(course_raw)
             if course_norm == "":
                 issues.append({"severity": "ERROR", "sheet": sname, "row": rr, "message": "과목명(D열)에서 괄호 제거 후 이름이 비었습니다."})
@@ -402,7 +508,7 @@ def run_checks(xlsx_path: str):
                         # 유사 후보 힌트(각 missing마다 1개)
                         hints = []
                         for m in missing:
-                            close = difflib.get_close_matches(m, hidden_list_norm, n=1, cutoff=0.6)
+                            close = find_close_courses(m, hidden_list_norm, 1, close_cache)
                             if close:
                                 hints.append(f"{m}→{close[0]}")
                         hint_txt = f" (유사 후보: {', '.join(hints)})" if hints else ""
@@ -412,7 +518,7 @@ def run_checks(xlsx_path: str):
                 else:
                     if course_norm not in hidden:
                         hint = ""
-                        close = difflib.get_close_matches(course_norm, hidden_list_norm, n=2, cutoff=0.6)
+                        close = find_close_courses(course_norm, hidden_list_norm, 2, close_cache)
                         if close:
                             hint = f" (유사 과목명 후보: {', '.join(close)})"
                         issues.append({"severity": "ERROR", "sheet": sname, "row": rr, "message": f"숨김 시트 과목명과 불일치: '{course_norm}'{hint}"})
@@ -423,7 +529,7 @@ def run_checks(xlsx_path: str):
             # (3) 유형/기본학점/성적처리 (숨김 매칭이 있을 때만)
             if hidden_rec is not None:
                 # 유형(C)
-                typ_v, _, _ = get_value_with_merge(ws_v, ws_f, merge_lookup, rr, type_col)
+                typ_v = row_vals[type_col - 1]
                 typ_s = safe_strip(typ_v)
                 if typ_s == "":
                     issues.append({"severity": "ERROR", "sheet": sname, "row": rr, "message": f"유형(C{rr})이 비어 있습니다. (숨김: {hidden_rec['type']})"})
@@ -431,9 +537,10 @@ def run_checks(xlsx_path: str):
                     issues.append({"severity": "ERROR", "sheet": sname, "row": rr, "message": f"유형 불일치: 시트='{typ_s}' / 숨김='{hidden_rec['type']}'"})
 
                 # 기본학점(E)
-                basic_v, basic_formula, _ = get_value_with_merge(ws_v, ws_f, merge_lookup, rr, basic_col)
+                basic_v = row_vals[basic_col - 1]
                 basic_n = to_number(basic_v)
                 if basic_n is None:
+                    basic_formula = get_formula_with_merge(xlsx_path, formula_cache, sname, merge_spans, rr, basic_col)
                     if basic_formula:
                         issues.append({"severity": "WARNING", "sheet": sname, "row": rr, "message": f"기본학점(E{rr})이 수식이지만 결과값이 없습니다(엑셀 재계산/저장 필요). (수식: {basic_formula})"})
                     else:
@@ -443,7 +550,7 @@ def run_checks(xlsx_path: str):
                         issues.append({"severity": "ERROR", "sheet": sname, "row": rr, "message": f"기본학점 불일치: 시트={basic_n:g} / 숨김={hidden_rec['basic']:g}"})
 
                 # 성적처리(O)
-                grade_v, _, _ = get_value_with_merge(ws_v, ws_f, merge_lookup, rr, grading_col)
+                grade_v = row_vals[grading_col - 1]
                 grade_s = safe_strip(grade_v)
                 if grade_s == "":
                     issues.append({"severity": "ERROR", "sheet": sname, "row": rr, "message": f"성적처리 유형(O{rr})이 비어 있습니다. (숨김: {hidden_rec['grading']})"})
@@ -453,11 +560,12 @@ def run_checks(xlsx_path: str):
             # (4)(5) 운영학점 범위/합계 체크
             # - 범위(최소~최대)는 숨김 매칭이 있을 때만
             # - 합계(운영학점 vs G~L합)는 모든 행(색깔 행 제외)에 대해 수행
-            op_v, op_formula, _ = get_value_with_merge(ws_v, ws_f, merge_lookup, rr, op_col)
+            op_v = row_vals[op_col - 1]
             op_n = to_number(op_v)
             sem_sum = row_total.get(rr, 0.0)
 
             if op_n is None:
+                op_formula = get_formula_with_merge(xlsx_path, formula_cache, sname, merge_spans, rr, op_col)
                 if op_formula:
                     issues.append({"severity": "WARNING", "sheet": sname, "row": rr, "message": f"운영학점(F{rr})이 수식이지만 결과값이 없습니다(엑셀 재계산/저장 필요). (수식: {op_formula})"})
                 else:
@@ -473,7 +581,7 @@ def run_checks(xlsx_path: str):
                     # 합이 0이면 바로 위 행 운영학점과 비교(같으면 OK)
                     prev = None
                     if rr > first_row:
-                        pv, _, _ = get_value_with_merge(ws_v, ws_f, merge_lookup, rr - 1, op_col)
+                        pv = values[rr - 2][op_col - 1]  # 바로 위 행
                         prev = to_number(pv)
                     if prev is not None and abs(op_n - prev) <= EPS:
                         pass  # OK
@@ -485,9 +593,8 @@ def run_checks(xlsx_path: str):
 
         # (6) M/N 병합 구간 합계 체크 (색깔 행은 기대값에서도 제외)
         checked_spans = set()
-        for rng in ws_f.merged_cells.ranges:
-            if rng.min_col in total_cols and rng.max_col == rng.min_col:
-                col = rng.min_col
+        for col in total_cols:
+            for rng in merged_by_col.get(col, ()):
                 if rng.max_row < first_row:
                     continue
 
@@ -501,19 +608,20 @@ def run_checks(xlsx_path: str):
                     continue
                 checked_spans.add(key)
 
-                total_v, total_formula, _ = get_value_with_merge(ws_v, ws_f, merge_lookup, rng.min_row, col)
+                total_v = values[rng.min_row - 1][col - 1]
                 total_n = to_number(total_v)
 
                 expected = 0.0
                 for rr in range(start, end + 1):
                     if rr in exempt_rows:
                         continue
-                    cv, _, _ = get_value_with_merge(ws_v, ws_f, merge_lookup, rr, course_col)
+                    cv = values[rr - 1][course_col - 1]
                     if cv is None or str(cv).strip() == "" or is_error_token(cv):
                         continue
                     expected += row_total.get(rr, 0.0)
 
                 if total_n is None:
+                    total_formula = get_formula_with_merge(xlsx_path, formula_cache, sname, merge_spans, rng.min_row, col)
                     if total_formula:
                         issues.append({"severity": "WARNING", "sheet": sname, "row": rng.min_row, "message": f"{'M' if col==13 else 'N'}열 합계 셀에 수식은 있으나 결과값이 없습니다(엑셀 재계산/저장 필요). (수식: {total_formula})"})
                     else:
@@ -523,27 +631,18 @@ def run_checks(xlsx_path: str):
                         issues.append({"severity": "ERROR", "sheet": sname, "row": rng.min_row, "message": f"{'M' if col==13 else 'N'}열 병합구간 합계 불일치: 셀값={total_n:g}, 기대값(G~L합)={expected:g} (구간 {start}~{end}행, 색깔행 제외)"})
 
         # 병합이 아닌 단일 셀 합계 보조 체크(색깔행 제외)
+        # row_total에는 색깔 행/빈 과목/오류값 과목을 뺀 행만 (행 순서대로) 들어 있으므로 그 행만 본다
         for col in total_cols:
-            for rr in range(first_row, last_row + 1):
-                if rr in exempt_rows:
-                    continue
-
-                if (rr, col) in merge_lookup:
-                    min_r, min_c, _, _ = merge_lookup[(rr, col)]
-                    if not (rr == min_r and col == min_c):
-                        continue
+            merged_rows = merged_rows_in_col(merge_spans, col)
+            for rr, expected in row_total.items():
+                if rr in merged_rows:
+                    # 병합 셀은 위의 병합 구간 체크에서 처리
                     continue
 
-                tv, _, _ = get_value_with_merge(ws_v, ws_f, merge_lookup, rr, col)
-                tn = to_number(tv)
+                tn = to_number(values[rr - 1][col - 1])
                 if tn is None:
                     continue
 
-                cv, _, _ = get_value_with_merge(ws_v, ws_f, merge_lookup, rr, course_col)
-                if cv is None or str(cv).strip() == "" or is_error_token(cv):
-                    continue
-
-                expected = row_total.get(rr, 0.0)
                 if abs(tn - expected) > EPS:
                     issues.append({"severity": "ERROR", "sheet": sname, "row": rr, "message": f"{'M' if col==13 else 'N'}열 단일행 합계 불일치: 셀값={tn:g}, 기대값(G~L합)={expected:g}"})
 
@@ -700,18 +799,48 @@ class App:
         self.out.delete("1.0", "end")
         self.status_var.set("검사 중...")
         self.progress.start(12)
-        self.root.update_idletasks()
+        self._set_buttons_busy(True)
+
+        # 검사는 작업 스레드에서 실행하고, 결과는 큐를 통해 UI 스레드로 전달
+        self._result_queue = queue.Queue()
+        threading.Thread(target=self._run_worker, args=(self.xlsx_path,), daemon=True).start()
+        self.root.after(50, self._poll_queue)
+
+    def _set_buttons_busy(self, busy):
+        if busy:
+            self.btn_pick.configure(state="disabled")
+            self.btn_run.configure(state="disabled", bg="#C7C9D9", activebackground="#C7C9D9")
+        else:
+            self.btn_pick.configure(state="normal")
+            self.btn_run.configure(state="normal", bg=self.colors["accent"], activebackground=self.colors["accent"])
 
+    def _run_worker(self, path):
+        # 작업 스레드: Tk 위젯에 접근하지 않고 결과만 큐에 넣는다
         try:
-            issues, summary = run_checks(self.xlsx_path)
+            issues, summary = run_checks(path)
         except Exception as e:
-            self.progress.stop()
-            self.status_var.set("오류 발생")
-            messagebox.showerror("오류", f"검사 중 예외가 발생했습니다:\n{e}")
+            self._result_queue.put(("err", e, None))
+            return
+        self._result_queue.put(("ok", issues, summary))
+
+    def _poll_queue(self):
+        try:
+            kind, a, b = self._result_queue.get_nowait()
+        except queue.Empty:
+            self.root.after(50, self._poll_queue)
             return
 
         self.progress.stop()
+        self._set_buttons_busy(False)
+
+        if kind == "err":
+            self.status_var.set("오류 발생")
+            messagebox.showerror("오류", f"검사 중 예외가 발생했습니다:\n{a}")
+            return
+
+        self._show_results(a, b)
 
+    def _show_results(self, issues, summary):
         self._print_summary(summary)
         self._print_issues(issues)
 
@@ -750,18 +879,17 @@ class App:
 
         sev_rank = {"ERROR": 0, "WARNING": 1, "INFO": 2}
 
-        def key(x):
-            sheet = x.get("sheet", "")
-            row = x.get("row", "-")
-            try:
-                row_n = int(row)
-            except Exception:
-                row_n = 10**9
-            return (sev_rank.get(x.get("severity", "INFO"), 9), sheet, row_n)
-
-        issues_sorted = sorted(issues, key=key)
+        # 정렬 키(심각도, 시트, 행 번호)를 미리 만들어 둔다. 행이 '-' 등이면 맨 뒤로.
+        decorated = []
+        for it in issues:
+            row = it.get("row", "-")
+            row_n = int(row) if str(row).isdigit() else 10**9
+            decorated.append(((sev_rank.get(it.get("severity", "INFO"), 9), it.get("sheet", ""), row_n), it))
+        decorated.sort(key=lambda p: p[0])
+        issues_sorted = [it for _, it in decorated]
 
-        self.out.insert("end", "[문제 목록]\n", "HEADER")
+        # (텍스트, 태그) 쌍을 모아 두었다가 insert 한 번으로 출력(줄마다 위젯 갱신하지 않도록)
+        parts = ["[문제 목록]\n", "HEADER"]
 
         for it in issues_sorted:
             sev = it.get("severity", "INFO")
@@ -769,12 +897,12 @@ class App:
             row = it.get("row", "-")
             msg = it.get("message", "")
             line = f"- [{sev}] {sheet} / 행 {row}: {msg}\n"
-            self.out.insert("end", line, sev if sev in ("ERROR", "WARNING") else "INFO")
+            parts += (line, sev if sev in ("ERROR", "WARNING") else "INFO")
 
         err_cnt = sum(1 for x in issues if x.get("severity") == "ERROR")
         warn_cnt = sum(1 for x in issues if x.get("severity") == "WARNING")
-        self.out.insert("end", "\n", "INFO")
-        self.out.insert("end", f"[요약] 오류 {err_cnt}건, 경고 {warn_cnt}건\n", "HEADER")
+        parts += ("\n", "INFO", f"[요약] 오류 {err_cnt}건, 경고 {warn_cnt}건\n", "HEADER")
+        self.out.insert("end", *parts)
 
 
 def main():
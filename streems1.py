@@ -1,8 +1,21 @@
 import tkinter as tk
 import random
+import math
 
 # 스트림스 카드 뽑기 프로그램 (단일 파일 버전)
 
+# 전체 카드 구성: 1~10 한 장, 11~20 두 장, 21~30 한 장 (총 40장)
+BASE_DECK = (
+    list(range(1, 11))          # 1~10: 1장
+    + list(range(11, 21)) * 2   # 11~20: 2장
+    + list(range(21, 31))       # 21~30: 1장
+)
+DRAW_COUNT = 20  # 한 게임에서 뽑는 카드 수
+
+# build_deck의 스왑 위치 j를 한 번에 뽑기 위한 전체 경우의 수(40 × 39 × … × 21)와 비트 수
+SWAP_SPACE = math.prod(range(len(BASE_DECK) - DRAW_COUNT + 1, len(BASE_DECK) + 1))
+SWAP_BITS = SWAP_SPACE.bit_length()
+
 class StreamsApp:
     def __init__(self, root):
         self.root = root
@@ -25,6 +38,10 @@ class StreamsApp:
             "text_main": "#111827",     # 메인 텍스트
             "text_sub": "#6B7280",      # 서브 텍스트
         }
+        # 카드 뽑기/다시하기 때 자주 쓰는 색은 속성으로도 둔다 (예: self._c_primary)
+        for key, value in self.colors.items():
+            setattr(self, f"_c_{key}", value)
+        self._counter_fmt = "{} / 20 장".format
         
         self.root.configure(bg=self.colors["bg"])
         
@@ -48,14 +65,22 @@ class StreamsApp:
     
     # ---------- 카드 덱 관련 ----------
     def build_deck(self):
-        """스트림스 카드 덱 생성: 1~10 한 장, 11~20 두 장, 21~30 세 장"""
-        deck = []
-        deck.extend(range(1, 11))             # 1~10: 1장
-        deck.extend(range(11, 21))            # 11~20: 1세트
-        deck.extend(range(11, 21))            # 11~20: 2세트 (총 2장)
-        deck.extend(range(21, 31))            # 21~30: 1세트
-        random.shuffle(deck)
-        return deck
+        """스트림스 카드 덱 생성: 전체 40장 중 실제로 뽑을 20장만 무작위 순서로 고른다"""
+        # 뒤에서부터 DRAW_COUNT번만 섞는 Fisher-Yates(Durstenfeld).
+        # 40장을 다 섞은 뒤 20장만 쓰는 것과 분포가 같다.
+        # 스왑 위치 j 20개는 [0, SWAP_SPACE) 범위의 정수 하나를 뽑아 divmod로 한 자리씩 꺼낸다
+        # (getrandbits로 뽑고 범위를 넘으면 다시 뽑으므로 균등, 보통 한두 번이면 끝남)
+        rb = random.getrandbits
+        w = rb(SWAP_BITS)
+        while w >= SWAP_SPACE:
+            w = rb(SWAP_BITS)
+
+        deck = BASE_DECK.copy()
+        n = len(deck)
+        for i in range(n - 1, n - 1 - DRAW_COUNT, -1):
+            w, j = divmod(w, i + 1)
+            deck[i], deck[j] = deck[j], deck[i]
+        return deck[n - DRAW_COUNT:]
     
     def reset_game(self):
         """게임 상태 초기화"""
@@ -65,12 +90,14 @@ class StreamsApp:
         self.update_card_display(None)
         self.update_counter()
         
-        # 표 초기화
-        for label in self.table_cells:
-            label.config(text=" ", bg=self.colors["table_cell"])
+        # 표 초기화 (20칸을 Tcl 호출 한 번으로)
+        self.root.tk.eval(
+            f'foreach w {{{self._cell_names}}} '
+            f'{{$w configure -text " " -background {self._c_table_cell}}}'
+        )
         
         # 버튼 활성화
-        self.draw_button.config(state="normal", bg=self.colors["primary"])
+        self.draw_button.config(state="normal", bg=self._c_primary)
     
     # ---------- 화면 전환 ----------
     def show_start_screen(self):
@@ -298,17 +325,19 @@ class StreamsApp:
             )
             cell.grid(row=r, column=c, padx=3, pady=3, ipadx=4, ipady=2)
             self.table_cells.append(cell)
+        
+        # 다시하기 때 셀들을 한 번에 초기화하기 위한 Tcl 위젯 이름 목록
+        self._cell_names = " ".join(str(cell) for cell in self.table_cells)
     
     # ---------- 카드 뽑기/화면 업데이트 ----------
     def update_card_display(self, value):
         if value is None:
-            self.card_label.config(text="Ready", fg=self.colors["accent"])
+            self.card_label.config(text="Ready", fg=self._c_accent)
         else:
-            self.card_label.config(text=str(value), fg=self.colors["text_main"])
+            self.card_label.config(text=str(value), fg=self._c_text_main)
     
     def update_counter(self):
-        count = len(self.drawn_cards)
-        self.counter_label.config(text=f"{count} / 20 장")
+        self.counter_label.config(text=self._counter_fmt(len(self.drawn_cards)))
     
     def draw_card(self):
         # 20장까지 뽑기
@@ -338,7 +367,7 @@ class StreamsApp:
         # 20번째 카드를 뽑으면 버튼 비활성화
         if len(self.drawn_cards) >= 20:
             self.draw_button.config(state="disabled", bg="#9CA3AF")
-            self.card_label.config(fg=self.colors["accent"])
+            self.card_label.config(fg=self._c_accent)
     
 
 if __name__ == "__main__":
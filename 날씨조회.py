@@ -1,14 +1,31 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, font
 import requests
+from requests.adapters import HTTPAdapter
 import json
 from datetime import datetime
 import logging
+import threading
+import queue
+import time
+
+# orjson이 설치되어 있으면 JSON 파싱에 사용 (없으면 표준 json)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# 요청 제한 시간(초): 응답이 없을 때 화면이 무한정 멈추지 않도록
+REQUEST_TIMEOUT = 5
+
+# 같은 지역을 다시 조회할 때 서버에 다시 묻지 않고 재사용하는 시간(초)
+CACHE_TTL = 60
+
 class WeatherApp:
     def __init__(self, root):
         self.root = root
@@ -51,6 +68,19 @@ class WeatherApp:
             "제주도": "Jeju-do"
         }
         
+        # 지역별 조회 URL (조회할 때마다 만들지 않도록 미리 구성)
+        self.city_to_url = {
+            city: f"https://wttr.in/{eng}?format=j1" for city, eng in self.city_to_eng.items()
+        }
+        
+        # HTTP 세션 (같은 wttr.in 호스트에 대한 연결을 재사용해 두 번째 조회부터는 TLS 핸드셰이크 생략)
+        self.session = requests.Session()
+        self.session.headers["User-Agent"] = "WeatherApp/1.0"
+        self.session.mount("https://", HTTPAdapter(pool_connections=2, pool_maxsize=4))
+        
+        # 지역별 날씨 캐시: 영어 지역명 -> (조회 시각(time.monotonic), 응답 JSON)
+        self._wx_cache = {}
+        
         # 폰트 설정
         self.custom_font = font.Font(family="맑은 고딕", size=10)
         self.title_font = font.Font(family="맑은 고딕", size=14, weight="bold")
@@ -109,7 +139,7 @@ class WeatherApp:
         self.city_combobox.grid(row=0, column=1, padx=10, pady=10)
         self.city_combobox.current(0)  # 기본값: 서울
         
-        search_button = tk.Button(
+        self.search_button = tk.Button(
             selection_frame, 
             text="날씨 조회",
             font=self.custom_font,
@@ -119,7 +149,7 @@ class WeatherApp:
             relief=tk.RAISED,
             command=self.get_weather
         )
-        search_button.grid(row=0, column=2, padx=10, pady=10)
+        self.search_button.grid(row=0, column=2, padx=10, pady=10)
         
         # 결과 표시 프레임
         self.result_frame = tk.Frame(self.root, bg=self.colors["bg"], bd=1, relief=tk.SOLID, highlightbackground=self.colors["border"])
@@ -165,49 +195,69 @@ class WeatherApp:
         )
         self.time_label.pack(side=tk.RIGHT)
         
-        # 1초마다 시간 업데이트
+        # 분이 바뀔 때마다 시간 업데이트
         self.update_time()
     
-    def get_current_time(self):
-        now = datetime.now()
-        return now.strftime("%Y-%m-%d %H:%M:%S")
+    def get_current_time(self, now=None):
+        now = now or datetime.now()
+        return now.strftime("%Y-%m-%d %H:%M")
     
     def update_time(self):
-        self.time_label.config(text=self.get_current_time())
-        self.root.after(1000, self.update_time)
+        # 초는 표시하지 않으므로 매초 깨우지 않고 다음 분이 시작될 때 한 번만 갱신
+        now = datetime.now()
+        self.time_label.config(text=self.get_current_time(now))
+        delay_ms = (60 - now.second) * 1000 - now.microsecond // 1000
+        self.root.after(max(delay_ms, 1), self.update_time)
     
     def get_weather(self):
         city = self.city_combobox.get()
         eng_city = self.city_to_eng.get(city, city)  # 영어 이름으로 변환
+        
+        # 최근(CACHE_TTL초 이내)에 조회한 지역이면 저장된 응답으로 바로 표시
+        fetched_at, weather_data = self._wx_cache.get(eng_city, (None, None))
+        if weather_data is not None and time.monotonic() - fetched_at < CACHE_TTL:
+            self.weather_info.config(text=self.format_weather(city, weather_data))
+            self.status_label.config(text=f"{city} 날씨 정보 조회 완료")
+            logger.info(f"{city} 날씨 정보 캐시 사용")
+            return
+        
         self.status_label.config(text=f"{city} 날씨 정보를 가져오는 중...")
+        self.search_button.config(state=tk.DISABLED)
         
+        # 네트워크 요청은 작업 스레드에서 하고, 결과는 큐를 통해 UI 스레드로 전달
+        # (요청 중에도 창이 멈추지 않고 시계도 계속 갱신됨)
+        self._result_queue = queue.Queue()
+        threading.Thread(target=self._fetch_weather, args=(city, eng_city), daemon=True).start()
+        self.root.after(50, self._poll_weather)
+    
+    def _poll_weather(self):
         try:
-            # WeatherAPI 사용 (무료 API)
-            url = f"https://wttr.in/{eng_city}?format=j1"
-            
-            logger.info(f"{city} 날씨 정보 요청: {url}")
-            
-            response = requests.get(url)
-            
-            if response.status_code == 200:
-                try:
-                    weather_data = response.json()
-                    
-                    # 날씨 정보 파싱
-                    current = weather_data["current_condition"][0]
-                    temp_c = current["temp_C"]
-                    feels_like = current["FeelsLikeC"]
-                    humidity = current["humidity"]
-                    description = current["weatherDesc"][0]["value"]
-                    wind_speed = current["windspeedKmph"]
-                    
-                    # 일출, 일몰 시간
-                    astronomy = weather_data["weather"][0]["astronomy"][0]
-                    sunrise = astronomy["sunrise"]
-                    sunset = astronomy["sunset"]
-                    
-                    # 결과 메시지 구성
-                    result_message = f"""
+            result_message, status = self._result_queue.get_nowait()
+        except queue.Empty:
+            self.root.after(50, self._poll_weather)
+            return
+        
+        # 결과 업데이트
+        self.weather_info.config(text=result_message)
+        self.status_label.config(text=status)
+        self.search_button.config(state=tk.NORMAL)
+    
+    def format_weather(self, city, weather_data):
+        # 날씨 정보 파싱
+        current = weather_data["current_condition"][0]
+        temp_c = current["temp_C"]
+        feels_like = current["FeelsLikeC"]
+        humidity = current["humidity"]
+        description = current["weatherDesc"][0]["value"]
+        wind_speed = current["windspeedKmph"]
+        
+        # 일출, 일몰 시간
+        astronomy = weather_data["weather"][0]["astronomy"][0]
+        sunrise = astronomy["sunrise"]
+        sunset = astronomy["sunset"]
+        
+        # 결과 메시지 구성
+        return f"""
 지역: {city}
 현재 기온: {temp_c}°C (체감 온도: {feels_like}°C)
 날씨 상태: {description}
@@ -215,28 +265,44 @@ class WeatherApp:
 풍속: {wind_speed} km/h
 일출: {sunrise}
 일몰: {sunset}
-                    """
+        """
+    
+    def _fetch_weather(self, city, eng_city):
+        # 작업 스레드: Tk 위젯에 접근하지 않고 (표시할 문구, 상태 문구)만 큐에 넣는다
+        try:
+            # WeatherAPI 사용 (무료 API)
+            url = self.city_to_url[city]
+            
+            logger.info(f"{city} 날씨 정보 요청: {url}")
+            
+            response = self.session.get(url, timeout=REQUEST_TIMEOUT)
+            
+            if response.status_code == 200:
+                try:
+                    parse_start = time.perf_counter()
+                    if ORJSON_AVAILABLE:
+                        weather_data = orjson.loads(response.content)
+                    else:
+                        weather_data = json.loads(response.content)
+                    logger.debug(f"{city} 응답 파싱 시간: {(time.perf_counter() - parse_start) * 1000:.2f}ms")
+                    result_message = self.format_weather(city, weather_data)
+                    self._wx_cache[eng_city] = (time.monotonic(), weather_data)
                     
-                    # 결과 업데이트
-                    self.weather_info.config(text=result_message)
-                    self.status_label.config(text=f"{city} 날씨 정보 조회 완료")
+                    self._result_queue.put((result_message, f"{city} 날씨 정보 조회 완료"))
                     logger.info(f"{city} 날씨 정보 조회 성공")
                 except json.JSONDecodeError as e:
                     error_msg = f"JSON 파싱 오류: {str(e)}"
-                    self.weather_info.config(text=error_msg)
-                    self.status_label.config(text="JSON 파싱 오류")
+                    self._result_queue.put((error_msg, "JSON 파싱 오류"))
                     logger.error(error_msg, exc_info=True)
                 
             else:
                 error_msg = f"날씨 정보를 가져오는데 실패했습니다. 상태 코드: {response.status_code}"
-                self.weather_info.config(text=error_msg)
-                self.status_label.config(text="날씨 정보 조회 실패")
+                self._result_queue.put((error_msg, "날씨 정보 조회 실패"))
                 logger.error(error_msg)
                 
         except Exception as e:
             error_msg = f"오류 발생: {str(e)}"
-            self.weather_info.config(text=error_msg)
-            self.status_label.config(text="오류 발생")
+            self._result_queue.put((error_msg, "오류 발생"))
             logger.error(error_msg, exc_info=True)
 
 if __name__ == "__main__":
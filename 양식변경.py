@@ -1,23 +1,85 @@
 import os
+import queue
+import re
 import threading
 import traceback
 from copy import copy
+from functools import lru_cache
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 
 from openpyxl import load_workbook
 from openpyxl.styles import Alignment, PatternFill, Border, Side
+from openpyxl.utils import get_column_letter
 
 
 # =========================
 # Excel Helpers
 # =========================
+# 흔한 숫자 문자열("3", "-2", "1.5")은 정규식으로 바로 판정
+NUM_RE = re.compile(r"-?\d+(?:\.\d+)?")
+# float()가 받아들일 수 있는 그 밖의 표기(공백, 지수, inf/nan 등)는 숫자나 inf/nan이 들어 있을 때만 확인
+NUM_HINT_RE = re.compile(r"\d|inf|nan", re.IGNORECASE)
+
+# 작업 스레드의 로그를 GUI 로그 창에 모아서 옮기는 주기(ms)
+LOG_POLL_MS = 50
+
+# 표 끝을 찾을 때 살펴보는 최대 행(서식만 남은 빈 행 때문에 ws.max_row가 크게 부풀려진 시트 대비)
+MAX_SCAN_ROWS = 2000
+
+# Side/Border는 불변 객체이므로 모듈 전체에서 한 벌만 만들어 공유
+THIN_SIDE = Side(style="thin")
+MEDIUM_SIDE = Side(style="medium")
+NO_SIDE = Side(style=None)
+# 표 테두리(내부 thin + 외곽 medium)를 위치별로 미리 만들어 둔 표: {(위, 아래, 왼쪽, 오른쪽이 외곽인지): Border}
+TABLE_BORDERS = {
+    (top, bottom, left, right): Border(
+        left=MEDIUM_SIDE if left else THIN_SIDE,
+        right=MEDIUM_SIDE if right else THIN_SIDE,
+        top=MEDIUM_SIDE if top else THIN_SIDE,
+        bottom=MEDIUM_SIDE if bottom else THIN_SIDE,
+    )
+    for top in (False, True)
+    for bottom in (False, True)
+    for left in (False, True)
+    for right in (False, True)
+}
+# 가운데 맞춤: 기본 정렬 셀은 이 한 벌을 공유(다른 속성이 있는 셀만 복사해서 수정)
+DEFAULT_ALIGN = Alignment()
+CENTER_ALIGN = Alignment(horizontal="center", vertical="center", wrap_text=True)
+
+
 def norm_text(v) -> str:
     """공백/개행/탭 제거 후 비교용 문자열로 정규화"""
     if v is None:
         return ""
+    if isinstance(v, (str, int, float)):
+        return _norm_text_cached(v)
+    return "".join(str(v).split())
+
+
+@lru_cache(maxsize=4096, typed=True)
+def _norm_text_cached(v) -> str:
+    """norm_text의 캐시 버전(문자열/숫자 셀 값은 병합 셀 검색 등에서 반복되므로)"""
+    return "".join(str(v).split())
+
+
+def is_number_like(v) -> bool:
+    """float(str(v))가 성공하는 값인지(숫자 또는 숫자로 변환 가능한 문자열) 예외 없이 빠르게 판정"""
+    if isinstance(v, bool):
+        return False  # float("True") 는 실패
+    if isinstance(v, (int, float)):
+        return True
     s = str(v)
-    return "".join(s.split())
+    if NUM_RE.fullmatch(s):
+        return True
+    if not NUM_HINT_RE.search(s):
+        return False
+    try:
+        float(s)
+        return True
+    except (ValueError, TypeError):
+        return False
 
 
 def argb_from_rgb(r: int, g: int, b: int) -> str:
@@ -25,54 +87,52 @@ def argb_from_rgb(r: int, g: int, b: int) -> str:
     return f"FF{r:02X}{g:02X}{b:02X}"
 
 
+@lru_cache(maxsize=16)
 def solid_fill_rgb(r: int, g: int, b: int) -> PatternFill:
+    """단색 채우기(색이 몇 가지뿐이므로 색별로 한 벌만 만들어 공유)"""
     c = argb_from_rgb(r, g, b)
     return PatternFill(fill_type="solid", start_color=c, end_color=c)
 
 
 def cell_has_any_border(cell) -> bool:
     b = cell.border
-    return any(
-        getattr(b, side).style is not None
-        for side in ("left", "right", "top", "bottom")
+    return (
+        b.left.style is not None
+        or b.right.style is not None
+        or b.top.style is not None
+        or b.bottom.style is not None
     )
 
 
-def find_last_bordered_row(ws, start_row: int, last_col: int, max_scan: int = 2000) -> int:
+def find_last_bordered_row(ws, start_row: int, last_col: int, max_scan: int = MAX_SCAN_ROWS) -> int:
     """
-    표의 '아래 끝'을: start_row부터 아래로 내려가며
-    A~last_col 범위에서 '어떤 셀이든 테두리가 존재하는' 마지막 행으로 판단.
+    표의 '아래 끝'을: A~last_col 범위에서 '어떤 셀이든 테두리가 존재하는' 마지막 행으로 판단.
+    (아래에서부터 위로 올라가며 처음 만나는 테두리 행을 바로 반환, 없으면 start_row)
     """
     max_r = min(ws.max_row, max_scan)
-    last = start_row
-    for r in range(start_row, max_r + 1):
-        has_border = False
-        for c in range(1, last_col + 1):
-            if cell_has_any_border(ws.cell(r, c)):
-                has_border = True
-                break
-        if has_border:
-            last = r
-    return last
-
-
-def copy_border_with(orig: Border, **changes) -> Border:
+    for r in range(max_r, start_row, -1):
+        row = next(ws.iter_rows(min_row=r, max_row=r, min_col=1, max_col=last_col))
+        if any(cell_has_any_border(c) for c in row):
+            return r
+    return start_row
+
+
+def copy_border_with(orig: Border, *, left=None, right=None, top=None, bottom=None) -> Border:
     """
     Border는 불변 객체이므로, 기존 border를 기반으로 일부 side만 변경.
+    (지정하지 않은(None) side는 기존 값 유지)
     """
-    data = {
-        "left": orig.left,
-        "right": orig.right,
-        "top": orig.top,
-        "bottom": orig.bottom,
-        "diagonal": orig.diagonal,
-        "diagonal_direction": orig.diagonal_direction,
-        "outline": orig.outline,
-        "vertical": orig.vertical,
-        "horizontal": orig.horizontal,
-    }
-    data.update(changes)
-    return Border(**data)
+    return Border(
+        left=orig.left if left is None else left,
+        right=orig.right if right is None else right,
+        top=orig.top if top is None else top,
+        bottom=orig.bottom if bottom is None else bottom,
+        diagonal=orig.diagonal,
+        diagonal_direction=orig.diagonal_direction,
+        outline=orig.outline,
+        vertical=orig.vertical,
+        horizontal=orig.horizontal,
+    )
 
 
 def set_cell_alignment_center(cell):
@@ -81,6 +141,9 @@ def set_cell_alignment_center(cell):
     (세로 텍스트/회전 등의 속성을 가능하면 보존)
     """
     a = cell.alignment
+    if a == DEFAULT_ALIGN:
+        cell.alignment = CENTER_ALIGN
+        return
     na = copy(a)
     na.horizontal = "center"
     na.vertical = "center"
@@ -88,125 +151,115 @@ def set_cell_alignment_center(cell):
     cell.alignment = na
 
 
-def apply_thin_all_borders(ws, min_row, max_row, min_col, max_col):
-    thin = Side(style="thin")
-    thin_all = Border(left=thin, right=thin, top=thin, bottom=thin)
-
-    for r in range(min_row, max_row + 1):
-        for c in range(min_col, max_col + 1):
-            ws.cell(r, c).border = thin_all
-
-
-def apply_outer_medium_border(ws, min_row, max_row, min_col, max_col):
-    medium = Side(style="medium")
-
-    # Top edge
-    for c in range(min_col, max_col + 1):
-        cell = ws.cell(min_row, c)
-        cell.border = copy_border_with(cell.border, top=medium)
-
-    # Bottom edge
-    for c in range(min_col, max_col + 1):
-        cell = ws.cell(max_row, c)
-        cell.border = copy_border_with(cell.border, bottom=medium)
-
-    # Left edge
-    for r in range(min_row, max_row + 1):
-        cell = ws.cell(r, min_col)
-        cell.border = copy_border_with(cell.border, left=medium)
-
-    # Right edge
-    for r in range(min_row, max_row + 1):
-        cell = ws.cell(r, max_col)
-        cell.border = copy_border_with(cell.border, right=medium)
+def apply_table_styles(ws, min_row, max_row, min_col, max_col, yellow_row=None):
+    """
+    표 범위를 한 번만 훑으면서 셀마다 가운데 맞춤 + 테두리를 함께 적용.
+    - 모든 테두리 thin + 바깥쪽 medium
+    - 4행 하단선 medium
+    - 노란색 행(yellow_row)의 위/아래 medium(양 끝은 바깥쪽이라 이미 medium)
+    """
+    for r, row in enumerate(
+        ws.iter_rows(min_row=min_row, max_row=max_row, min_col=min_col, max_col=max_col), min_row
+    ):
+        top = r == min_row or r == yellow_row
+        bottom = r == max_row or r == 4 or r == yellow_row
+        for c, cell in enumerate(row, min_col):
+            set_cell_alignment_center(cell)
+            cell.border = TABLE_BORDERS[(top, bottom, c == min_col, c == max_col)]
 
 
 def apply_row_outer_medium_border(ws, row, min_col, max_col):
     """특정 행(가로 띠)의 바깥 테두리를 medium으로"""
-    medium = Side(style="medium")
-
     # top & bottom for whole row segment
     for c in range(min_col, max_col + 1):
         cell = ws.cell(row, c)
-        cell.border = copy_border_with(cell.border, top=medium, bottom=medium)
+        cell.border = copy_border_with(cell.border, top=MEDIUM_SIDE, bottom=MEDIUM_SIDE)
 
     # left edge at first col
     left_cell = ws.cell(row, min_col)
-    left_cell.border = copy_border_with(left_cell.border, left=medium)
+    left_cell.border = copy_border_with(left_cell.border, left=MEDIUM_SIDE)
 
     # right edge at last col
     right_cell = ws.cell(row, max_col)
-    right_cell.border = copy_border_with(right_cell.border, right=medium)
+    right_cell.border = copy_border_with(right_cell.border, right=MEDIUM_SIDE)
 
 
-def apply_row_bottom_medium(ws, row, min_col, max_col):
-    """특정 행의 '아래쪽' 테두리를 medium으로"""
-    medium = Side(style="medium")
-    for c in range(min_col, max_col + 1):
-        cell = ws.cell(row, c)
-        cell.border = copy_border_with(cell.border, bottom=medium)
+def fill_entire_row(ws, row, min_col, max_col, fill: PatternFill):
+    for cell in next(ws.iter_rows(min_row=row, max_row=row, min_col=min_col, max_col=max_col)):
+        cell.fill = fill
 
 
-def fill_entire_row(ws, row, min_col, max_col, fill: PatternFill):
-    for c in range(min_col, max_col + 1):
-        ws.cell(row, c).fill = fill
+def index_merged_by_col(ws):
+    """
+    병합 범위를 시작 열(min_col)별로 모아 둔다: {열 번호: [(병합 범위, 좌상단 값 norm_text), ...]}
+    (시트의 병합 순서 유지, 좌상단 값은 여기서 한 번만 정규화)
+    """
+    by_col = {}
+    for mr in ws.merged_cells.ranges:
+        v = ws.cell(mr.min_row, mr.min_col).value
+        by_col.setdefault(mr.min_col, []).append((mr, norm_text(v)))
+    return by_col
 
 
-def find_merged_range_for_value_in_col(ws, col: int, target_norm: str):
+def find_merged_range_for_value_in_col(ws, col: int, target_norm: str, merged_by_col=None):
     """
     지정 열(col)에서, 병합된 영역의 좌상단 값이 target_norm과 일치하는 병합 범위를 찾음.
+    merged_by_col: index_merged_by_col 결과(없으면 여기서 만든다)
     """
-    for mr in ws.merged_cells.ranges:
-        if mr.min_col == col:
-            v = ws.cell(mr.min_row, mr.min_col).value
-            if norm_text(v) == target_norm:
-                return mr
+    if merged_by_col is None:
+        merged_by_col = index_merged_by_col(ws)
+    for mr, v_norm in merged_by_col.get(col, ()):
+        if v_norm == target_norm:
+            return mr
     return None
 
 
-def remove_inner_borders_for_selection_groups(ws, start_row, end_row, search_col, check_cols, log):
+def remove_inner_borders_for_selection_groups(ws, start_row, end_row, search_col, check_cols, log, merged_by_col=None):
     """
     특정 열(search_col)에서 '선택군'으로 시작하는 병합 셀을 찾고,
     병합된 첫 행의 check_cols 범위에 숫자가 있으면 
     그 열의 병합 영역 내부 수평 테두리를 제거
+    merged_by_col: index_merged_by_col 결과(없으면 여기서 만든다)
     """
-    no_border = Side(style=None)
+    if merged_by_col is None:
+        merged_by_col = index_merged_by_col(ws)
     found_count = 0
     
-    for mr in ws.merged_cells.ranges:
-        # 해당 열의 병합 셀인지 확인 (min_col과 max_col이 모두 search_col인 경우)
-        if mr.min_col == search_col and mr.max_col == search_col:
-            if mr.min_row >= start_row and mr.min_row <= end_row:
-                # "선택군"으로 시작하는지 확인
-                cell_value = ws.cell(mr.min_row, mr.min_col).value
-                if cell_value and norm_text(str(cell_value)).startswith("선택군"):
-                    found_count += 1
-                    log(f"  - '선택군' 발견: {chr(64+search_col)}{mr.min_row}:{chr(64+search_col)}{mr.max_row}")
-                    
-                    # 병합된 첫 행의 check_cols 범위에서 숫자가 있는 열 찾기
-                    first_row = mr.min_row
-                    cols_with_numbers = []
-                    
-                    for col_idx in check_cols:
-                        cell_val = ws.cell(first_row, col_idx).value
-                        # 숫자인지 확인 (int, float 또는 숫자로 변환 가능한 문자열)
-                        if cell_val is not None:
-                            try:
-                                float(str(cell_val))
-                                cols_with_numbers.append(col_idx)
-                            except (ValueError, TypeError):
-                                pass
-                    
-                    if cols_with_numbers:
-                        log(f"    숫자가 있는 열: {', '.join([chr(64+c) for c in cols_with_numbers])}")
-                        
-                        # 해당 열들의 병합 영역 내부 테두리 제거 (마지막 행 제외)
-                        for col_idx in cols_with_numbers:
-                            for row_idx in range(mr.min_row, mr.max_row):  # max_row는 포함하지 않음
-                                cell = ws.cell(row_idx, col_idx)
-                                cell.border = copy_border_with(cell.border, bottom=no_border)
-                        
-                        log(f"    병합 영역 내부 테두리 제거 완료")
+    # search_col 한 열짜리 병합 셀 중 표 범위(start_row~end_row)에서 시작하고
+    # "선택군"으로 시작하는 것만 미리 추려 둔다(좌상단 값은 색인할 때 이미 정규화됨)
+    group_ranges = [
+        mr for mr, v_norm in merged_by_col.get(search_col, ())
+        if mr.max_col == search_col and start_row <= mr.min_row <= end_row and v_norm.startswith("선택군")
+    ]
+    if not group_ranges:
+        # 선택군이 없는 시트(대부분): check_cols는 읽지도 않고 바로 끝
+        return 0
+
+    col_letter = get_column_letter(search_col)
+    for mr in group_ranges:
+        found_count += 1
+        log(f"  - '선택군' 발견: {col_letter}{mr.min_row}:{col_letter}{mr.max_row}")
+        
+        # 병합된 첫 행의 check_cols 범위에서 숫자가 있는 열 찾기
+        first_row = mr.min_row
+        cols_with_numbers = []
+        
+        for col_idx in check_cols:
+            cell_val = ws.cell(first_row, col_idx).value
+            # 숫자인지 확인 (int, float 또는 숫자로 변환 가능한 문자열)
+            if cell_val is not None and is_number_like(cell_val):
+                cols_with_numbers.append(col_idx)
+        
+        if cols_with_numbers:
+            log(f"    숫자가 있는 열: {', '.join(get_column_letter(c) for c in cols_with_numbers)}")
+            
+            # 해당 열들의 병합 영역 내부 테두리 제거 (마지막 행 제외)
+            for col_idx in cols_with_numbers:
+                for row_idx in range(mr.min_row, mr.max_row):  # max_row는 포함하지 않음
+                    cell = ws.cell(row_idx, col_idx)
+                    cell.border = copy_border_with(cell.border, bottom=NO_SIDE)
+            
+            log(f"    병합 영역 내부 테두리 제거 완료")
     
     if found_count > 0:
         log(f"  - 총 {found_count}개의 '선택군' 병합 셀 처리 완료")
@@ -222,22 +275,25 @@ def get_target_sheets(wb):
     '로 시작' 조건 대신 실제 현장에서 흔한 명명(예: 2026학년도 입학생...)까지 고려하여
     연도/키워드 포함 여부로 매칭. (예시는 '예시' 포함 시 제외)
     """
-    sheetnames = wb.sheetnames
-
-    def pick(year: str, keyword: str, exclude_example=True):
-        out = []
-        for n in sheetnames:
-            if exclude_example and ("예시" in n):
-                continue
-            if (year in n) and (keyword in n):
-                out.append(n)
-        return out
-
-    # 요구 그룹
-    g_2026_all = pick("2026", "전학년")  # 예시 제외
-    g_2026_ent = pick("2026", "입학생")
-    g_2025_ent = pick("2025", "입학생")
-    g_2024_ent = pick("2024", "입학생")
+    # 요구 그룹(예시 제외): 시트 이름을 한 번씩만 훑으며 해당하는 그룹마다 넣는다
+    g_2026_all, g_2026_ent, g_2025_ent, g_2024_ent = [], [], [], []
+    for n in wb.sheetnames:
+        if "예시" in n:
+            continue
+        has_all = "전학년" in n
+        has_ent = "입학생" in n
+        if not (has_all or has_ent):
+            continue
+        if "2026" in n:
+            if has_all:
+                g_2026_all.append(n)
+            if has_ent:
+                g_2026_ent.append(n)
+        if has_ent:
+            if "2025" in n:
+                g_2025_ent.append(n)
+            if "2024" in n:
+                g_2024_ent.append(n)
 
     return {
         "2026 전학년": g_2026_all,
@@ -253,21 +309,21 @@ def process_one_sheet(ws, last_col: int, sheet_name: str, log):
     - 표 아래 끝은 'A~last_col 영역에서 테두리가 존재하는 마지막 행'으로 판단
     """
     start_row = 3
+    if ws.max_row > MAX_SCAN_ROWS:
+        log(f"  - 시트 사용 범위가 {ws.max_row}행까지 잡혀 있어 {MAX_SCAN_ROWS}행까지만 표 끝을 찾음")
     end_row = find_last_bordered_row(ws, start_row=start_row, last_col=last_col)
 
     min_col = 1
     max_col = last_col
 
-    log(f"  - 표 범위 추정: A{start_row}:{chr(64+max_col)}{end_row}")
+    log(f"  - 표 범위 추정: A{start_row}:{get_column_letter(max_col)}{end_row}")
 
-    # 1) 가운데 맞춤
-    for r in range(start_row, end_row + 1):
-        for c in range(min_col, max_col + 1):
-            set_cell_alignment_center(ws.cell(r, c))
+    # 병합 범위는 시트당 한 번만 훑어서 열별로 색인(아래 병합 셀 검색들이 함께 사용)
+    merged_by_col = index_merged_by_col(ws)
 
-    # 2) '학교지정과목'(개행 포함 가능) 병합셀 종료 다음 행이 '학교 지정 과목 교과~'면 노란색
+    # 1) '학교지정과목'(개행 포함 가능) 병합셀 종료 다음 행이 '학교 지정 과목 교과~'면 노란색
     yellow_row = None
-    mr = find_merged_range_for_value_in_col(ws, col=1, target_norm="학교지정과목")
+    mr = find_merged_range_for_value_in_col(ws, col=1, target_norm="학교지정과목", merged_by_col=merged_by_col)
     if mr:
         candidate_row = mr.max_row + 1
         a_val_norm = norm_text(ws.cell(candidate_row, 1).value)
@@ -280,7 +336,7 @@ def process_one_sheet(ws, last_col: int, sheet_name: str, log):
     else:
         log("  - '학교지정과목' 병합셀을 찾지 못함")
 
-    # 3) A열 표의 가장 아래 셀이 '총계'로 끝나면 색 적용
+    # 2) A열 표의 가장 아래 셀이 '총계'로 끝나면 색 적용
     bottom_a = ws.cell(end_row, 1).value
     if norm_text(bottom_a).endswith("총계"):
         fill_entire_row(ws, end_row, min_col, max_col, solid_fill_rgb(146, 208, 80))      # 총계 행
@@ -294,29 +350,27 @@ def process_one_sheet(ws, last_col: int, sheet_name: str, log):
     else:
         log("  - 표 하단 A열이 '총계'로 끝나지 않아(조건 미충족) 총계 색상 규칙 미적용")
 
-    # 4) 3행부터 표 전체: 모든 테두리 얇게 + 바깥쪽 medium
-    apply_thin_all_borders(ws, start_row, end_row, min_col, max_col)
-    apply_outer_medium_border(ws, start_row, end_row, min_col, max_col)
+    # 3) 3행부터 표 전체를 한 번에: 가운데 맞춤 + 모든 테두리 얇게/바깥쪽 medium
+    #    + 4행 아래부분(= 4행의 하단선) medium + 노란색 행(학교 지정 과목 교과~)의 바깥 테두리 medium
+    apply_table_styles(ws, start_row, end_row, min_col, max_col, yellow_row=yellow_row)
     log("  - 전체 테두리: 내부 thin / 외곽 medium 적용")
-
-    # 5) 4행 아래부분(= 4행의 하단선) medium
     if 4 <= end_row:
-        apply_row_bottom_medium(ws, row=4, min_col=min_col, max_col=max_col)
         log("  - 4행 하단 테두리 medium 적용")
-
-    # 6) 노란색 행(학교 지정 과목 교과~)의 바깥 테두리 medium
     if yellow_row:
-        apply_row_outer_medium_border(ws, row=yellow_row, min_col=min_col, max_col=max_col)
+        if not (start_row <= yellow_row <= end_row):
+            # 표 범위 밖의 행이면 한 번에 적용하는 패스에 포함되지 않으므로 따로 적용
+            apply_row_outer_medium_border(ws, row=yellow_row, min_col=min_col, max_col=max_col)
         log(f"  - 노란색 행 바깥 테두리 medium 적용: {yellow_row}행")
     
-    # 7) 선택군 병합 셀의 내부 테두리 제거
+    # 4) 선택군 병합 셀의 내부 테두리 제거
     if ("2024" in sheet_name) and ("입학생" in sheet_name):
         # 2024 입학생: B열에서 선택군 찾고, H~M열(8~13) 체크
         remove_inner_borders_for_selection_groups(
             ws, start_row, end_row, 
             search_col=2,  # B열
             check_cols=range(8, 14),  # H~M열
-            log=log
+            log=log,
+            merged_by_col=merged_by_col
         )
     else:
         # 2026 전학년, 2026 입학생, 2025 입학생: A열에서 선택군 찾고, G~L열(7~12) 체크
@@ -324,7 +378,8 @@ def process_one_sheet(ws, last_col: int, sheet_name: str, log):
             ws, start_row, end_row,
             search_col=1,  # A열
             check_cols=range(7, 13),  # G~L열
-            log=log
+            log=log,
+            merged_by_col=merged_by_col
         )
 
 
@@ -332,7 +387,10 @@ def adjust_workbook(input_path: str, output_path: str, log):
     ext = os.path.splitext(input_path)[1].lower()
     keep_vba = (ext == ".xlsm")
 
-    wb = load_workbook(input_path, keep_vba=keep_vba)
+    # 불러오기 옵션:
+    # - 수정한 워크북을 다시 저장하므로 data_only=True(수식 → 값으로 바뀜), keep_links=False(외부 링크 유실)는 쓰지 않는다
+    # - VBA는 .xlsm일 때만 읽어 둔다(.xlsx는 매크로 파싱 생략)
+    wb = load_workbook(input_path, data_only=False, keep_vba=keep_vba)
 
     groups = get_target_sheets(wb)
 
@@ -351,6 +409,9 @@ def adjust_workbook(input_path: str, output_path: str, log):
     log("필수 시트 확인 완료. 서식 수정 진행...")
 
     # 2) 서식 수정
+    # 시트별로 나눠 병렬 처리하지 않는다: 셀에 border/fill/alignment를 대입하면 워크북 전체가 공유하는
+    # 스타일 목록(wb._borders 등)에 추가되므로 스레드가 겹치면 스타일 번호가 꼬일 수 있고,
+    # 순수 파이썬 작업이라 GIL 때문에 빨라지지도 않는다. 로그도 시트 순서대로 남는다.
     processed = 0
     for label, names in groups.items():
         for sn in names:
@@ -361,7 +422,7 @@ def adjust_workbook(input_path: str, output_path: str, log):
             else:
                 last_col = 15  # A~O
 
-            log(f"[시트] {sn} (범위 A~{chr(64+last_col)})")
+            log(f"[시트] {sn} (범위 A~{get_column_letter(last_col)})")
             process_one_sheet(ws, last_col=last_col, sheet_name=sn, log=log)
             processed += 1
 
@@ -390,8 +451,12 @@ class App:
 
         self.root.configure(bg=self.colors["bg"])
 
+        # 작업 스레드는 로그를 큐에만 넣고, GUI 스레드가 주기적으로 한꺼번에 출력
+        self._log_q = queue.Queue()
+
         self._build_style()
         self._build_ui()
+        self.root.after(LOG_POLL_MS, self._drain_log)
 
         self.file_path = None
         self.running = False
@@ -465,10 +530,30 @@ class App:
         self._log("프로그램이 준비되었습니다.\n- '파일 선택' 후 '양식 조정 실행'을 누르세요.\n")
 
     def _log(self, msg: str):
-        def _append():
-            self.log_text.insert("end", msg + ("\n" if not msg.endswith("\n") else ""))
+        # 어느 스레드에서든 호출 가능(Tk 호출 없음)
+        self._log_q.put(msg + ("\n" if not msg.endswith("\n") else ""))
+
+    def _drain_log(self):
+        """쌓인 로그를 출력하고 다음 주기를 예약"""
+        self._flush_log()
+        self.root.after(LOG_POLL_MS, self._drain_log)
+
+    def _flush_log(self):
+        """쌓인 로그를 한 번의 insert/see로 출력(GUI 스레드에서만 호출)"""
+        parts = []
+        try:
+            while True:
+                parts.append(self._log_q.get_nowait())
+        except queue.Empty:
+            pass
+        if parts:
+            self.log_text.insert("end", "".join(parts))
             self.log_text.see("end")
-        self.root.after(0, _append)
+
+    def _notify(self, show, title, message):
+        """남은 로그를 먼저 출력한 뒤 메시지 창 표시(로그보다 창이 먼저 뜨지 않도록)"""
+        self._flush_log()
+        show(title, message)
 
     def pick_file(self):
         fp = filedialog.askopenfilename(
@@ -515,18 +600,18 @@ class App:
     def _worker(self, input_path, output_path):
         try:
             adjust_workbook(input_path, output_path, log=self._log)
-            self.root.after(0, lambda: messagebox.showinfo("완료", "양식 조정이 완료되었습니다."))
+            self.root.after(0, self._notify, messagebox.showinfo, "완료", "양식 조정이 완료되었습니다.")
             self.status_var.set("완료")
         except ValueError as ve:
             # 필수 시트 누락 등: 요구사항대로 메시지 출력 후 종료
             self._log(f"[중단] {ve}")
             self.status_var.set("중단(필수 조건 미충족)")
-            self.root.after(0, lambda: messagebox.showwarning("중단", "필수 시트가 없어 작업을 중단했습니다.\n로그를 확인하세요."))
+            self.root.after(0, self._notify, messagebox.showwarning, "중단", "필수 시트가 없어 작업을 중단했습니다.\n로그를 확인하세요.")
         except Exception:
             self._log("[오류] 예기치 못한 오류가 발생했습니다.")
             self._log(traceback.format_exc())
             self.status_var.set("오류")
-            self.root.after(0, lambda: messagebox.showerror("오류", "오류가 발생했습니다.\n로그를 확인하세요."))
+            self.root.after(0, self._notify, messagebox.showerror, "오류", "오류가 발생했습니다.\n로그를 확인하세요.")
         finally:
             def _end():
                 self.running = False